@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Bulk backfill of historical bots from Bybit.
+
+Walks every page of each status filter of each configured account and loads
+the bots with Postgres COPY (batched INSERTs on SQLite). Progress is
+checkpointed per account and status filter in backfill_checkpoints, so a run
+that failed resumes at the page it stopped at; finished walks are skipped
+unless --restart is given. Reports the rows loaded per second.
+
+Closed bots are left for the next archive pass to move to bots_archive. On
+Postgres, running app processes are told about each loaded page.
+
+Examples:
+    python scripts/backfill.py
+    python scripts/backfill.py --account sub-1 --status 0 --status 2
+    python scripts/backfill.py --restart --json > backfill_report.json
+"""
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.backend.config import Settings  # noqa: E402
+from src.backend.database import ensure_schema, get_engine, get_session_maker  # noqa: E402
+from src.backend.deps import get_settings, init_db_from_settings  # noqa: E402
+from src.backend.logger import setup_basic_logging  # noqa: E402
+from src.backend.services.backfill import BackfillReport, backfill_accounts  # noqa: E402
+from src.backend.services.bybit_service import close_account_clients  # noqa: E402
+from src.backend.services.data_notify import PgNotifyPublisher  # noqa: E402
+from src.backend.services.data_version import set_change_publisher  # noqa: E402
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--account", action="append", dest="accounts",
+                        help="Account ID to backfill (repeatable, default: every configured account)")
+    parser.add_argument("--status", action="append", type=int, dest="statuses",
+                        help="Bybit status filter to walk (repeatable, default: BACKFILL_STATUSES)")
+    parser.add_argument("--limit", type=int, help="Bots per page (default: BACKFILL_PAGE_LIMIT)")
+    parser.add_argument("--batch-size", type=int, help="Rows per INSERT without COPY (default: BACKFILL_BATCH_SIZE)")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoints and walk from the first page")
+    parser.add_argument("--json", action="store_true", help="Print the reports as JSON")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace, settings: Settings) -> List[BackfillReport]:
+    accounts = settings.bybit_accounts()
+    if args.accounts:
+        accounts = [account for account in accounts if account.account_id in args.accounts]
+        unknown = set(args.accounts) - {account.account_id for account in accounts}
+        if unknown:
+            raise SystemExit(f"Unknown account(s): {', '.join(sorted(unknown))}")
+    db = get_session_maker()()
+    try:
+        return await backfill_accounts(
+            db,
+            accounts,
+            statuses=args.statuses or settings.BACKFILL_STATUSES,
+            limit=args.limit or settings.BACKFILL_PAGE_LIMIT,
+            batch_size=args.batch_size or settings.BACKFILL_BATCH_SIZE,
+            restart=args.restart,
+            lock_ttl=settings.SYNC_LOCK_TTL_SECONDS
+        )
+    finally:
+        db.close()
+        await close_account_clients()
+
+
+def print_reports(reports: List[BackfillReport]) -> None:
+    print(f"{'account':<16} {'status':>6} {'result':<16} {'from page':>9} {'pages':>6} {'rows':>8} "
+          f"{'seconds':>8} {'rows/s':>8}")
+    for report in reports:
+        print(f"{report.account_id:<16} {report.status_filter:>6} {report.status:<16} "
+              f"{report.resumed_from_page:>9} {report.pages_loaded:>6} {report.rows_loaded:>8} "
+              f"{report.seconds:>8.1f} {report.rows_per_second:>8.0f}")
+        if report.error:
+            print(f"  error: {report.error}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    settings = get_settings()
+    setup_basic_logging(settings.DEBUG, json_format=settings.LOG_JSON)
+    init_db_from_settings(settings)
+    ensure_schema(get_engine(), auto_migrate=settings.DB_AUTO_MIGRATE)
+    if settings.DATA_CHANGE_NOTIFY_ENABLED and get_engine().dialect.name == "postgresql":
+        set_change_publisher(PgNotifyPublisher(get_engine(), settings.DATA_CHANGE_CHANNEL))
+
+    reports = asyncio.run(run(args, settings))
+    if args.json:
+        json.dump([{**asdict(report), "rows_per_second": report.rows_per_second} for report in reports],
+                  sys.stdout, indent=2)
+        print()
+    else:
+        print_reports(reports)
+    return 1 if any(report.status == "failed" for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+"""
+Load generator for the Trading Bot Manager backend.
+
+Drives a weighted mix of dashboard reads (GET /bots/), probes (GET /health/)
+and sync triggers (POST /bots/update) against a running backend, either as a
+closed loop at a fixed concurrency or as an open loop at a target request
+rate, and reports throughput, latency percentiles and error rates per route.
+
+Examples:
+    python scripts/load_test.py --concurrency 50 --duration 60
+    python scripts/load_test.py --rps 200 --mix bots=90,health=9,update=1
+    python scripts/load_test.py --rps 100 --json > load_report.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+ROUTES = {
+    "bots": ("GET", "/bots/"),
+    "health": ("GET", "/health/"),
+    "update": ("POST", "/bots/update"),
+}
+DEFAULT_MIX = "bots=80,health=15,update=5"
+
+
+@dataclass
+class RouteStats:
+    method: str
+    path: str
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms)
+
+    def record(self, latency_ms: float, status_code: Optional[int]) -> None:
+        self.latencies_ms.append(latency_ms)
+        if status_code is None or status_code >= 400:
+            self.errors += 1
+        key = status_code if status_code is not None else 0
+        self.status_codes[key] = self.status_codes.get(key, 0) + 1
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse a 'route=weight,...' mix specification."""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ROUTES:
+            raise argparse.ArgumentTypeError(
+                f"Unknown route '{name}', expected one of: {', '.join(ROUTES)}"
+            )
+        try:
+            weights[name] = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid weight '{weight}' for route '{name}'")
+        if weights[name] < 0:
+            raise argparse.ArgumentTypeError(f"Weight of route '{name}' must not be negative")
+    if not any(weights.values()):
+        raise argparse.ArgumentTypeError("Route mix must have at least one positive weight")
+    return weights
+
+
+class LoadTest:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.mix = parse_mix(args.mix)
+        self.route_names = list(self.mix)
+        self.route_weights = [self.mix[name] for name in self.route_names]
+        self.stats = {name: RouteStats(*ROUTES[name]) for name in self.route_names}
+        self._deadline = 0.0
+
+    def _pick_route(self) -> str:
+        return random.choices(self.route_names, weights=self.route_weights)[0]
+
+    async def _issue(self, client: httpx.AsyncClient, name: str, scheduled_at: Optional[float] = None) -> None:
+        """
+        Send one request and record its latency, measured from scheduled_at
+        (its slot on the open-loop timetable) when given, else from now.
+        """
+        method, path = ROUTES[name]
+        started = time.perf_counter() if scheduled_at is None else scheduled_at
+        status_code = None
+        try:
+            response = await client.request(method, path)
+            status_code = response.status_code
+        except httpx.HTTPError:
+            pass
+        self.stats[name].record((time.perf_counter() - started) * 1000, status_code)
+
+    async def _closed_loop_worker(self, client: httpx.AsyncClient) -> None:
+        while time.perf_counter() < self._deadline:
+            await self._issue(client, self._pick_route())
+
+    async def _run_closed_loop(self, client: httpx.AsyncClient) -> None:
+        await asyncio.gather(*(
+            self._closed_loop_worker(client) for _ in range(self.args.concurrency)
+        ))
+
+    async def _run_open_loop(self, client: httpx.AsyncClient) -> None:
+        # Requests are scheduled on a fixed timetable regardless of how long earlier
+        # ones take, so server slowdowns show up as latency instead of lower load.
+        # Latency counts from the scheduled send time, including any wait for an
+        # in-flight slot, so queueing is not omitted from the percentiles.
+        interval = 1.0 / self.args.rps
+        in_flight = asyncio.Semaphore(self.args.concurrency)
+        tasks = set()
+        next_at = time.perf_counter()
+
+        async def issue_bounded(name: str, scheduled_at: float) -> None:
+            async with in_flight:
+                await self._issue(client, name, scheduled_at)
+
+        while next_at < self._deadline:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(issue_bounded(self._pick_route(), next_at))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            next_at += interval
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def run(self) -> float:
+        limits = httpx.Limits(
+            max_connections=self.args.concurrency,
+            max_keepalive_connections=self.args.concurrency
+        )
+        async with httpx.AsyncClient(
+                base_url=self.args.base_url,
+                timeout=self.args.timeout,
+                limits=limits
+        ) as client:
+            started = time.perf_counter()
+            self._deadline = started + self.args.duration
+            if self.args.rps:
+                await self._run_open_loop(client)
+            else:
+                await self._run_closed_loop(client)
+            return time.perf_counter() - started
+
+    def report(self, elapsed: float) -> Dict:
+        routes = {}
+        all_latencies: List[float] = []
+        total_errors = 0
+        for name, stats in self.stats.items():
+            latencies = sorted(stats.latencies_ms)
+            all_latencies.extend(latencies)
+            total_errors += stats.errors
+            routes[name] = _summarize(f"{stats.method} {stats.path}", latencies, stats.errors, elapsed)
+            routes[name]["status_codes"] = stats.status_codes
+        all_latencies.sort()
+        return {
+            "base_url": self.args.base_url,
+            "mode": f"open loop @ {self.args.rps} rps" if self.args.rps
+            else f"closed loop @ {self.args.concurrency} workers",
+            "duration_s": round(elapsed, 2),
+            "routes": routes,
+            "total": _summarize("total", all_latencies, total_errors, elapsed),
+        }
+
+
+def _summarize(label: str, sorted_latencies: List[float], errors: int, elapsed: float) -> Dict:
+    count = len(sorted_latencies)
+    return {
+        "route": label,
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "throughput_rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(sorted_latencies, 50), 2),
+        "p95_ms": round(percentile(sorted_latencies, 95), 2),
+        "p99_ms": round(percentile(sorted_latencies, 99), 2),
+    }
+
+
+def print_report(report: Dict) -> None:
+    print(f"Target: {report['base_url']}  Mode: {report['mode']}  Duration: {report['duration_s']}s")
+    header = f"{'route':<20}{'reqs':>8}{'rps':>10}{'err %':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for row in list(report["routes"].values()) + [report["total"]]:
+        print(
+            f"{row['route']:<20}{row['requests']:>8}{row['throughput_rps']:>10.2f}"
+            f"{row['error_rate'] * 100:>8.2f}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the Trading Bot Manager backend")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Backend base URL")
+    parser.add_argument("--duration", type=float, default=30.0, help="Test duration in seconds")
+    parser.add_argument("--concurrency", type=int, default=10,
+                        help="Closed-loop workers, or max in-flight requests when --rps is set")
+    parser.add_argument("--rps", type=float, default=None,
+                        help="Target request rate (open loop). Omit to run a closed loop")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help=f"Weighted route mix, e.g. '{DEFAULT_MIX}'")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+    try:
+        parse_mix(args.mix)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.rps is not None and args.rps <= 0:
+        parser.error("--rps must be positive")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    load_test = LoadTest(args)
+    elapsed = asyncio.run(load_test.run())
+    report = load_test.report(elapsed)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
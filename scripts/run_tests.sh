@@ -11,7 +11,7 @@ cleanup() {
 trap cleanup SIGINT SIGTERM
 
 echo "=== Running Unit Tests (SQLite) ==="
-poetry run pytest tests/ -v -m "not integration"
+poetry run pytest tests/ -v -n auto -m "not integration"
 
 echo -e "\n=== Preparing for Integration Tests ==="
 echo "Starting test PostgreSQL container..."
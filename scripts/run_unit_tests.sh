@@ -1,3 +1,3 @@
 #!/bin/bash
 export PYTHONPATH=$(pwd)
-poetry run pytest tests/ -v
\ No newline at end of file
+poetry run pytest tests/ -v -n auto
\ No newline at end of file
@@ -1,7 +1,43 @@
-import os
+from typing import Dict, List, Literal, Optional
 
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+DEFAULT_ACCOUNT_ID = "default"
+
+
+class BybitAccount(BaseModel):
+    """Credentials of one Bybit (sub-)account whose bots are tracked"""
+    account_id: str
+    secure_token: str
+    device_id: str
+
+
+class AlertRule(BaseModel):
+    """
+    Condition checked against bots whose inputs changed in a sync.
+    threshold is a percentage: PnL % for pnl_below, distance of the price
+    to liq_price for near_liquidation; unused by out_of_range and stopped.
+    """
+    name: str
+    kind: Literal["pnl_below", "near_liquidation", "out_of_range", "stopped"]
+    threshold: Optional[float] = None
+    symbols: List[str] = []  # empty = every symbol
+
+
+class PollTier(BaseModel):
+    """
+    Bots the sync scheduler fetches together, selected by Bybit's status
+    filter. Its interval moves between min_interval and max_interval with the
+    share of fetched bots that changed: running bots are polled often, idle
+    ones rarely.
+    """
+    name: str
+    status: int  # status filter of list-all-bots; 0 = every live bot (also closes vanished ones)
+    min_interval: float = 30.0  # seconds
+    max_interval: float = 600.0  # seconds
+    once: bool = False  # fetch a single time after startup, for bots that never change
+
 
 class Settings(BaseSettings):
     """
@@ -13,8 +49,83 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     API_KEY: str
     API_SECRET: str
-    BYBIT_SECURE_TOKEN: str
-    BYBIT_DEVICE_ID: str
+    # Single-account credentials, tracked as account "default"
+    BYBIT_SECURE_TOKEN: Optional[str] = None
+    BYBIT_DEVICE_ID: Optional[str] = None
+    # Additional accounts as a JSON list of {"account_id", "secure_token", "device_id"}
+    BYBIT_ACCOUNTS: List[BybitAccount] = []
+
+    # Sync
+    SYNC_MAX_CONCURRENCY: int = 4  # accounts fetched from Bybit in parallel
+    BYBIT_MAX_CONNECTIONS_PER_ACCOUNT: int = 4
+    SYNC_LOCK_WAIT_SECONDS: float = 0.0  # 0 = skip accounts another replica is syncing
+    SYNC_LOCK_TTL_SECONDS: float = 600.0  # lease lifetime of the non-Postgres lock fallback
+    SYNC_JOB_QUEUE_SIZE: int = 100  # queued update jobs before POST /bots/update returns 503
+    SYNC_JOB_RETENTION_DAYS: float = 30.0  # finished jobs kept for auditing
+    SYNC_REQUEST_TIMEOUT_SECONDS: float = 120.0  # deadline of an update, from its request; callers may shorten it
+    # Adaptive polling: the app queues syncs itself, one tier of bots at a time
+    SYNC_POLL_ENABLED: bool = False
+    SYNC_POLL_TIERS: List[PollTier] = [
+        PollTier(name="running", status=1, min_interval=15.0, max_interval=300.0),
+        PollTier(name="all", status=0, min_interval=300.0, max_interval=3600.0),
+    ]
+    SYNC_POLL_SMOOTHING: float = 0.3  # weight of the latest sync in a tier's change rate
+    SYNC_POLL_MAX_PAGES: int = 20  # pages fetched per account and poll while pages come back full
+    # Bulk backfill of historical bots (scripts/backfill.py)
+    BACKFILL_STATUSES: List[int] = [2]  # status filters walked page by page; 2 = closed bots, 0 = live bots only
+    BACKFILL_PAGE_LIMIT: int = 150  # bots requested per page
+    BACKFILL_BATCH_SIZE: int = 500  # rows per INSERT on databases without COPY
+    # Archive: closed bots move from bots to bots_archive after each update
+    ARCHIVE_ENABLED: bool = True
+    ARCHIVE_BATCH_SIZE: int = 500  # rows moved per transaction
+    ARCHIVE_MIN_AGE_SECONDS: float = 86400.0  # keep closed bots live this long after their last sync
+
+    # In-process cache of the live bots, reloaded when a sync commits
+    BOT_CACHE_ENABLED: bool = True
+    BOT_CACHE_TTL_SECONDS: float = 60.0  # bounds staleness from other processes when a NOTIFY is missed or unavailable
+    BOT_BATCH_MAX_IDS: int = 200  # grid_ids accepted by GET /bots/batch
+    # Postgres only: NOTIFY other workers/replicas of committed changes so their caches reload
+    DATA_CHANGE_NOTIFY_ENABLED: bool = True
+    DATA_CHANGE_CHANNEL: str = "bot_data_changed"
+
+    # Metric history sampled on each sync, feeding GET /bots/analytics
+    METRIC_HISTORY_RETENTION_DAYS: float = 30.0
+
+    # Alerts evaluated on the bots each sync changed
+    ALERT_RULES: List[AlertRule] = []
+    ALERT_DEBOUNCE_SECONDS: float = 900.0  # a rule re-fires for a bot at most this often
+    ALERT_WEBHOOK_URL: Optional[str] = None  # POSTed {"alerts": [...]} in addition to the log
+    ALERT_WEBHOOK_TIMEOUT: float = 5.0  # seconds
+
+    # Live prices: Bybit public ticker stream for the symbols of running bots
+    PRICE_STREAM_ENABLED: bool = False
+    PRICE_STREAM_URL: str = "wss://stream.bybit.com/v5/public/linear"
+    PRICE_FLUSH_INTERVAL: float = 5.0  # seconds between batched price writes
+    PRICE_SYMBOL_REFRESH_INTERVAL: float = 60.0  # seconds between re-reading the running symbols
+
+    # Database
+    DB_AUTO_MIGRATE: bool = True  # upgrade the schema at startup when it is behind
+    DB_ECHO: bool = False  # log every SQL statement
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: float = 30.0  # seconds
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    # Read-only endpoints use this database (a replica, or the primary again for an isolated pool)
+    DATABASE_READ_URL: Optional[str] = None
+    DB_READ_POOL_SIZE: int = 10
+    DB_READ_MAX_OVERFLOW: int = 20
+    DB_READ_STATEMENT_TIMEOUT_MS: Optional[int] = None
+
+    # Health checks
+    HEALTH_DB_TIMEOUT: float = 2.0  # seconds
+    HEALTH_BYBIT_TIMEOUT: float = 5.0  # seconds
+    HEALTH_BYBIT_CACHE_TTL: float = 30.0  # seconds a Bybit status result is reused
+
+    # Logging
+    LOG_JSON: bool = False
+    LOG_FILE: Optional[str] = None
+    LOG_SAMPLING: Dict[str, float] = {}  # logger name -> fraction of DEBUG records kept
 
     model_config = SettingsConfigDict(
         env_file='.env',
@@ -24,8 +135,13 @@ class Settings(BaseSettings):
         env_nested_delimiter='__'
     )
 
-    def __init__(self, **kwargs):
-        print("Current working directory:", os.getcwd())  # Debug line
-        print("Environment variables:", dict(os.environ))  # Debug line
-        super().__init__(**kwargs)
-        print(f"Database URL: {self.DATABASE_URL}")  # Debug line
+    def bybit_accounts(self) -> List[BybitAccount]:
+        """All configured accounts, including the single-account credentials if set"""
+        accounts = list(self.BYBIT_ACCOUNTS)
+        if self.BYBIT_SECURE_TOKEN and self.BYBIT_DEVICE_ID:
+            accounts.insert(0, BybitAccount(
+                account_id=DEFAULT_ACCOUNT_ID,
+                secure_token=self.BYBIT_SECURE_TOKEN,
+                device_id=self.BYBIT_DEVICE_ID
+            ))
+        return accounts
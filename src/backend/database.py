@@ -1,19 +1,42 @@
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
-from sqlalchemy import create_engine, text
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 logger = logging.getLogger(__name__)
 
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+
 class Base(DeclarativeBase):
     """Base class for all database models"""
     pass
 
 
+@dataclass
+class PoolConfig:
+    """Connection pool tuning for one engine"""
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_recycle: int = 1800  # seconds
+    pool_timeout: float = 30.0  # seconds to wait for a free connection
+    statement_timeout_ms: Optional[int] = None  # Postgres only
+
+
 # Initialize these as None
 _engine = None
 _session_maker = None
+# Engine for read-only traffic; None means reads share the primary engine
+_read_engine = None
+_read_session_maker = None
 
 
 def get_session_maker() -> Optional[sessionmaker]:
@@ -21,21 +44,67 @@ def get_session_maker() -> Optional[sessionmaker]:
     global _session_maker
     return _session_maker
 
-def init_db(database_url: str) -> None:
-    """Initialize database connection"""
-    global _engine, _session_maker
+
+def get_read_session_maker() -> Optional[sessionmaker]:
+    """Get the session maker for read-only queries, falling back to the primary"""
+    return _read_session_maker or _session_maker
+
+
+def get_engine() -> Optional[Engine]:
+    """Get the current engine"""
+    return _engine
+
+
+def get_read_engine() -> Optional[Engine]:
+    """Get the engine serving read-only queries"""
+    return _read_engine or _engine
+
+
+def build_engine_options(database_url: str, pool: PoolConfig, echo: bool = False) -> Dict[str, Any]:
+    """Translate a PoolConfig into create_engine keyword arguments for the given backend"""
+    options: Dict[str, Any] = {"pool_pre_ping": True, "echo": echo}
+    if database_url.startswith("sqlite"):
+        # SQLite picks its own pool class; sizing options do not apply
+        return options
+    options.update(
+        pool_size=pool.pool_size,
+        max_overflow=pool.max_overflow,
+        pool_recycle=pool.pool_recycle,
+        pool_timeout=pool.pool_timeout,
+    )
+    if pool.statement_timeout_ms and database_url.startswith("postgresql"):
+        options["connect_args"] = {"options": f"-c statement_timeout={pool.statement_timeout_ms}"}
+    return options
+
+
+def init_db(
+        database_url: str,
+        read_database_url: Optional[str] = None,
+        pool: Optional[PoolConfig] = None,
+        read_pool: Optional[PoolConfig] = None,
+        echo: bool = False
+) -> None:
+    """
+    Initialize database connection.
+    Only builds the engines and session makers; connections are opened lazily
+    and the schema is managed by migrations (see ensure_schema).
+    Args:
+        database_url: Primary database, used for writes
+        read_database_url: Optional replica (or the primary again, for an isolated
+            read pool) used by read-only endpoints
+        pool: Pool tuning for the primary engine
+        read_pool: Pool tuning for the read engine
+        echo: Log every SQL statement
+    """
+    global _engine, _session_maker, _read_engine, _read_session_maker
 
     if _session_maker is not None:
         return
 
-    logger.info(f"Initializing database connection with URL: {database_url}")
+    logger.info("Initializing database engine%s", " with read pool" if read_database_url else "")
 
     try:
-        _engine = create_engine(
-            database_url,
-            pool_pre_ping=True,
-            echo=True
-        )
+        _engine = create_engine(database_url, **build_engine_options(database_url, pool or PoolConfig(), echo))
 
         _session_maker = sessionmaker(
             autocommit=False,
@@ -43,16 +112,80 @@ def init_db(database_url: str) -> None:
             bind=_engine
         )
 
-        with _session_maker() as session:
-            session.execute(text("SELECT 1"))
-            logger.info("Database connection test successful")
-
-        # Create all tables
-        Base.metadata.create_all(bind=_engine)
-        logger.info("Database tables created successfully")
+        if read_database_url:
+            _read_engine = create_engine(
+                read_database_url,
+                **build_engine_options(read_database_url, read_pool or PoolConfig(), echo)
+            )
+            _read_session_maker = sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                bind=_read_engine
+            )
 
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         _engine = None
         _session_maker = None
+        _read_engine = None
+        _read_session_maker = None
         raise
+
+
+def dispose_db() -> None:
+    """Close pooled connections; the engines stay usable and reconnect lazily"""
+    for engine in (_engine, _read_engine):
+        if engine is not None:
+            engine.dispose()
+
+
+def get_alembic_config() -> Config:
+    """Alembic configuration pointing at the packaged migration scripts"""
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return config
+
+
+def get_schema_revisions(engine: Engine) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return (current, head) schema revisions.
+    Reading the current revision is a single query against alembic_version.
+    """
+    head = ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+    with engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+    return current, head
+
+
+def upgrade_schema(engine: Engine, revision: str = "head") -> None:
+    """Run migrations up to revision on the given engine"""
+    config = get_alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+
+def downgrade_schema(engine: Engine, revision: str = "base") -> None:
+    """Revert migrations down to revision on the given engine"""
+    config = get_alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.downgrade(config, revision)
+
+
+def ensure_schema(engine: Engine, auto_migrate: bool = True) -> None:
+    """
+    Check the schema revision and migrate if it is behind.
+    Raises:
+        RuntimeError: If the schema is behind and auto_migrate is disabled
+    """
+    current, head = get_schema_revisions(engine)
+    if current == head:
+        logger.info("Database schema is up to date (revision %s)", current)
+        return
+    if not auto_migrate:
+        raise RuntimeError(
+            f"Database schema is at revision {current}, expected {head}. Run 'alembic upgrade head'."
+        )
+    logger.info("Migrating database schema from revision %s to %s", current, head)
+    upgrade_schema(engine)
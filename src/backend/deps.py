@@ -4,7 +4,7 @@ from typing import Generator
 from sqlalchemy.orm import Session
 
 from .config import Settings
-from .database import init_db, get_session_maker
+from .database import PoolConfig, get_read_session_maker, get_session_maker, init_db
 from .logger import logger
 
 
@@ -14,21 +14,56 @@ def get_settings() -> Settings:
     return Settings()
 
 
+def init_db_from_settings(settings: Settings) -> None:
+    """Initialize the primary and read engines with the pool tuning from settings"""
+    init_db(
+        settings.DATABASE_URL,
+        read_database_url=settings.DATABASE_READ_URL,
+        pool=PoolConfig(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS
+        ),
+        read_pool=PoolConfig(
+            pool_size=settings.DB_READ_POOL_SIZE,
+            max_overflow=settings.DB_READ_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            statement_timeout_ms=settings.DB_READ_STATEMENT_TIMEOUT_MS
+        ),
+        echo=settings.DB_ECHO
+    )
+
+
 def get_db() -> Generator[Session, None, None]:
-    """Database dependency"""
-    settings = get_settings()
+    """
+    Database dependency.
+    The engine is initialized once at application startup, so this only opens a session.
+    """
+    session_maker = get_session_maker()
+    if session_maker is None:
+        logger.error("Database session requested before init_db was called")
+        raise RuntimeError("Database session maker not initialized")
+    db = session_maker()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Database dependency for read-only endpoints.
+    Uses the read pool (replica) when one is configured, otherwise the primary.
+    """
+    session_maker = get_read_session_maker()
+    if session_maker is None:
+        logger.error("Database session requested before init_db was called")
+        raise RuntimeError("Database session maker not initialized")
+    db = session_maker()
     try:
-        # Initialize database if needed
-        init_db(settings.DATABASE_URL)
-        # Get session maker
-        session_maker = get_session_maker()
-        if session_maker is None:
-            raise RuntimeError("Database session maker not initialized")
-        db = session_maker()
-        try:
-            yield db
-        finally:
-            db.close()
-    except Exception as e:
-        logger.error(f"Database session error: {e}")
-        raise RuntimeError(f"Database session error: {e}")
+        yield db
+    finally:
+        db.close()
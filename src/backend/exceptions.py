@@ -15,3 +15,24 @@ class DatabaseError(AppException):
 class BybitAPIError(AppException):
     """Bybit API related errors"""
     pass
+
+
+class SyncInProgressError(AppException):
+    """Another process holds the sync lock"""
+
+    def __init__(self, message: str = "Sync already in progress"):
+        super().__init__(message, status_code=409)
+
+
+class SyncDeadlineExceededError(AppException):
+    """A sync did not finish before the caller's deadline"""
+
+    def __init__(self, message: str = "Sync did not finish before the deadline"):
+        super().__init__(message, status_code=504)
+
+
+class SyncQueueFullError(AppException):
+    """Too many sync jobs are waiting to run"""
+
+    def __init__(self, message: str = "Too many sync jobs queued"):
+        super().__init__(message, status_code=503)
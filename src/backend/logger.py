@@ -1,11 +1,26 @@
 import logging
+from typing import Dict, Optional
+
+from src.utils.logging_config import setup_logging, stop_listener
 
 logger = logging.getLogger(__name__)
 
 
-def setup_basic_logging(debug_mode: bool) -> None:
-    """Set up basic logging configuration"""
-    logging.basicConfig(
-        level=logging.DEBUG if debug_mode else logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+def setup_basic_logging(
+        debug_mode: bool,
+        json_format: bool = False,
+        filename: Optional[str] = None,
+        sampling: Optional[Dict[str, float]] = None
+) -> None:
+    """Set up non-blocking application logging through the shared logging pipeline"""
+    setup_logging(
+        level="DEBUG" if debug_mode else "INFO",
+        filename=filename,
+        json_format=json_format,
+        sampling=sampling
     )
+
+
+def shutdown_logging() -> None:
+    """Flush pending log records and stop the background listener"""
+    stop_listener()
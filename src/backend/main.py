@@ -1,30 +1,96 @@
 import logging
-from contextlib import asynccontextmanager
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict
 
 from fastapi import FastAPI
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from sqlalchemy import engine
 
-from .database import init_db
-from .deps import get_settings
+from .database import dispose_db, ensure_schema, get_engine, get_session_maker
+from .deps import get_settings, init_db_from_settings
 from .exceptions import AppException
-from .logger import setup_basic_logging
-from .routers import bot, debug, health
+from .logger import setup_basic_logging, shutdown_logging
+from .routers import bot, debug, health, sync_jobs
+from .services.alert_service import configure_alerts, stop_alert_delivery
+from .services.bot_cache import get_bot_cache
+from .services.bybit_service import close_account_clients
+from .services.data_notify import start_data_change_notifications, stop_data_change_notifications
+from .services.risk_service import get_risk_engine
+from .services.price_stream import PriceStreamer, start_price_stream, stop_price_stream
+from .services.sync_jobs import SyncJobWorker, start_sync_worker, stop_sync_worker
+from .services.sync_scheduler import SyncScheduler, start_sync_scheduler, stop_sync_scheduler
+from src.utils.logging_config import request_id_var
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], phase: str):
+    """Record how long a startup phase took, in milliseconds"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = round((time.perf_counter() - started) * 1000, 2)
 
 
 @asynccontextmanager
 async def lifespan(application: FastAPI):
     """Handle startup and shutdown"""
-    settings = get_settings()
-    init_db(settings.DATABASE_URL)  # Ensure this line is present
-    setup_basic_logging(settings.DEBUG)
-    logging.info("Application starting up")
+    startup_started = time.perf_counter()
+    timings: Dict[str, float] = {}
+    with _timed(timings, "settings"):
+        settings = get_settings()
+    with _timed(timings, "logging"):
+        setup_basic_logging(
+            settings.DEBUG,
+            json_format=settings.LOG_JSON,
+            filename=settings.LOG_FILE,
+            sampling=settings.LOG_SAMPLING
+        )
+    with _timed(timings, "database"):
+        init_db_from_settings(settings)
+    with _timed(timings, "schema"):
+        ensure_schema(get_engine(), auto_migrate=settings.DB_AUTO_MIGRATE)
+    if settings.DATA_CHANGE_NOTIFY_ENABLED:
+        with _timed(timings, "data_change_notify"):
+            start_data_change_notifications(get_engine(), settings.DATA_CHANGE_CHANNEL)
+    get_risk_engine().ttl = settings.BOT_CACHE_TTL_SECONDS
+    configure_alerts(settings)
+    if settings.BOT_CACHE_ENABLED:
+        with _timed(timings, "bot_cache"):
+            cache = get_bot_cache()
+            cache.ttl = settings.BOT_CACHE_TTL_SECONDS
+            db = get_session_maker()()
+            try:
+                cache.refresh(db)
+            finally:
+                db.close()
+    if settings.PRICE_STREAM_ENABLED:
+        with _timed(timings, "price_stream"):
+            start_price_stream(PriceStreamer(
+                settings.PRICE_STREAM_URL,
+                get_session_maker(),
+                flush_interval=settings.PRICE_FLUSH_INTERVAL,
+                symbol_refresh_interval=settings.PRICE_SYMBOL_REFRESH_INTERVAL
+            ))
+    worker = start_sync_worker(SyncJobWorker(get_session_maker(), settings, max_queued=settings.SYNC_JOB_QUEUE_SIZE))
+    if settings.SYNC_POLL_ENABLED:
+        start_sync_scheduler(SyncScheduler(worker, settings))
+    timings["total"] = round((time.perf_counter() - startup_started) * 1000, 2)
+    application.state.startup_timings = timings
+    logging.info("Application starting up (startup took %.2f ms: %s)", timings["total"], timings)
     yield
-    if engine is not None:
-        pass  # Add any cleanup code here
+    await stop_sync_scheduler()
+    await stop_sync_worker()
+    await stop_price_stream()
+    await stop_alert_delivery()
+    await stop_data_change_notifications()
+    await close_account_clients()
+    dispose_db()
 
     logging.info("Application shutting down")
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -37,6 +103,20 @@ app = FastAPI(
 app.include_router(bot.router)
 app.include_router(debug.router)
 app.include_router(health.router)
+app.include_router(sync_jobs.router)
+
+
+@app.middleware("http")
+async def request_id_middleware(request: Request, call_next):
+    """Tag every log record emitted while handling the request with its ID"""
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        request_id_var.reset(token)
+    response.headers["X-Request-ID"] = request_id
+    return response
 
 
 @app.exception_handler(AppException)
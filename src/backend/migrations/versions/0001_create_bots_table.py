@@ -0,0 +1,68 @@
+"""create bots table
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases created before migrations were introduced already have the table
+    if sa.inspect(op.get_bind()).has_table('bots'):
+        return
+
+    op.create_table('bots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('grid_id', sa.String(), nullable=False),
+    sa.Column('bot_type', sa.String(), nullable=False),
+    sa.Column('symbol', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('grid_mode', sa.String(), nullable=False),
+    sa.Column('price_token', sa.String(), nullable=False),
+    sa.Column('grid_type', sa.String(), nullable=False),
+    sa.Column('mark_price', sa.Float(), nullable=False),
+    sa.Column('total_investment', sa.Float(), nullable=False),
+    sa.Column('pnl', sa.Float(), nullable=False),
+    sa.Column('pnl_percentage', sa.Float(), nullable=False),
+    sa.Column('leverage', sa.Integer(), nullable=False),
+    sa.Column('min_price', sa.Float(), nullable=False),
+    sa.Column('max_price', sa.Float(), nullable=False),
+    sa.Column('cell_num', sa.Integer(), nullable=False),
+    sa.Column('liq_price', sa.Float(), nullable=False),
+    sa.Column('arbitrage_num', sa.Integer(), nullable=False),
+    sa.Column('total_apr', sa.Float(), nullable=False),
+    sa.Column('entry_price', sa.Float(), nullable=False),
+    sa.Column('current_price', sa.Float(), nullable=False),
+    sa.Column('running_duration', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_synced_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('close_detail', sa.String(), nullable=True),
+    sa.Column('raw_data', sa.JSON(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('bots', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_bots_grid_id'), ['grid_id'], unique=True)
+        batch_op.create_index(batch_op.f('ix_bots_id'), ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('bots', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_bots_id'))
+        batch_op.drop_index(batch_op.f('ix_bots_grid_id'))
+
+    op.drop_table('bots')
\ No newline at end of file
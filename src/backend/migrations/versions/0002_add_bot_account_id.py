@@ -0,0 +1,32 @@
+"""add bot account id
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('bots', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('account_id', sa.String(), server_default='default', nullable=False))
+        batch_op.create_index(batch_op.f('ix_bots_account_id'), ['account_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('bots', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_bots_account_id'))
+        batch_op.drop_column('account_id')
@@ -0,0 +1,49 @@
+"""add symbol rollups
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('symbol_rollups',
+    sa.Column('symbol', sa.String(), nullable=False),
+    sa.Column('bot_count', sa.Integer(), nullable=False),
+    sa.Column('running_count', sa.Integer(), nullable=False),
+    sa.Column('total_investment', sa.Float(), nullable=False),
+    sa.Column('total_pnl', sa.Float(), nullable=False),
+    sa.Column('apr_sum', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('symbol')
+    )
+    # Seed from the existing bots; the sync maintains the rows from here on
+    op.execute("""
+        INSERT INTO symbol_rollups (symbol, bot_count, running_count, total_investment, total_pnl, apr_sum)
+        SELECT symbol,
+               COUNT(*),
+               SUM(CASE WHEN status = 'RUNNING' THEN 1 ELSE 0 END),
+               COALESCE(SUM(total_investment), 0),
+               COALESCE(SUM(pnl), 0),
+               COALESCE(SUM(total_apr), 0)
+        FROM bots
+        GROUP BY symbol
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('symbol_rollups')
@@ -0,0 +1,64 @@
+"""move raw data to side table
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+import json
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+bots = sa.table('bots', sa.column('grid_id', sa.String()), sa.column('raw_data', sa.JSON()))
+bot_raw_data = sa.table('bot_raw_data', sa.column('grid_id', sa.String()), sa.column('payload', sa.LargeBinary()))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('bot_raw_data',
+    sa.Column('grid_id', sa.String(), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('grid_id')
+    )
+
+    # Same encoding as models.bot_raw_data.compress_payload
+    connection = op.get_bind()
+    result = connection.execute(sa.select(bots.c.grid_id, bots.c.raw_data))
+    while rows := result.fetchmany(BATCH_SIZE):
+        payloads = [
+            {"grid_id": grid_id, "payload": zlib.compress(json.dumps(raw, separators=(",", ":")).encode())}
+            for grid_id, raw in rows if raw is not None
+        ]
+        if payloads:
+            connection.execute(bot_raw_data.insert(), payloads)
+
+    with op.batch_alter_table('bots', schema=None) as batch_op:
+        batch_op.drop_column('raw_data')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('bots', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('raw_data', sa.JSON(), nullable=True))
+
+    connection = op.get_bind()
+    result = connection.execute(sa.select(bot_raw_data.c.grid_id, bot_raw_data.c.payload))
+    for grid_id, payload in result.fetchall():
+        connection.execute(
+            bots.update().where(bots.c.grid_id == grid_id).values(raw_data=json.loads(zlib.decompress(payload)))
+        )
+
+    op.drop_table('bot_raw_data')
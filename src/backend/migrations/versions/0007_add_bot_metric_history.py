@@ -0,0 +1,53 @@
+"""add bot metric history
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('bot_metric_history',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('grid_id', sa.String(), nullable=False),
+    sa.Column('symbol', sa.String(), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('pnl', sa.Float(), nullable=False),
+    sa.Column('pnl_percentage', sa.Float(), nullable=False),
+    sa.Column('total_investment', sa.Float(), nullable=False),
+    sa.Column('total_apr', sa.Float(), nullable=False),
+    sa.Column('current_price', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('bot_metric_history', schema=None) as batch_op:
+        batch_op.create_index('ix_bot_metric_history_grid_id_recorded_at', ['grid_id', 'recorded_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_bot_metric_history_recorded_at'), ['recorded_at'], unique=False)
+    # Start each bot's history at its last synced values
+    op.execute("""
+        INSERT INTO bot_metric_history
+            (grid_id, symbol, recorded_at, pnl, pnl_percentage, total_investment, total_apr, current_price)
+        SELECT grid_id, symbol, last_synced_at, pnl, pnl_percentage, total_investment, total_apr, current_price
+        FROM bots
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('bot_metric_history', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_bot_metric_history_recorded_at'))
+        batch_op.drop_index('ix_bot_metric_history_grid_id_recorded_at')
+
+    op.drop_table('bot_metric_history')
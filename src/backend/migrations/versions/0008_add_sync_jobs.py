@@ -0,0 +1,54 @@
+"""add sync jobs
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, Sequence[str], None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sync_jobs',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('worker_id', sa.String(), nullable=False),
+    sa.Column('page', sa.Integer(), nullable=False),
+    sa.Column('limit', sa.Integer(), nullable=False),
+    sa.Column('status_filter', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.String(), nullable=True),
+    sa.Column('accounts_total', sa.Integer(), nullable=False),
+    sa.Column('accounts_done', sa.Integer(), nullable=False),
+    sa.Column('pages_fetched', sa.Integer(), nullable=False),
+    sa.Column('bots_synced', sa.Integer(), nullable=False),
+    sa.Column('account_results', sa.JSON(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('duration_ms', sa.Float(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('sync_jobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_sync_jobs_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_sync_jobs_status'), ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('sync_jobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_sync_jobs_status'))
+        batch_op.drop_index(batch_op.f('ix_sync_jobs_created_at'))
+
+    op.drop_table('sync_jobs')
@@ -1,3 +1,10 @@
 from ..database import Base
+from .archived_bot import ArchivedBot
+from .backfill_checkpoint import BackfillCheckpoint
 from .bot import Bot
-__all__ = ['Base', 'Bot']
\ No newline at end of file
+from .bot_metric_history import BotMetricHistory
+from .bot_raw_data import BotRawData
+from .symbol_rollup import SymbolRollup
+from .sync_job import SyncJob
+from .sync_lock import SyncLock
+__all__ = ['Base', 'ArchivedBot', 'BackfillCheckpoint', 'Bot', 'BotMetricHistory', 'BotRawData', 'SymbolRollup', 'SyncJob', 'SyncLock']
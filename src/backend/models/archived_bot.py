@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from ..database import Base
+from .bot import BotColumns
+
+
+class ArchivedBot(BotColumns, Base):
+    """
+    Closed bots moved out of the live bots table.
+    Rows keep the id they had in bots.
+    """
+    __tablename__ = "bots_archive"
+
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database import Base
+
+
+class BackfillCheckpoint(Base):
+    """
+    Progress of a bulk backfill of one account and Bybit status filter.
+    Updated in the transaction that loads each page, so a failed backfill
+    resumes at the first page that was not loaded.
+    """
+    __tablename__ = "backfill_checkpoints"
+
+    account_id: Mapped[str] = mapped_column(String, primary_key=True)
+    status_filter: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    next_page: Mapped[int] = mapped_column(Integer, default=0)
+    pages_loaded: Mapped[int] = mapped_column(Integer, default=0)
+    rows_loaded: Mapped[int] = mapped_column(Integer, default=0)
+
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)  # None = resumable
@@ -1,20 +1,29 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from sqlalchemy import String, JSON, DateTime, Float, Integer
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, DateTime, Float, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
+from ..config import DEFAULT_ACCOUNT_ID
 from ..database import Base
+from .bot_raw_data import BotRawData, compress_payload
 
+# Bybit status of an active grid
+RUNNING_STATUS = "RUNNING"
+# Status given to bots that disappeared from a complete Bybit listing
+CLOSED_STATUS = "CLOSED"
 
-class Bot(Base):
-    """SQLAlchemy model for trading bots."""
-    __tablename__ = "bots"
+
+class BotColumns:
+    """Columns shared by live bots and the archive."""
 
     # Primary and identifying fields
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     grid_id: Mapped[str] = mapped_column(String, unique=True, index=True)
+    account_id: Mapped[str] = mapped_column(
+        String, index=True, default=DEFAULT_ACCOUNT_ID, server_default=DEFAULT_ACCOUNT_ID
+    )
 
     # String fields
     bot_type: Mapped[str] = mapped_column(String)
@@ -47,4 +56,26 @@ class Bot(Base):
 
     # Special fields
     close_detail: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    raw_data: Mapped[dict] = mapped_column(JSON)
+
+
+class Bot(BotColumns, Base):
+    """SQLAlchemy model for trading bots."""
+    __tablename__ = "bots"
+
+    # Full API payload lives in bot_raw_data and is only loaded on access
+    raw_record: Mapped[Optional[BotRawData]] = relationship(
+        primaryjoin="foreign(BotRawData.grid_id) == Bot.grid_id",
+        uselist=False,
+        lazy="select"
+    )
+
+    @property
+    def raw_data(self) -> Optional[Dict[str, Any]]:
+        return self.raw_record.data if self.raw_record is not None else None
+
+    @raw_data.setter
+    def raw_data(self, value: Dict[str, Any]) -> None:
+        if self.raw_record is None:
+            self.raw_record = BotRawData(payload=compress_payload(value))
+        else:
+            self.raw_record.payload = compress_payload(value)
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, Float, Integer, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database import Base
+
+
+class BotMetricHistory(Base):
+    """
+    Append-only samples of a bot's performance, one per sync that changed them.
+    Source of the rolling analytics; pruned after METRIC_HISTORY_RETENTION_DAYS.
+    """
+    __tablename__ = "bot_metric_history"
+    __table_args__ = (
+        Index("ix_bot_metric_history_grid_id_recorded_at", "grid_id", "recorded_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    grid_id: Mapped[str] = mapped_column(String)
+    symbol: Mapped[str] = mapped_column(String)
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    pnl: Mapped[float] = mapped_column(Float)
+    pnl_percentage: Mapped[float] = mapped_column(Float)
+    total_investment: Mapped[float] = mapped_column(Float)
+    total_apr: Mapped[float] = mapped_column(Float)
+    current_price: Mapped[float] = mapped_column(Float)
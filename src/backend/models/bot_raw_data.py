@@ -0,0 +1,38 @@
+import json
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import String, DateTime, LargeBinary
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+def compress_payload(data: Dict[str, Any]) -> bytes:
+    """Serialize a payload to zlib-compressed JSON"""
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+
+
+def decompress_payload(payload: bytes) -> Dict[str, Any]:
+    """Inverse of compress_payload"""
+    return json.loads(zlib.decompress(payload))
+
+
+class BotRawData(Base):
+    """
+    Full Bybit payload of a bot, kept out of the bots row.
+    Keyed by grid_id (not bots.id) so payloads survive when a bot moves tables.
+    """
+    __tablename__ = "bot_raw_data"
+
+    grid_id: Mapped[str] = mapped_column(String, primary_key=True)
+    payload: Mapped[bytes] = mapped_column(LargeBinary)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return decompress_payload(self.payload)
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Float, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class SymbolRollup(Base):
+    """
+    Per-symbol aggregates over the bots table, maintained incrementally by the sync.
+    Averages are derived from the stored sums (e.g. average APR = apr_sum / bot_count).
+    """
+    __tablename__ = "symbol_rollups"
+
+    symbol: Mapped[str] = mapped_column(String, primary_key=True)
+    bot_count: Mapped[int] = mapped_column(Integer, default=0)
+    running_count: Mapped[int] = mapped_column(Integer, default=0)
+    total_investment: Mapped[float] = mapped_column(Float, default=0.0)
+    total_pnl: Mapped[float] = mapped_column(Float, default=0.0)
+    apr_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import JSON, String, DateTime, Float, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database import Base
+
+
+class SyncJob(Base):
+    """
+    One POST /bots/update run, executed by the in-process sync worker.
+    Rows are kept after completion as the audit trail of sync throughput.
+    """
+    __tablename__ = "sync_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    status: Mapped[str] = mapped_column(String(16), index=True)  # queued, running, success, partial, failed, skipped
+    worker_id: Mapped[str] = mapped_column(String)
+
+    # Request
+    page: Mapped[int] = mapped_column(Integer)
+    limit: Mapped[int] = mapped_column(Integer)
+    status_filter: Mapped[int] = mapped_column(Integer)
+    account_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # None = every account
+
+    # Progress
+    accounts_total: Mapped[int] = mapped_column(Integer, default=0)
+    accounts_done: Mapped[int] = mapped_column(Integer, default=0)
+    pages_fetched: Mapped[int] = mapped_column(Integer, default=0)
+    bots_synced: Mapped[int] = mapped_column(Integer, default=0)
+    account_results: Mapped[Optional[List[Any]]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    duration_ms: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
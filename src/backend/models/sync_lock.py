@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database import Base
+
+
+class SyncLock(Base):
+    """
+    Lease-based lock row, used where Postgres advisory locks are unavailable (SQLite).
+    A lease past expires_at is considered abandoned and may be taken over.
+    """
+    __tablename__ = "sync_locks"
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    holder: Mapped[str] = mapped_column(String)
+    acquired_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -1,17 +1,29 @@
+import asyncio
 import logging
-from typing import Dict
+import time
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from ..config import Settings
-from ..deps import get_db, get_settings
+from ..deps import get_read_db, get_settings
+from ..exceptions import SyncDeadlineExceededError, SyncInProgressError
 from ..models.bot import Bot
-from ..schemas.bot import Bot as BotSchema
-from ..services.bot_service import sync_bots_with_db
-from ..services.bybit_client import BybitClient, BybitClientConfig, BybitClientError
+from ..models.bot_raw_data import BotRawData
+from ..schemas.bot import Bot as BotSchema, BotRawData as BotRawDataSchema, BotSortField
+from ..schemas.analytics import FleetAnalytics
+from ..schemas.risk import FleetRisk
+from ..schemas.rollup import SymbolRollup as SymbolRollupSchema
+from ..services.analytics_service import analytics_records, get_analytics_cache, summarize_by_symbol
+from ..services.archive_service import count_bots_in_scope, list_bots_in_scope
+from ..services.bot_cache import get_bot_cache
+from ..services.risk_service import get_risk_engine, summarize_fleet_risk
+from ..services.rollup_service import list_symbol_rollups
+from ..services.sync_deadline import DEADLINE_EXCEEDED
+from ..services.sync_jobs import SyncJobWorker, SyncOutcome, SyncRequest, get_sync_worker, sync_summary
 
 router = APIRouter(
     prefix="/bots",
@@ -20,73 +32,285 @@ router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
-
-def setup_basic_logging(debug_mode: bool) -> None:
-    """Set up basic logging configuration"""
-    logging.basicConfig(
-        level=logging.DEBUG if debug_mode else logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+DISCONNECT_POLL_INTERVAL = 0.5  # seconds between client disconnect checks while waiting for a sync
+DEADLINE_GRACE = 2.0  # seconds a sync gets past its deadline to write the pages it fetched
 
 
 @router.get("/", response_model=list[BotSchema])
-async def list_bots(db: Session = Depends(get_db)):
+async def list_bots(
+        response: Response,
+        account: Optional[str] = None,
+        status: Optional[str] = None,
+        symbol: Optional[str] = None,
+        scope: Literal["live", "archived", "all"] = "live",
+        sort_by: BotSortField = "id",
+        order: Literal["asc", "desc"] = "asc",
+        offset: int = Query(0, ge=0),
+        limit: Optional[int] = Query(None, ge=1, le=1000),
+        db: Session = Depends(get_read_db),
+        settings: Settings = Depends(get_settings)
+):
+    """
+    Endpoint to list all bots, optionally filtered by account, status and symbol.
+    Live bots by default; scope selects the archive of closed bots or both.
+    Sorted by sort_by/order; offset and limit select a page, and the
+    X-Total-Count header carries the number of matching bots.
+    Live reads come from the in-process bot cache when it is enabled, otherwise
+    from the read pool so dashboard traffic does not compete with syncs.
+    """
+    descending = order == "desc"
+    try:
+        if scope == "live" and settings.BOT_CACHE_ENABLED:
+            bots, total = get_bot_cache().page(db, account, status, symbol, sort_by, descending, offset, limit)
+        else:
+            bots = list_bots_in_scope(db, scope, account, status, symbol, sort_by, descending, offset, limit)
+            if limit is None and offset == 0:
+                total = len(bots)
+            else:
+                total = count_bots_in_scope(db, scope, account, status, symbol)
+        response.headers["X-Total-Count"] = str(total)
+        return bots
+    except SQLAlchemyError as e:
+        logger.error("Database error while fetching bots: %s", e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+
+
+@router.get("/symbols", response_model=list[SymbolRollupSchema])
+async def list_symbol_summaries(symbol: Optional[str] = None, db: Session = Depends(get_read_db)):
     """
-    Endpoint to list all bots.
-    Uses FastAPI's dependency injection to get the database session.
+    Per-symbol totals (investment, PnL, running bots, average APR).
+    Read from the incrementally maintained rollup table: one row per symbol.
     """
     try:
-        stmt = select(Bot)
-        result = db.execute(stmt)
-        return result.scalars().all()
+        return [
+            SymbolRollupSchema(
+                symbol=row.symbol,
+                bot_count=row.bot_count,
+                running_count=row.running_count,
+                total_investment=row.total_investment,
+                total_pnl=row.total_pnl,
+                average_apr=row.apr_sum / row.bot_count if row.bot_count else 0.0
+            )
+            for row in list_symbol_rollups(db, symbol)
+        ]
     except SQLAlchemyError as e:
-        logger.error(f"Database error while fetching bots: {e}")
+        logger.error("Database error while fetching symbol rollups: %s", e)
         raise HTTPException(status_code=500, detail="Database error occurred")
 
 
-@router.post("/update")
+@router.get("/analytics", response_model=FleetAnalytics)
+async def get_fleet_analytics(
+        window_hours: float = Query(168.0, gt=0, le=24 * 365, description="Length of the rolling window"),
+        symbol: Optional[str] = None,
+        db: Session = Depends(get_read_db)
+):
+    """
+    Rolling APR, max drawdown and PnL velocity per live bot and per symbol,
+    over the metric history. Per-bot results are memoized and recomputed
+    only for bots that received new samples.
+    """
+    try:
+        bot_metrics = get_analytics_cache().bot_analytics(db, window_hours)
+    except SQLAlchemyError as e:
+        logger.error("Database error while computing analytics: %s", e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+    if symbol is not None:
+        bot_metrics = bot_metrics[bot_metrics["symbol"] == symbol]
+    symbol_metrics = summarize_by_symbol(bot_metrics)
+    return {
+        "window_hours": window_hours,
+        "bots": analytics_records(bot_metrics, "grid_id"),
+        "symbols": analytics_records(symbol_metrics, "symbol"),
+    }
+
+
+@router.get("/risk", response_model=FleetRisk)
+async def get_fleet_risk(
+        near_liquidation_pct: float = Query(10.0, gt=0, description="Liquidation distance (%) counted as near"),
+        top: Optional[int] = Query(50, ge=0, le=10000, description="Riskiest bots to include"),
+        db: Session = Depends(get_read_db)
+):
+    """
+    Liquidation distance, grid position and leverage-weighted exposure of the
+    running bots, with fleet aggregates. Computed with NumPy over the stored
+    columns and reused until a sync changes the data.
+    """
+    try:
+        risk = get_risk_engine().get(db)
+    except SQLAlchemyError as e:
+        logger.error("Database error while computing fleet risk: %s", e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+    return summarize_fleet_risk(risk, near_liquidation_pct, top)
+
+
+@router.get("/batch", response_model=list[BotSchema])
+async def get_bots_batch(
+        ids: List[str] = Query(..., description="grid_ids, repeated or comma separated"),
+        db: Session = Depends(get_read_db),
+        settings: Settings = Depends(get_settings)
+):
+    """
+    Several bots by grid_id in one request, in the order asked for.
+    Unknown ids are left out of the result.
+    """
+    grid_ids = list(dict.fromkeys(
+        grid_id.strip() for value in ids for grid_id in value.split(",") if grid_id.strip()
+    ))
+    if len(grid_ids) > settings.BOT_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.BOT_BATCH_MAX_IDS} ids per request, got {len(grid_ids)}"
+        )
+    try:
+        if settings.BOT_CACHE_ENABLED:
+            return get_bot_cache().get_many(db, grid_ids)
+        # Uses the unique grid_id index
+        found = {bot.grid_id: bot for bot in db.execute(select(Bot).where(Bot.grid_id.in_(grid_ids))).scalars()}
+        return [found[grid_id] for grid_id in grid_ids if grid_id in found]
+    except SQLAlchemyError as e:
+        logger.error("Database error while fetching bots batch: %s", e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+
+
+@router.get("/{grid_id}", response_model=BotSchema)
+async def get_bot(
+        grid_id: str,
+        db: Session = Depends(get_read_db),
+        settings: Settings = Depends(get_settings)
+):
+    """Single live bot by grid_id"""
+    try:
+        if settings.BOT_CACHE_ENABLED:
+            bot = get_bot_cache().get(db, grid_id)
+        else:
+            bot = db.execute(select(Bot).where(Bot.grid_id == grid_id)).scalar_one_or_none()
+    except SQLAlchemyError as e:
+        logger.error("Database error while fetching bot %s: %s", grid_id, e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+    if bot is None:
+        raise HTTPException(status_code=404, detail=f"Bot {grid_id} not found")
+    return bot
+
+
+@router.get("/{grid_id}/raw", response_model=BotRawDataSchema)
+async def get_bot_raw_data(grid_id: str, db: Session = Depends(get_read_db)):
+    """Full Bybit payload of one bot, decompressed on demand for detail views"""
+    try:
+        record = db.get(BotRawData, grid_id)
+    except SQLAlchemyError as e:
+        logger.error("Database error while fetching raw data for %s: %s", grid_id, e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"No raw data for bot {grid_id}")
+    return BotRawDataSchema(grid_id=grid_id, raw_data=record.data)
+
+
+async def _wait_while_connected(
+        http_request: Request,
+        worker: SyncJobWorker,
+        job_id: str,
+        timeout: float
+) -> Optional[SyncOutcome]:
+    """
+    Wait for a sync job while the client is still connected.
+    Leaving early (disconnect or timeout) cancels the job unless someone else
+    still wants it.
+    Returns:
+        The job's outcome, or None if the client disconnected
+    Raises:
+        SyncDeadlineExceededError: If the job did not finish in time
+    """
+    waiting = asyncio.ensure_future(worker.wait(job_id))
+    give_up_at = time.monotonic() + timeout + DEADLINE_GRACE
+    try:
+        while True:
+            left = give_up_at - time.monotonic()
+            done, _ = await asyncio.wait({waiting}, timeout=max(min(DISCONNECT_POLL_INTERVAL, left), 0))
+            if done:
+                return waiting.result()
+            if await http_request.is_disconnected():
+                logger.info("Client disconnected while waiting for sync job %s", job_id)
+                return None
+            if left <= 0:
+                raise SyncDeadlineExceededError(
+                    f"Sync job {job_id} did not finish within {timeout:g} seconds"
+                )
+    finally:
+        waiting.cancel()
+
+
+@router.post("/update", status_code=202, response_model=None)
 async def update_trading_bots(
-        db: Session = Depends(get_db),
+        http_request: Request,
+        response: Response,
         settings: Settings = Depends(get_settings),
         page: int = 0,
         limit: int = 150,
-        status: int = 0
-) -> Dict:
+        status: int = 0,
+        account: Optional[str] = None,
+        include_raw: bool = False,
+        wait: bool = False,
+        timeout: Optional[float] = Query(None, gt=0)
+):
     """
-    Update trading bots by fetching data from Bybit and syncing with database.
+    Queue a sync of the trading bots from Bybit and return 202 with the job ID;
+    GET /sync-jobs/{id} reports its progress. All configured accounts are
+    synced concurrently unless one is selected.
+    The sync stops fetching at its deadline; pages fetched by then are still
+    written. A waiting caller that disconnects cancels the sync the same way.
     Args:
-        db: Database session
+        http_request: Incoming request, watched for client disconnects
+        response: Outgoing response (status and Location header)
         settings: Application settings
         page: Page number for pagination
         limit: Number of items per page
         status: Bot status filter
+        account: Only sync this account
+        include_raw: Also return the raw Bybit responses (fetched whole instead
+            of streamed); implies wait, as they are not stored with the job
+        wait: Respond with the sync summary (200) once the job has finished
+        timeout: Seconds until the deadline, at most SYNC_REQUEST_TIMEOUT_SECONDS
     Returns:
-        Dict containing the API response and sync status
+        Dict with the job ID, or the per-account sync status when waiting
     """
-    client = BybitClient(
-        BybitClientConfig(
-            secure_token=settings.BYBIT_SECURE_TOKEN,
-            device_id=settings.BYBIT_DEVICE_ID
-        )
-    )
+    accounts = settings.bybit_accounts()
+    if account is not None:
+        accounts = [a for a in accounts if a.account_id == account]
+        if not accounts:
+            raise HTTPException(status_code=404, detail=f"Unknown account: {account}")
+    if not accounts:
+        raise HTTPException(status_code=500, detail="No Bybit account configured")
+    worker = get_sync_worker()
+    if worker is None:
+        raise HTTPException(status_code=503, detail="Sync worker not running")
+
+    request = SyncRequest(page=page, limit=limit, status=status, account_id=account, keep_response=include_raw)
+    wait = wait or include_raw
+    timeout = min(timeout or settings.SYNC_REQUEST_TIMEOUT_SECONDS, settings.SYNC_REQUEST_TIMEOUT_SECONDS)
     try:
-        bots_data = await client.get_trading_bots(page=page, limit=limit, status=status)
-        logger.info(f"Successfully fetched {len(bots_data.get('data', []))} bots from Bybit")
-
-        synced_bots = await sync_bots_with_db(db, bots_data)
-        logger.info(f"Successfully synced {len(synced_bots) if synced_bots else 0} bots")
-        return {
-            "api_response": bots_data,
-            "sync_status": "success",
-            "synced_bots_count": len(synced_bots) if synced_bots else 0
-        }
-
-    except BybitClientError as e:
-        logger.error(f"Bybit API request failed: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch trading bots")
+        job_id, created = worker.submit(request, accounts, timeout=timeout, detached=not wait)
     except SQLAlchemyError as e:
-        logger.error(f"Database error while syncing bots: {e}")
-        raise HTTPException(status_code=500, detail="Database error occurred")
-    except Exception as e:
-        logger.error(f"Failed to update trading bots: {e}")
+        logger.error("Failed to queue sync job: %s", e)
         raise HTTPException(status_code=500, detail="Failed to update trading bots")
+    if not created:
+        logger.info("Update joined queued sync job %s", job_id)
+
+    if not wait:
+        response.headers["Location"] = f"/sync-jobs/{job_id}"
+        return {"job_id": job_id, "status": "queued", "status_url": f"/sync-jobs/{job_id}"}
+
+    outcome = await _wait_while_connected(http_request, worker, job_id, timeout)
+    if outcome is None:
+        # Nobody is left to read a response
+        return Response(status_code=499)
+    if outcome.status == "skipped":
+        raise SyncInProgressError()
+    if outcome.status == "failed" and outcome.results and all(
+            r.error == DEADLINE_EXCEEDED for r in outcome.results
+    ):
+        raise SyncDeadlineExceededError()
+    if outcome.status in ("failed", "cancelled"):
+        raise HTTPException(status_code=500, detail="Failed to fetch trading bots")
+    logger.info("Successfully synced %d bots in job %s", outcome.synced_bots_count, job_id)
+    response.status_code = 200
+    return sync_summary(outcome, include_raw)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
 from src.backend.deps import get_db, get_settings
@@ -21,24 +21,85 @@ async def debug_env():
     }
 
 
+@router.get("/startup")
+async def debug_startup(request: Request):
+    """Debug endpoint reporting how long each startup phase took (ms)"""
+    return getattr(request.app.state, "startup_timings", {})
+
+
+def _pool_status(engine) -> dict:
+    """Connection pool statistics, when the pool class exposes them"""
+    if engine is None or not hasattr(engine.pool, "checkedout"):
+        return {}
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow()
+    }
+
+
+@router.get("/sync-locks")
+async def debug_sync_locks():
+    """Debug endpoint with wait/hold instrumentation of the sync locks"""
+    from ..services.sync_lock import HOLDER_ID, get_lock_stats
+    return {"holder_id": HOLDER_ID, "locks": get_lock_stats()}
+
+
+@router.get("/bot-cache")
+async def debug_bot_cache():
+    """Debug endpoint with bot cache size, version and hit/miss counters"""
+    from ..services.bot_cache import get_bot_cache
+    return get_bot_cache().status()
+
+
+@router.get("/alerts")
+async def debug_alerts():
+    """Debug endpoint with alert rules, firing counters and the latest alerts"""
+    from ..services.alert_service import get_alert_engine
+    return get_alert_engine().status()
+
+
+@router.get("/sync-scheduler")
+async def debug_sync_scheduler():
+    """Debug endpoint with the poll tiers, their change rates and next syncs"""
+    from ..services.sync_scheduler import get_sync_scheduler
+    scheduler = get_sync_scheduler()
+    return scheduler.status() if scheduler is not None else {"running": False, "tiers": []}
+
+
+@router.get("/data-changes")
+async def debug_data_changes():
+    """Debug endpoint with the local data version and the cross-process LISTEN connection"""
+    from ..services.data_notify import get_data_change_listener
+    from ..services.data_version import get_data_version
+    listener = get_data_change_listener()
+    return {
+        "data_version": get_data_version(),
+        "listener": listener.status() if listener is not None else None,
+    }
+
+
+@router.get("/price-stream")
+async def debug_price_stream():
+    """Debug endpoint with live price stream connection and flush counters"""
+    from ..services.price_stream import get_price_streamer
+    streamer = get_price_streamer()
+    return streamer.status() if streamer is not None else {"enabled": False}
+
+
 @router.get("/database")
 async def debug_database(db: Session = Depends(get_db)):
     """Debug endpoint for database information"""
-    from ..database import _engine, _session_maker
+    from ..database import _engine, _read_engine, _session_maker
     from sqlalchemy import text
     try:
         # Test database connection and get version
         version = db.execute(text("SELECT version()")).scalar()
         # Get connection pool statistics if available
-        pool_info = {}
-        if _engine is not None and hasattr(_engine, 'pool'):
-            pool = _engine.pool
-            pool_info = {
-                "size": pool.size(),
-                "checked_in": pool.checkedin(),
-                "checked_out": pool.checkedout(),
-                "overflow": pool.overflow()
-            }
+        pool_info = _pool_status(_engine)
+        read_pool_info = _pool_status(_read_engine) if _read_engine is not None else None
         return {
             "status": "connected",
             "database_url": get_settings().DATABASE_URL,
@@ -46,6 +107,7 @@ async def debug_database(db: Session = Depends(get_db)):
             "session_maker_initialized": _session_maker is not None,
             "postgres_version": version,
             "pool_info": pool_info,
+            "read_pool_info": read_pool_info,
             "current_schema": db.execute(text("SELECT current_schema()")).scalar(),
             "connection_info": {
                 "database": db.execute(text("SELECT current_database()")).scalar(),
@@ -1,11 +1,15 @@
-from typing import Dict
+import asyncio
+from typing import Dict, Optional
 
 from fastapi import Depends, APIRouter
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.engine import Engine
 
-from src.backend.deps import get_db
+from src.backend.config import Settings
+from src.backend.database import get_engine
+from src.backend.deps import get_settings
 from src.backend.logger import logger
 from src.backend.services.bybit_service import check_bybit_api_health
 
@@ -23,9 +27,15 @@ router = APIRouter(
 
 
 @router.get("/", response_model=HealthCheck)
-async def health_check(db: Session = Depends(get_db)):
-    db_status = await check_database_health(db)
-    bybit_status = await check_bybit_api_health()
+async def health_check(settings: Settings = Depends(get_settings)):
+    """Full dependency check; database and Bybit are probed concurrently"""
+    db_status, bybit_status = await asyncio.gather(
+        check_database_health(get_engine(), timeout=settings.HEALTH_DB_TIMEOUT),
+        check_bybit_api_health(
+            cache_ttl=settings.HEALTH_BYBIT_CACHE_TTL,
+            timeout=settings.HEALTH_BYBIT_TIMEOUT
+        )
+    )
 
     overall_status = "healthy" if db_status == "healthy" and bybit_status == "healthy" else "unhealthy"
 
@@ -39,12 +49,41 @@ async def health_check(db: Session = Depends(get_db)):
     )
 
 
-async def check_database_health(db: Session = Depends(get_db)) -> str:
-    """Health check endpoint"""
+@router.get("/live")
+async def liveness():
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+async def readiness(settings: Settings = Depends(get_settings)):
+    """Readiness probe: the database is reachable. Bybit is not checked."""
+    db_status = await check_database_health(get_engine(), timeout=settings.HEALTH_DB_TIMEOUT)
+    if db_status != "healthy":
+        return JSONResponse(status_code=503, content={"status": "not ready", "database": db_status})
+    return {"status": "ready", "database": db_status}
+
+
+def _ping_database(engine: Engine, timeout: Optional[float] = None) -> bool:
+    # A connection of its own: a ping abandoned at the timeout must not share a request's session
+    with engine.connect() as connection:
+        if timeout is not None and engine.dialect.name == "postgresql":
+            # Ends the abandoned query on the server too
+            connection.execute(text(f"SET LOCAL statement_timeout = {max(int(timeout * 1000), 1)}"))
+        return connection.execute(text("SELECT 1")).scalar() == 1
+
+
+async def check_database_health(engine: Optional[Engine], timeout: Optional[float] = None) -> str:
+    """Run the database ping off the event loop, bounded by timeout"""
+    if engine is None:
+        logger.error("Health check failed: database is not initialized")
+        return "unhealthy"
     try:
-        # Test database connection
-        result = db.execute(text("SELECT 1")).scalar()
-        return "healthy" if result == 1 else "unhealthy"
+        healthy = await asyncio.wait_for(asyncio.to_thread(_ping_database, engine, timeout), timeout)
+        return "healthy" if healthy else "unhealthy"
+    except asyncio.TimeoutError:
+        logger.error("Database health check timed out after %ss", timeout)
+        return "timeout"
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return "unhealthy"
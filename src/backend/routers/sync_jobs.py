@@ -0,0 +1,51 @@
+import logging
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..deps import get_db
+from ..models import SyncJob
+from ..schemas.sync_job import SyncJob as SyncJobSchema
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/sync-jobs",
+    tags=["sync-jobs"]
+)
+
+
+@router.get("/", response_model=List[SyncJobSchema])
+async def list_sync_jobs(
+        status: Optional[str] = None,
+        limit: int = Query(50, ge=1, le=1000),
+        db: Session = Depends(get_db)
+):
+    """Most recent sync jobs first, for auditing sync throughput over time"""
+    query = select(SyncJob).order_by(SyncJob.created_at.desc()).limit(limit)
+    if status is not None:
+        query = query.where(SyncJob.status == status)
+    try:
+        return db.execute(query).scalars().all()
+    except SQLAlchemyError as e:
+        logger.error("Database error while listing sync jobs: %s", e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+
+
+@router.get("/{job_id}", response_model=SyncJobSchema)
+async def get_sync_job(job_id: str, db: Session = Depends(get_db)):
+    """
+    Status and progress of a sync job. Served from the primary, which the
+    worker writes progress to, so a freshly queued job is always found.
+    """
+    try:
+        job = db.get(SyncJob, job_id)
+    except SQLAlchemyError as e:
+        logger.error("Database error while fetching sync job %s: %s", job_id, e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Sync job {job_id} not found")
+    return job
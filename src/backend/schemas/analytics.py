@@ -0,0 +1,32 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class BotAnalytics(BaseModel):
+    """Pydantic model for the rolling performance of one bot."""
+    grid_id: str
+    symbol: str
+    samples: int
+    pnl_change: float
+    rolling_apr: Optional[float] = None  # % per year; None for a single sample
+    max_drawdown: float
+    max_drawdown_pct: Optional[float] = None
+    pnl_velocity: Optional[float] = None  # PnL per hour
+
+
+class SymbolAnalytics(BaseModel):
+    """Pydantic model for the rolling performance of the bots of one symbol."""
+    symbol: str
+    bot_count: int
+    pnl_change: float
+    pnl_velocity: Optional[float] = None
+    rolling_apr: Optional[float] = None
+    max_drawdown_pct: Optional[float] = None
+
+
+class FleetAnalytics(BaseModel):
+    """Pydantic model for rolling analytics per bot and per symbol."""
+    window_hours: float
+    bots: List[BotAnalytics]
+    symbols: List[SymbolAnalytics]
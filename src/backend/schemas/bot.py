@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 
 from pydantic import BaseModel, ConfigDict
 
@@ -7,6 +7,7 @@ from pydantic import BaseModel, ConfigDict
 class BotBase(BaseModel):
     """Base Pydantic model for bot data validation."""
     grid_id: str
+    account_id: str = "default"
     bot_type: str
     symbol: str
     status: str
@@ -30,12 +31,11 @@ class BotBase(BaseModel):
 
     running_duration: int
     close_detail: Optional[str] = None
-    raw_data: Dict[str, Any]
 
 
 class BotCreate(BotBase):
     """Pydantic model for creating a new bot."""
-    pass
+    raw_data: Dict[str, Any]
 
 
 class Bot(BotBase):
@@ -45,4 +45,17 @@ class Bot(BotBase):
     updated_at: Optional[datetime] = None
     last_synced_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BotRawData(BaseModel):
+    """Pydantic model for the full Bybit payload of a bot."""
+    grid_id: str
+    raw_data: Dict[str, Any]
+
+
+# Bot fields GET /bots/ can sort by (all non-nullable)
+BotSortField = Literal[
+    "id", "grid_id", "account_id", "symbol", "status", "leverage", "total_investment", "pnl",
+    "pnl_percentage", "total_apr", "current_price", "running_duration", "arbitrage_num", "created_at"
+]
@@ -0,0 +1,42 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class BotRisk(BaseModel):
+    """Pydantic model for the risk metrics of one running bot."""
+    grid_id: str
+    symbol: str
+    leverage: int
+    current_price: float
+    liq_price: float
+    liq_distance_pct: Optional[float] = None  # |current - liq| / current; None without a liquidation price
+    grid_position: Optional[float] = None  # 0 at min_price, 1 at max_price; outside [0, 1] when out of range
+    grid_cell: Optional[int] = None  # cell the price sits in, clipped to the band
+    out_of_range: bool
+    exposure: float  # total_investment * leverage
+
+
+class SymbolExposure(BaseModel):
+    """Pydantic model for the exposure of the running bots of one symbol."""
+    symbol: str
+    bot_count: int
+    total_investment: float
+    exposure: float
+
+
+class FleetRisk(BaseModel):
+    """Pydantic model for fleet-wide risk aggregates and the riskiest bots."""
+    bot_count: int
+    total_investment: float
+    total_exposure: float
+    effective_leverage: float
+    weighted_liq_distance_pct: Optional[float] = None  # exposure-weighted
+    min_liq_distance_pct: Optional[float] = None
+    near_liquidation_threshold_pct: float
+    near_liquidation_count: int
+    out_of_range_count: int
+    data_version: int
+    computed_ms: float
+    by_symbol: List[SymbolExposure]
+    bots: List[BotRisk]  # closest to liquidation first
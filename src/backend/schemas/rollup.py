@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class SymbolRollup(BaseModel):
+    """Pydantic model for per-symbol aggregates."""
+    symbol: str
+    bot_count: int
+    running_count: int
+    total_investment: float
+    total_pnl: float
+    average_apr: float
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AccountSyncSummary(BaseModel):
+    """Pydantic model for the outcome of one account within a sync job."""
+    account_id: str
+    status: str
+    synced_bots_count: int
+    changed_bots_count: int = 0
+    pages_fetched: int
+    error: Optional[str] = None
+
+
+class SyncJob(BaseModel):
+    """Pydantic model for a queued, running or finished sync job."""
+    id: str
+    status: str  # queued, running, success, partial, failed, skipped, cancelled
+    page: int
+    limit: int
+    status_filter: int
+    account_id: Optional[str] = None
+    accounts_total: int
+    accounts_done: int
+    pages_fetched: int
+    bots_synced: int
+    account_results: Optional[List[AccountSyncSummary]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[float] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SyncJobAccepted(BaseModel):
+    """Pydantic model for the 202 response of POST /bots/update."""
+    job_id: str
+    status: str
+    status_url: str
@@ -0,0 +1,201 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.backend.config import BybitAccount
+from src.backend.services.bot_changes import BotChange
+from src.backend.services.bot_service import BotListingTransformer, sync_bots_with_db, sync_transformed_bots
+from src.backend.services.bybit_service import get_account_client
+from src.backend.services.sync_deadline import SyncAborted, SyncDeadline
+from src.backend.services.sync_lock import sync_lock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AccountSyncResult:
+    """Outcome of syncing one account"""
+    account_id: str
+    status: str  # "success", "failed" or "skipped" (another replica holds the lock)
+    synced_bots_count: int = 0
+    changed_bots_count: int = 0  # synced bots whose tracked fields changed, incl. new and closed ones
+    pages_fetched: int = 0
+    page_full: bool = False  # the page held limit bots, so the next page may hold more
+    error: Optional[str] = None
+    api_response: Optional[dict] = None  # only kept when requested
+
+
+def sync_lock_key(account_id: str) -> str:
+    return f"bots-sync:{account_id}"
+
+
+def listing_is_complete(bot_count: int, page: int, limit: int, status: int) -> bool:
+    """
+    Whether a listing holds every live bot of the account: the unfiltered
+    first page, and not cut off by the page limit.
+    """
+    return page == 0 and status == 0 and bot_count < limit
+
+
+def is_complete_listing(response: dict, page: int, limit: int, status: int) -> bool:
+    """Whether a parsed response holds every live bot of the account"""
+    bots = (response.get("result") or {}).get("bots")
+    return isinstance(bots, list) and listing_is_complete(len(bots), page, limit, status)
+
+
+async def _sync_account(
+        db: Session,
+        account: BybitAccount,
+        semaphore: asyncio.Semaphore,
+        page: int,
+        limit: int,
+        status: int,
+        lock_wait_timeout: float,
+        lock_ttl: float,
+        keep_response: bool,
+        deadline: SyncDeadline,
+        on_result: Optional[Callable[[AccountSyncResult], None]]
+) -> AccountSyncResult:
+    result = await _sync_account_locked(
+        db, account, semaphore, page, limit, status, lock_wait_timeout, lock_ttl, keep_response, deadline
+    )
+    if on_result is not None:
+        on_result(result)
+    return result
+
+
+async def _sync_account_locked(
+        db: Session,
+        account: BybitAccount,
+        semaphore: asyncio.Semaphore,
+        page: int,
+        limit: int,
+        status: int,
+        lock_wait_timeout: float,
+        lock_ttl: float,
+        keep_response: bool,
+        deadline: SyncDeadline
+) -> AccountSyncResult:
+    async with semaphore:
+        try:
+            # Accounts still waiting for their turn are not fetched once the sync is over
+            deadline.check()
+        except SyncAborted as e:
+            return AccountSyncResult(account.account_id, "failed", error=str(e))
+        remaining = deadline.remaining()
+        async with sync_lock(
+                db.get_bind(), sync_lock_key(account.account_id),
+                wait_timeout=lock_wait_timeout if remaining is None else min(lock_wait_timeout, remaining),
+                ttl=lock_ttl
+        ) as acquired:
+            if not acquired:
+                return AccountSyncResult(account.account_id, "skipped", error="Sync already in progress")
+            response = None
+            transformer = BotListingTransformer(account.account_id)
+            try:
+                client = get_account_client(account)
+                if keep_response:
+                    response = await deadline.guard(client.get_trading_bots(
+                        page=page, limit=limit, status=status, timeout=deadline.remaining()
+                    ))
+                else:
+                    # Bots are transformed while the page streams in; the raw page is never held whole
+                    await deadline.guard(client.stream_trading_bots(
+                        transformer, page=page, limit=limit, status=status, timeout=deadline.remaining()
+                    ))
+            except SyncAborted as e:
+                # A partly streamed page is dropped; it is not a listing of the account
+                logger.warning("Fetching bots for account %s stopped: %s", account.account_id, e)
+                return AccountSyncResult(account.account_id, "failed", error=str(e))
+            except Exception as e:
+                logger.error("Fetching bots for account %s failed: %s", account.account_id, e)
+                return AccountSyncResult(account.account_id, "failed", error=str(e))
+            # The syncs never yield to the event loop, so syncs sharing the
+            # session cannot interleave, and a fetched page is written in one
+            # transaction even if the deadline passes meanwhile
+            pages_fetched = 1
+            changes: List[BotChange] = []
+            try:
+                if response is not None:
+                    synced_bots = await sync_bots_with_db(
+                        db, response, account.account_id,
+                        complete_listing=is_complete_listing(response, page, limit, status),
+                        on_changes=changes.extend
+                    )
+                else:
+                    synced_bots = await sync_transformed_bots(
+                        db, transformer.bots, account.account_id,
+                        complete_listing=listing_is_complete(transformer.received, page, limit, status),
+                        on_changes=changes.extend,
+                        listed_grid_ids=transformer.listed_grid_ids
+                    )
+            except Exception as e:
+                logger.error("Syncing bots for account %s failed: %s", account.account_id, e)
+                return AccountSyncResult(
+                    account.account_id, "failed", pages_fetched=pages_fetched, error=str(e), api_response=response
+                )
+            if response is not None:
+                listed = (response.get("result") or {}).get("bots")
+                listed_count = len(listed) if isinstance(listed, list) else 0
+            else:
+                listed_count = transformer.received
+            return AccountSyncResult(
+                account.account_id,
+                "success",
+                synced_bots_count=len(synced_bots) if synced_bots else 0,
+                changed_bots_count=sum(1 for change in changes if change.changed_fields),
+                pages_fetched=pages_fetched,
+                page_full=listed_count >= limit,
+                api_response=response
+            )
+
+
+async def sync_accounts(
+        db: Session,
+        accounts: List[BybitAccount],
+        page: int = 0,
+        limit: int = 150,
+        status: int = 0,
+        max_concurrency: int = 4,
+        lock_wait_timeout: float = 0.0,
+        lock_ttl: float = 600.0,
+        keep_response: bool = False,
+        on_result: Optional[Callable[[AccountSyncResult], None]] = None,
+        deadline: Optional[SyncDeadline] = None
+) -> List[AccountSyncResult]:
+    """
+    Fetch bots for every account concurrently and sync each into the database.
+    At most max_concurrency accounts are processed at a time. Each account is
+    guarded by a cross-replica lock, so only one replica fetches and upserts a
+    given account; the others report it as skipped. A failed fetch or sync only
+    marks that account as failed. Once the deadline passes or the sync is
+    cancelled, fetches in flight are abandoned and accounts not yet fetched
+    fail; pages already fetched are still written.
+    Args:
+        db: Database session used for the syncs
+        accounts: Accounts to sync
+        page: Page number for pagination
+        limit: Number of items per page
+        status: Bot status filter
+        max_concurrency: Maximum number of accounts processed concurrently
+        lock_wait_timeout: Seconds to wait for an account lock held elsewhere
+        lock_ttl: Lease lifetime of the lock on databases without advisory locks
+        keep_response: Fetch each page whole and return it in the results; by
+            default pages are streamed and only the sync outcome is kept
+        on_result: Called with each account's result as soon as it is done
+        deadline: Time budget and cancellation of the sync; none by default
+    Returns:
+        List[AccountSyncResult]: One result per account, in input order
+    """
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+    deadline = deadline or SyncDeadline()
+    return list(await asyncio.gather(*(
+        _sync_account(
+            db, account, semaphore, page, limit, status, lock_wait_timeout, lock_ttl, keep_response,
+            deadline, on_result
+        )
+        for account in accounts
+    )))
@@ -0,0 +1,306 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+import httpx
+
+from src.backend.config import AlertRule, Settings
+from src.backend.models.bot import RUNNING_STATUS
+from src.backend.services.bot_changes import BotChange
+
+logger = logging.getLogger(__name__)
+
+_RECENT_ALERTS = 100  # firings kept for /debug/alerts
+_MAX_PENDING_BATCHES = 100  # batches waiting for delivery before new ones are dropped
+
+Values = Dict[str, Any]
+
+
+def _pnl_below(old: Optional[Values], new: Values, threshold: float) -> Optional[str]:
+    pnl_pct = new["pnl_percentage"]
+    if pnl_pct is not None and pnl_pct < threshold:
+        return f"PnL {pnl_pct:.2f}% below {threshold:g}%"
+    return None
+
+
+def _near_liquidation(old: Optional[Values], new: Values, threshold: float) -> Optional[str]:
+    price, liq = new["current_price"], new["liq_price"]
+    if not price or not liq or price <= 0 or liq <= 0:
+        return None
+    distance = abs(price - liq) / price * 100
+    if distance < threshold:
+        return f"Price {price:g} within {distance:.2f}% of liquidation at {liq:g}"
+    return None
+
+
+def _out_of_range(old: Optional[Values], new: Values, threshold: Optional[float]) -> Optional[str]:
+    price, low, high = new["current_price"], new["min_price"], new["max_price"]
+    if price is None or low is None or high is None or high <= low:
+        return None
+    if price < low or price > high:
+        return f"Price {price:g} outside grid range {low:g}-{high:g}"
+    return None
+
+
+def _stopped(old: Optional[Values], new: Values, threshold: Optional[float]) -> Optional[str]:
+    # Only a transition counts; bots first seen already stopped are history, not news
+    if old is None or old["status"] != RUNNING_STATUS or new["status"] == RUNNING_STATUS:
+        return None
+    detail = f" ({new['close_detail']})" if new["close_detail"] else ""
+    return f"Bot stopped: {new['status']}{detail}"
+
+
+# Rule kind -> (bot fields it reads, check returning a message when the condition holds)
+RULE_KINDS: Dict[str, Tuple[Set[str], Callable[[Optional[Values], Values, Optional[float]], Optional[str]]]] = {
+    "pnl_below": ({"pnl_percentage"}, _pnl_below),
+    "near_liquidation": ({"current_price", "liq_price"}, _near_liquidation),
+    "out_of_range": ({"current_price", "min_price", "max_price"}, _out_of_range),
+    "stopped": ({"status"}, _stopped),
+}
+_NEEDS_THRESHOLD = {"pnl_below", "near_liquidation"}
+
+
+@dataclass
+class Alert:
+    """One firing of a rule for a bot"""
+    rule: str
+    kind: str
+    grid_id: str
+    symbol: str
+    message: str
+    fired_at: float
+
+
+class AlertSink(ABC):
+    """Destination of alert batches"""
+
+    @abstractmethod
+    def deliver(self, alerts: List[Alert]) -> None:
+        """Hand over one batch; called on the delivery thread"""
+
+
+class LogSink(AlertSink):
+    def deliver(self, alerts: List[Alert]) -> None:
+        for alert in alerts:
+            logger.warning("Alert %s for bot %s (%s): %s", alert.rule, alert.grid_id, alert.symbol, alert.message)
+
+
+class WebhookSink(AlertSink):
+    """POSTs each batch as {"alerts": [...]} to a URL"""
+
+    def __init__(self, url: str, timeout: float = 5.0, client: Optional[httpx.Client] = None):
+        self.url = url
+        self._client = client or httpx.Client(timeout=timeout)
+
+    def deliver(self, alerts: List[Alert]) -> None:
+        response = self._client.post(self.url, json={"alerts": [asdict(alert) for alert in alerts]})
+        response.raise_for_status()
+
+
+class RuleIndex:
+    """Rules keyed by symbol (None = every symbol) and by the bot fields they read"""
+
+    def __init__(self, rules: Iterable[AlertRule] = ()):
+        self.rules: List[AlertRule] = []
+        self._index: Dict[Optional[str], Dict[str, List[AlertRule]]] = defaultdict(lambda: defaultdict(list))
+        for rule in rules:
+            self.add(rule)
+
+    def add(self, rule: AlertRule) -> None:
+        if rule.kind in _NEEDS_THRESHOLD and rule.threshold is None:
+            raise ValueError(f"Alert rule {rule.name} ({rule.kind}) needs a threshold")
+        inputs, _ = RULE_KINDS[rule.kind]
+        self.rules.append(rule)
+        for symbol in rule.symbols or [None]:
+            for field in inputs:
+                self._index[symbol][field].append(rule)
+
+    def candidates(self, symbol: str, changed_fields: Set[str]) -> List[AlertRule]:
+        """Rules for the symbol that read at least one of the changed fields, each once"""
+        found: Dict[str, AlertRule] = {}
+        for key in (symbol, None):
+            by_field = self._index.get(key)
+            if not by_field:
+                continue
+            for field in changed_fields:
+                for rule in by_field.get(field, ()):
+                    found.setdefault(rule.name, rule)
+        return list(found.values())
+
+
+class AlertEngine:
+    """
+    Evaluates alert rules against the bots a sync changed.
+    A rule fires once when its condition starts to hold for a bot and stays
+    quiet while it keeps holding (dedup); after the condition clears it may
+    fire again, but not within debounce_seconds of its last firing.
+    Firings are handed to the sinks on a background thread, so a sync never
+    waits on a slow or unreachable webhook.
+    """
+
+    def __init__(self, rules: Iterable[AlertRule] = (), sinks: Iterable[AlertSink] = (),
+                 debounce_seconds: float = 900.0):
+        self.index = RuleIndex(rules)
+        self.sinks: List[AlertSink] = list(sinks)
+        self.debounce_seconds = debounce_seconds
+        self._lock = threading.Lock()
+        # Per bot: rules whose condition currently holds, and when each rule last fired
+        self._active: Dict[str, Set[str]] = defaultdict(set)
+        self._last_fired: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._recent: Deque[Alert] = deque(maxlen=_RECENT_ALERTS)
+        self.evaluated = 0
+        self.fired = 0
+        self.suppressed = 0
+        self.delivery_errors = 0
+        self.dropped = 0  # alerts not delivered because the queue was full
+        self._pending: "queue.Queue[Optional[Tuple[List[AlertSink], List[Alert]]]]" = queue.Queue(
+            maxsize=_MAX_PENDING_BATCHES
+        )
+        self._delivery_thread: Optional[threading.Thread] = None
+
+    def configure(self, rules: Iterable[AlertRule], sinks: Iterable[AlertSink], debounce_seconds: float) -> None:
+        with self._lock:
+            self.index = RuleIndex(rules)
+            self.sinks = list(sinks)
+            self.debounce_seconds = debounce_seconds
+            self._active.clear()
+            self._last_fired.clear()
+
+    def evaluate(self, changes: Iterable[BotChange], now: Optional[float] = None) -> List[Alert]:
+        """
+        Check the rules affected by each change and deliver new firings to the sinks.
+        Returns:
+            List[Alert]: Alerts fired by these changes
+        """
+        if not self.index.rules:
+            return []
+        now = time.time() if now is None else now
+        alerts: List[Alert] = []
+        with self._lock:
+            for change in changes:
+                if change.is_removed:
+                    self._active.pop(change.grid_id, None)
+                    self._last_fired.pop(change.grid_id, None)
+                    continue
+                symbol = change.new["symbol"]
+                for rule in self.index.candidates(symbol, change.changed_fields):
+                    self.evaluated += 1
+                    _, check = RULE_KINDS[rule.kind]
+                    message = check(change.old, change.new, rule.threshold)
+                    active = self._active[change.grid_id]
+                    if message is None:
+                        active.discard(rule.name)
+                        continue
+                    if rule.name in active:
+                        continue
+                    fired = self._last_fired[change.grid_id]
+                    last = fired.get(rule.name)
+                    if last is not None and now - last < self.debounce_seconds:
+                        # Not marked active: the next change after the window fires
+                        self.suppressed += 1
+                        continue
+                    active.add(rule.name)
+                    fired[rule.name] = now
+                    alerts.append(Alert(rule.name, rule.kind, change.grid_id, symbol, message, now))
+            self.fired += len(alerts)
+            self._recent.extend(alerts)
+            sinks = list(self.sinks)
+            if alerts and sinks:
+                self._enqueue(sinks, alerts)
+        return alerts
+
+    def _enqueue(self, sinks: List[AlertSink], alerts: List[Alert]) -> None:
+        if self._delivery_thread is None or not self._delivery_thread.is_alive():
+            self._delivery_thread = threading.Thread(target=self._deliver_pending, name="alert-delivery", daemon=True)
+            self._delivery_thread.start()
+        try:
+            self._pending.put_nowait((sinks, alerts))
+        except queue.Full:
+            self.dropped += len(alerts)
+            logger.error("Alert delivery is behind; dropped %d alerts", len(alerts))
+
+    def _deliver_pending(self) -> None:
+        while True:
+            batch = self._pending.get()
+            try:
+                if batch is None:
+                    return
+                self._deliver(*batch)
+            finally:
+                self._pending.task_done()
+
+    def _deliver(self, sinks: List[AlertSink], alerts: List[Alert]) -> None:
+        for sink in sinks:
+            try:
+                sink.deliver(alerts)
+            except Exception as e:
+                self.delivery_errors += 1
+                logger.error("Alert sink %s failed to deliver %d alerts: %s", type(sink).__name__, len(alerts), e)
+
+    def flush(self) -> None:
+        """Wait until every queued batch has been handed to the sinks"""
+        self._pending.join()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Deliver what is queued (for up to timeout seconds) and end the delivery thread"""
+        with self._lock:
+            thread, self._delivery_thread = self._delivery_thread, None
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._pending.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Alert delivery did not drain within %.0f s", timeout)
+            return
+        thread.join(timeout)
+
+    def status(self) -> dict:
+        return {
+            "rules": [rule.name for rule in self.index.rules],
+            "sinks": [type(sink).__name__ for sink in self.sinks],
+            "active": sum(len(rules) for rules in self._active.values()),
+            "evaluated": self.evaluated,
+            "fired": self.fired,
+            "suppressed": self.suppressed,
+            "delivery_errors": self.delivery_errors,
+            "pending": self._pending.qsize(),
+            "dropped": self.dropped,
+            "recent": [asdict(alert) for alert in self._recent],
+        }
+
+
+_alert_engine = AlertEngine()
+
+
+def get_alert_engine() -> AlertEngine:
+    return _alert_engine
+
+
+def evaluate_alerts(changes: List[BotChange]) -> List[Alert]:
+    """Run the alert rules on committed changes; never fails the caller"""
+    try:
+        return get_alert_engine().evaluate(changes)
+    except Exception as e:
+        logger.error("Alert evaluation failed: %s", e)
+        return []
+
+
+def configure_alerts(settings: Settings) -> AlertEngine:
+    """Load rules and sinks from settings into the process-wide engine"""
+    sinks: List[AlertSink] = [LogSink()]
+    if settings.ALERT_WEBHOOK_URL:
+        sinks.append(WebhookSink(settings.ALERT_WEBHOOK_URL, settings.ALERT_WEBHOOK_TIMEOUT))
+    engine = get_alert_engine()
+    engine.configure(settings.ALERT_RULES, sinks, settings.ALERT_DEBOUNCE_SECONDS)
+    return engine
+
+
+async def stop_alert_delivery() -> None:
+    """Flush queued alerts at shutdown without blocking the event loop"""
+    await asyncio.to_thread(get_alert_engine().stop)
@@ -0,0 +1,214 @@
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from src.backend.models import Bot, BotMetricHistory
+from src.backend.services.bot_changes import BotChange
+
+logger = logging.getLogger(__name__)
+
+# Bot fields whose changes are worth a history sample
+HISTORY_FIELDS = {"pnl", "pnl_percentage", "total_investment", "total_apr"}
+SECONDS_PER_YEAR = 365 * 24 * 3600
+_EPOCH = pd.Timestamp(0, tz="UTC")
+_HISTORY_COLUMNS = (
+    BotMetricHistory.id, BotMetricHistory.grid_id, BotMetricHistory.symbol,
+    BotMetricHistory.recorded_at, BotMetricHistory.pnl, BotMetricHistory.total_investment
+)
+_IN_CHUNK = 500  # grid_ids per IN (...) when loading history of a few bots
+BOT_METRICS = ("samples", "pnl_change", "rolling_apr", "max_drawdown", "max_drawdown_pct", "pnl_velocity")
+
+
+def record_metric_samples(db: Session, changes: Iterable[BotChange], recorded_at: Optional[datetime] = None) -> int:
+    """
+    Append a history sample for every bot whose performance changed in a sync.
+    Runs in the caller's transaction as one bulk INSERT.
+    Returns:
+        int: Number of samples written
+    """
+    recorded_at = recorded_at or datetime.now(timezone.utc)
+    rows = [
+        {
+            "grid_id": change.grid_id,
+            "symbol": change.new["symbol"],
+            "recorded_at": recorded_at,
+            "pnl": change.new["pnl"],
+            "pnl_percentage": change.new["pnl_percentage"],
+            "total_investment": change.new["total_investment"],
+            "total_apr": change.new["total_apr"],
+            "current_price": change.new["current_price"],
+        }
+        for change in changes
+        if change.new is not None and (change.is_new or change.changed_fields & HISTORY_FIELDS)
+    ]
+    if rows:
+        db.execute(insert(BotMetricHistory), rows)
+    return len(rows)
+
+
+def prune_metric_history(db: Session, retention_days: float) -> int:
+    """Delete samples older than the retention period"""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    result = db.execute(delete(BotMetricHistory).where(BotMetricHistory.recorded_at < cutoff))
+    db.commit()
+    return result.rowcount
+
+
+def compute_bot_analytics(history: pd.DataFrame, window_hours: float) -> pd.DataFrame:
+    """
+    Rolling metrics per bot over the window_hours ending at each bot's latest sample.
+    Args:
+        history: Samples with grid_id, symbol, recorded_at, pnl and total_investment
+        window_hours: Length of the window
+    Returns:
+        DataFrame indexed by grid_id with symbol and BOT_METRICS columns:
+        pnl_change over the window, rolling_apr (% per year on the average
+        investment), max_drawdown (largest fall of PnL from a running peak, and
+        as % of investment) and pnl_velocity (least-squares PnL slope per hour)
+    """
+    if history.empty:
+        return pd.DataFrame(columns=["symbol", *BOT_METRICS]).rename_axis("grid_id")
+
+    df = history.sort_values(["grid_id", "recorded_at"], kind="stable")
+    # Resolution-independent: pandas may infer us or ns datetimes
+    seconds = (pd.to_datetime(df["recorded_at"], utc=True) - _EPOCH).dt.total_seconds().to_numpy()
+    df = df.assign(t=seconds)
+    groups = df.groupby("grid_id", sort=False)
+    df = df[df["t"] >= groups["t"].transform("max") - window_hours * 3600]
+
+    groups = df.groupby("grid_id", sort=False)
+    pnl = df["pnl"]
+    drawdown = groups["pnl"].cummax() - pnl
+    t_centered = df["t"] - groups["t"].transform("mean")
+    pnl_centered = pnl - groups["pnl"].transform("mean")
+    by_bot = df["grid_id"]
+
+    result = pd.DataFrame({
+        "symbol": groups["symbol"].last(),
+        "samples": groups.size(),
+        "pnl_change": groups["pnl"].last() - groups["pnl"].first(),
+        "elapsed": groups["t"].last() - groups["t"].first(),
+        "investment": groups["total_investment"].mean(),
+        "max_drawdown": drawdown.groupby(by_bot, sort=False).max(),
+        "sxy": (t_centered * pnl_centered).groupby(by_bot, sort=False).sum(),
+        "sxx": (t_centered * t_centered).groupby(by_bot, sort=False).sum(),
+    })
+    elapsed = result["elapsed"].to_numpy()
+    investment = result["investment"].to_numpy()
+    sxx = result["sxx"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["rolling_apr"] = np.where(
+            (elapsed > 0) & (investment > 0),
+            result["pnl_change"] / investment * (SECONDS_PER_YEAR / elapsed) * 100,
+            np.nan
+        )
+        result["max_drawdown_pct"] = np.where(investment > 0, result["max_drawdown"] / investment * 100, np.nan)
+        result["pnl_velocity"] = np.where(sxx > 0, result["sxy"] / sxx * 3600, np.nan)
+    return result[["symbol", *BOT_METRICS]].rename_axis("grid_id")
+
+
+def summarize_by_symbol(bot_metrics: pd.DataFrame) -> pd.DataFrame:
+    """
+    Symbol level analytics from per-bot results: summed PnL change and
+    velocity, mean rolling APR and the worst drawdown.
+    """
+    if bot_metrics.empty:
+        return pd.DataFrame(columns=["bot_count", "pnl_change", "pnl_velocity", "rolling_apr", "max_drawdown_pct"])
+    grouped = bot_metrics.groupby("symbol")
+    return pd.DataFrame({
+        "bot_count": grouped.size(),
+        "pnl_change": grouped["pnl_change"].sum(),
+        "pnl_velocity": grouped["pnl_velocity"].sum(min_count=1),
+        "rolling_apr": grouped["rolling_apr"].mean(),
+        "max_drawdown_pct": grouped["max_drawdown_pct"].max(),
+    })
+
+
+def analytics_records(metrics: pd.DataFrame, index_name: str) -> List[dict]:
+    """Rows of an analytics frame as dicts, with its index as index_name and NaN as None"""
+    frame = metrics.rename_axis(index_name).reset_index()
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def load_metric_history(db: Session, grid_ids: Optional[List[str]] = None) -> pd.DataFrame:
+    """History samples of the given live bots (all live bots when None)"""
+    columns = [column.key for column in _HISTORY_COLUMNS]
+    base = select(*_HISTORY_COLUMNS).join(Bot, Bot.grid_id == BotMetricHistory.grid_id)
+    if grid_ids is None:
+        rows = db.execute(base).all()
+    else:
+        rows = []
+        for i in range(0, len(grid_ids), _IN_CHUNK):
+            rows.extend(db.execute(base.where(BotMetricHistory.grid_id.in_(grid_ids[i:i + _IN_CHUNK]))).all())
+    return pd.DataFrame(rows, columns=columns)
+
+
+class AnalyticsCache:
+    """
+    Memoized per-bot analytics.
+    Results are kept per (window, bot) for the max_windows most recently
+    requested windows. New history rows are detected through the highest
+    history id; only the bots that received samples since the last request
+    are dropped and recomputed.
+    """
+
+    def __init__(self, max_windows: int = 8):
+        self.max_windows = max_windows
+        self._watermark: Optional[int] = None
+        self._results: "OrderedDict[float, pd.DataFrame]" = OrderedDict()
+        self.recomputed_bots = 0
+
+    def _invalidate_new_samples(self, db: Session) -> None:
+        latest = db.execute(select(func.max(BotMetricHistory.id))).scalar()
+        if latest == self._watermark:
+            return
+        if self._watermark is None or latest is None or latest < self._watermark:
+            # First use, or the table was pruned below what we have seen
+            self._results.clear()
+        else:
+            changed: Set[str] = set(db.execute(
+                select(BotMetricHistory.grid_id).where(BotMetricHistory.id > self._watermark).distinct()
+            ).scalars())
+            for window, metrics in self._results.items():
+                self._results[window] = metrics[~metrics.index.isin(changed)]
+        self._watermark = latest
+
+    def bot_analytics(self, db: Session, window_hours: float) -> pd.DataFrame:
+        """Per-bot analytics of the live bots, recomputing only bots with new samples"""
+        self._invalidate_new_samples(db)
+        live_ids = list(db.execute(select(Bot.grid_id)).scalars())
+        cached = self._results.get(window_hours)
+        if cached is None:
+            fresh = compute_bot_analytics(load_metric_history(db), window_hours)
+            self.recomputed_bots += len(fresh)
+            cached = fresh
+        else:
+            missing = [grid_id for grid_id in live_ids if grid_id not in cached.index]
+            if missing:
+                fresh = compute_bot_analytics(load_metric_history(db, missing), window_hours)
+                self.recomputed_bots += len(fresh)
+                cached = pd.concat([cached, fresh]) if not cached.empty else fresh
+        # Bots that left the table drop out of the memo
+        cached = cached[cached.index.isin(live_ids)]
+        self._results[window_hours] = cached
+        self._results.move_to_end(window_hours)
+        while len(self._results) > self.max_windows:
+            self._results.popitem(last=False)
+        return cached
+
+    def clear(self) -> None:
+        self._watermark = None
+        self._results.clear()
+
+
+_analytics_cache = AnalyticsCache()
+
+
+def get_analytics_cache() -> AnalyticsCache:
+    return _analytics_cache
@@ -0,0 +1,181 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from src.backend.models import ArchivedBot, Bot
+from src.backend.models.bot import CLOSED_STATUS, RUNNING_STATUS
+from src.backend.services.alert_service import evaluate_alerts
+from src.backend.services.bot_changes import BotChange, bot_snapshot
+from src.backend.services.data_version import bump_data_version
+from src.backend.services.rollup_service import apply_bot_changes
+
+logger = logging.getLogger(__name__)
+
+CLOSED_BY_RECONCILE = "Missing from Bybit listing"
+_ARCHIVED_COLUMNS = [column.key for column in Bot.__table__.columns]
+_SCOPE_MODELS = {"live": [Bot], "archived": [ArchivedBot], "all": [Bot, ArchivedBot]}
+
+
+def closed_bot_condition():
+    """SQL condition matching bots that are no longer running"""
+    return or_(Bot.close_detail.is_not(None), Bot.status != RUNNING_STATUS)
+
+
+def is_closed_bot(bot: Bot) -> bool:
+    """Python counterpart of closed_bot_condition"""
+    return bot.close_detail is not None or bot.status != RUNNING_STATUS
+
+
+def reconcile_missing_bots(db: Session, account_id: str, seen_grid_ids: Iterable[str]) -> List[BotChange]:
+    """
+    Mark running bots of an account that are absent from a complete listing as closed.
+    Runs in the caller's transaction: one SELECT for the affected rows and one
+    set-based UPDATE.
+    Returns:
+        List[BotChange]: Changes of the bots that were closed
+    """
+    seen = list(seen_grid_ids)
+    stmt = select(Bot).where(Bot.account_id == account_id, Bot.status == RUNNING_STATUS)
+    if seen:
+        stmt = stmt.where(Bot.grid_id.not_in(seen))
+    missing = list(db.execute(stmt).scalars())
+    if not missing:
+        return []
+
+    old_values = {bot.id: bot_snapshot(bot) for bot in missing}
+    db.execute(
+        update(Bot)
+        .where(Bot.id.in_(list(old_values)))
+        .values(status=CLOSED_STATUS, close_detail=func.coalesce(Bot.close_detail, CLOSED_BY_RECONCILE))
+        .execution_options(synchronize_session="fetch")
+    )
+    logger.info("Marked %d bots of account %s as closed", len(missing), account_id)
+    return [BotChange(bot.grid_id, old_values[bot.id], bot_snapshot(bot)) for bot in missing]
+
+
+def archive_closed_bots(db: Session, batch_size: int = 500, min_age_seconds: float = 0.0) -> int:
+    """
+    Move closed bots from bots to bots_archive in batches, one transaction per batch.
+    Args:
+        db: Database session
+        batch_size: Rows moved per transaction
+        min_age_seconds: Only archive bots not synced for at least this long
+    Returns:
+        int: Number of archived bots
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=min_age_seconds)
+    archived = 0
+    while True:
+        batch = list(db.execute(
+            select(Bot)
+            .where(closed_bot_condition(), Bot.last_synced_at <= cutoff)
+            .order_by(Bot.id)
+            .limit(batch_size)
+        ).scalars())
+        if not batch:
+            break
+        ids = [bot.id for bot in batch]
+        changes = [BotChange(bot.grid_id, bot_snapshot(bot), None) for bot in batch]
+        try:
+            db.execute(insert(ArchivedBot).from_select(
+                _ARCHIVED_COLUMNS,
+                select(*[Bot.__table__.c[name] for name in _ARCHIVED_COLUMNS]).where(Bot.id.in_(ids))
+            ))
+            db.execute(delete(Bot).where(Bot.id.in_(ids)).execution_options(synchronize_session=False))
+            apply_bot_changes(db, changes)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        bump_data_version()
+        # Drops dedup state of the archived bots
+        evaluate_alerts(changes)
+        for bot in batch:
+            db.expunge(bot)
+        archived += len(ids)
+        if len(batch) < batch_size:
+            break
+    if archived:
+        logger.info("Archived %d closed bots", archived)
+    return archived
+
+
+def archived_grid_ids(db: Session, grid_ids: Iterable[str]) -> set:
+    """Subset of grid_ids that already live in the archive"""
+    grid_ids = list(grid_ids)
+    if not grid_ids:
+        return set()
+    return set(db.execute(select(ArchivedBot.grid_id).where(ArchivedBot.grid_id.in_(grid_ids))).scalars())
+
+
+def _scoped_select(model, what, account_id, status, symbol):
+    stmt = select(what)
+    if account_id is not None:
+        stmt = stmt.where(model.account_id == account_id)
+    if status is not None:
+        stmt = stmt.where(model.status == status)
+    if symbol is not None:
+        stmt = stmt.where(model.symbol == symbol)
+    return stmt
+
+
+def list_bots_in_scope(
+        db: Session,
+        scope: str = "live",
+        account_id: Optional[str] = None,
+        status: Optional[str] = None,
+        symbol: Optional[str] = None,
+        sort_by: str = "id",
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None
+) -> list:
+    """
+    Bots from the live table, the archive, or both, sorted and paginated in SQL.
+    For scope "all" each table returns its first offset + limit rows and the
+    two sorted runs are merged.
+    Args:
+        scope: "live", "archived" or "all"
+        account_id: Only bots of this account
+        status: Only bots with this status
+        symbol: Only bots trading this symbol
+        sort_by: Column to sort by, ties broken by id
+        descending: Sort in descending order
+        offset: Rows to skip
+        limit: Maximum number of rows (None = all)
+    """
+    models = _SCOPE_MODELS[scope]
+    rows = []
+    for model in models:
+        column, tiebreak = getattr(model, sort_by), model.id
+        stmt = _scoped_select(model, model, account_id, status, symbol).order_by(
+            *((column.desc(), tiebreak.desc()) if descending else (column, tiebreak))
+        )
+        if len(models) == 1:
+            stmt = stmt.offset(offset)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+        elif limit is not None:
+            stmt = stmt.limit(offset + limit)
+        rows.extend(db.execute(stmt).scalars())
+    if len(models) == 1:
+        return rows
+    rows.sort(key=lambda row: (getattr(row, sort_by), row.id), reverse=descending)
+    return rows[offset:offset + limit if limit is not None else None]
+
+
+def count_bots_in_scope(
+        db: Session,
+        scope: str = "live",
+        account_id: Optional[str] = None,
+        status: Optional[str] = None,
+        symbol: Optional[str] = None
+) -> int:
+    """Number of bots list_bots_in_scope would return without pagination"""
+    return sum(
+        db.execute(_scoped_select(model, func.count(model.id), account_id, status, symbol)).scalar_one()
+        for model in _SCOPE_MODELS[scope]
+    )
@@ -0,0 +1,249 @@
+import csv
+import io
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import column, func, select, table, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.backend.config import BybitAccount
+from src.backend.models import BackfillCheckpoint, Bot
+from src.backend.services.account_sync import sync_lock_key
+from src.backend.services.archive_service import archived_grid_ids, is_closed_bot
+from src.backend.services.bot_service import BotListingTransformer, store_raw_payloads
+from src.backend.services.bybit_service import get_account_client
+from src.backend.services.data_version import bump_data_version
+from src.backend.services.rollup_service import rebuild_symbol_rollups
+from src.backend.services.sync_lock import sync_lock
+
+logger = logging.getLogger(__name__)
+
+# Columns written by the backfill; id and created_at are left to the database
+LOADED_COLUMNS = [name for name in Bot.__table__.columns.keys() if name not in ("id", "created_at", "updated_at")]
+_STAGING_TABLE = "backfill_bots"
+_COPY_NULL = "\\N"
+# last_synced_at of loaded closed bots: past any ARCHIVE_MIN_AGE_SECONDS, so the next archive pass moves them
+ARCHIVE_READY_SYNCED_AT = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class BackfillReport:
+    """Outcome of backfilling one account and status filter"""
+    account_id: str
+    status_filter: int
+    status: str  # "finished", "already_finished" (by an earlier run) or "failed" (resumable)
+    resumed_from_page: int = 0
+    pages_loaded: int = 0  # by this run
+    rows_loaded: int = 0  # by this run
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_loaded / self.seconds if self.seconds > 0 else 0.0
+
+
+def bot_rows(bots: List[Bot]) -> List[Dict[str, Any]]:
+    """Column values of transformed bots, one row per grid_id (the last one wins)"""
+    rows = {bot.grid_id: {name: getattr(bot, name) for name in LOADED_COLUMNS} for bot in bots}
+    return list(rows.values())
+
+
+def _upsert(stmt):
+    """Turn an insert into bots into an upsert on grid_id"""
+    return stmt.on_conflict_do_update(
+        index_elements=["grid_id"],
+        set_={
+            **{name: stmt.excluded[name] for name in LOADED_COLUMNS if name != "grid_id"},
+            "updated_at": func.now()
+        }
+    )
+
+
+def insert_rows(db: Session, rows: List[Dict[str, Any]], batch_size: int = 500) -> None:
+    """Upsert rows into bots with one multi-row INSERT per batch"""
+    for start in range(0, len(rows), max(batch_size, 1)):
+        db.execute(_upsert(sqlite.insert(Bot.__table__).values(rows[start:start + batch_size])))
+
+
+def copy_rows(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Upsert rows into bots through COPY: the rows are streamed as CSV into a
+    temporary staging table, dropped at commit, and merged with a single
+    INSERT ... ON CONFLICT. Postgres (psycopg2) only.
+    """
+    if not rows:
+        return
+    connection = db.connection()
+    columns = ", ".join(LOADED_COLUMNS)
+    connection.execute(text(
+        f"CREATE TEMP TABLE {_STAGING_TABLE} ON COMMIT DROP AS SELECT {columns} FROM bots WITH NO DATA"
+    ))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(_COPY_NULL if row[name] is None else row[name] for name in LOADED_COLUMNS)
+    buffer.seek(0)
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')", buffer
+        )
+    finally:
+        cursor.close()
+    staged = table(_STAGING_TABLE, *(column(name) for name in LOADED_COLUMNS))
+    db.execute(_upsert(postgresql.insert(Bot.__table__).from_select(LOADED_COLUMNS, select(*staged.c))))
+
+
+def load_bots(db: Session, bots: List[Bot], batch_size: int = 500) -> int:
+    """
+    Upsert a page of transformed bots and their raw payloads, without
+    committing. Archived bots are skipped; closed ones are stamped with
+    ARCHIVE_READY_SYNCED_AT, so they end up in bots_archive with the next
+    archive pass instead of staying among the live bots.
+    Returns:
+        int: Number of bots loaded
+    """
+    archived = archived_grid_ids(db, [bot.grid_id for bot in bots])
+    bots = [bot for bot in bots if bot.grid_id not in archived]
+    for bot in bots:
+        if is_closed_bot(bot):
+            bot.last_synced_at = ARCHIVE_READY_SYNCED_AT
+    store_raw_payloads(db, {bot.grid_id: bot.raw_record.payload for bot in bots if bot.raw_record is not None})
+    rows = bot_rows(bots)
+    if db.get_bind().dialect.name == "postgresql":
+        copy_rows(db, rows)
+    else:
+        insert_rows(db, rows, batch_size)
+    return len(rows)
+
+
+def _start_checkpoint(db: Session, account_id: str, status: int, restart: bool) -> BackfillCheckpoint:
+    now = datetime.now(timezone.utc)
+    checkpoint = db.get(BackfillCheckpoint, (account_id, status))
+    if checkpoint is None:
+        checkpoint = BackfillCheckpoint(account_id=account_id, status_filter=status)
+        db.add(checkpoint)
+    elif not restart:
+        return checkpoint
+    checkpoint.next_page = 0
+    checkpoint.pages_loaded = 0
+    checkpoint.rows_loaded = 0
+    checkpoint.started_at = now
+    checkpoint.updated_at = now
+    checkpoint.finished_at = None
+    db.commit()
+    return checkpoint
+
+
+async def backfill_account(
+        db: Session,
+        account: BybitAccount,
+        status: int = 0,
+        limit: int = 150,
+        batch_size: int = 500,
+        restart: bool = False,
+        lock_wait_timeout: float = 30.0,
+        lock_ttl: float = 600.0
+) -> BackfillReport:
+    """
+    Walk every page of one status filter of an account and load the bots.
+    Each page is committed together with the checkpoint, under the account's
+    sync lock; the walk ends with the first page holding fewer than limit
+    bots. A failure stops the walk, and the next run resumes at the page that
+    failed. Unlike syncs, the backfill skips metric history, alerts and
+    incremental rollups; see backfill_accounts.
+    Args:
+        db: Database session
+        account: Account to backfill
+        status: Bybit status filter
+        limit: Bots requested per page
+        batch_size: Rows per INSERT on databases without COPY
+        restart: Walk from the first page even if a checkpoint exists
+        lock_wait_timeout: Seconds to wait for a sync of the account to finish, per page
+        lock_ttl: Lease lifetime of the lock on databases without advisory locks
+    Returns:
+        BackfillReport: Pages and rows loaded by this run, and its throughput
+    """
+    checkpoint = _start_checkpoint(db, account.account_id, status, restart)
+    report = BackfillReport(account.account_id, status, "finished", resumed_from_page=checkpoint.next_page)
+    if checkpoint.finished_at is not None:
+        logger.info("Backfill of account %s (status %d) already finished at %s",
+                    account.account_id, status, checkpoint.finished_at)
+        report.status = "already_finished"
+        return report
+    if checkpoint.next_page:
+        logger.info("Resuming backfill of account %s (status %d) at page %d",
+                    account.account_id, status, checkpoint.next_page)
+
+    client = get_account_client(account)
+    started = time.perf_counter()
+    page = checkpoint.next_page
+    try:
+        while True:
+            async with sync_lock(
+                    db.get_bind(), sync_lock_key(account.account_id), wait_timeout=lock_wait_timeout, ttl=lock_ttl
+            ) as acquired:
+                if not acquired:
+                    raise RuntimeError("Sync already in progress")
+                transformer = BotListingTransformer(account.account_id)
+                await client.stream_trading_bots(transformer, page=page, limit=limit, status=status)
+                rows = load_bots(db, transformer.bots, batch_size)
+                now = datetime.now(timezone.utc)
+                checkpoint.next_page = page + 1
+                checkpoint.pages_loaded += 1
+                checkpoint.rows_loaded += rows
+                checkpoint.updated_at = now
+                if transformer.received < limit:
+                    checkpoint.finished_at = now
+                db.commit()
+            bump_data_version()
+            report.pages_loaded += 1
+            report.rows_loaded += rows
+            report.seconds = time.perf_counter() - started
+            logger.info("Backfilled page %d of account %s (status %d): %d rows, %.0f rows/s overall",
+                        page, account.account_id, status, rows, report.rows_per_second)
+            if transformer.received < limit:
+                break
+            page += 1
+    except Exception as e:
+        db.rollback()
+        logger.error("Backfill of account %s (status %d) stopped at page %d: %s",
+                     account.account_id, status, page, e)
+        report.status = "failed"
+        report.error = str(e)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+async def backfill_accounts(
+        db: Session,
+        accounts: List[BybitAccount],
+        statuses: List[int],
+        limit: int = 150,
+        batch_size: int = 500,
+        restart: bool = False,
+        lock_wait_timeout: float = 30.0,
+        lock_ttl: float = 600.0
+) -> List[BackfillReport]:
+    """
+    Backfill each status filter of each account, one walk at a time, then
+    rebuild the symbol rollups from the loaded bots.
+    Returns:
+        List[BackfillReport]: One report per account and status, in order
+    """
+    reports = []
+    for account in accounts:
+        for status in statuses:
+            reports.append(await backfill_account(
+                db, account, status, limit, batch_size, restart, lock_wait_timeout, lock_ttl
+            ))
+    if any(report.rows_loaded for report in reports):
+        symbols = rebuild_symbol_rollups(db)
+        bump_data_version()
+        logger.info("Rebuilt rollups of %d symbols after the backfill", symbols)
+    return reports
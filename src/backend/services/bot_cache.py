@@ -0,0 +1,197 @@
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.backend.models import Bot
+from src.backend.models.bot import RUNNING_STATUS
+from src.backend.schemas.bot import Bot as BotSchema
+from src.backend.services.data_version import get_data_version
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BotCacheStats:
+    """Counters exposed on /debug/bot-cache"""
+    hits: int = 0
+    misses: int = 0  # reads that had to load the fleet from the database
+    loads: int = 0
+    last_load_ms: float = 0.0
+
+
+class BotSnapshot:
+    """Immutable view of the live fleet, indexed by grid_id, status, symbol and account"""
+
+    def __init__(self, bots: Iterable[BotSchema], version: int):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.bots: Tuple[BotSchema, ...] = tuple(sorted(bots, key=lambda bot: bot.id))
+        self.by_grid_id: Dict[str, BotSchema] = {bot.grid_id: bot for bot in self.bots}
+        by_status, by_symbol, by_account = defaultdict(list), defaultdict(list), defaultdict(list)
+        for bot in self.bots:
+            by_status[bot.status].append(bot)
+            by_symbol[bot.symbol].append(bot)
+            by_account[bot.account_id].append(bot)
+        self.by_status = {key: tuple(value) for key, value in by_status.items()}
+        self.by_symbol = {key: tuple(value) for key, value in by_symbol.items()}
+        self.by_account = {key: tuple(value) for key, value in by_account.items()}
+        self._orders: Dict[Tuple[str, bool], Tuple[BotSchema, ...]] = {}
+
+    def ordered(self, sort_by: str = "id", descending: bool = False) -> Tuple[BotSchema, ...]:
+        """All bots sorted by a field (ties by id); each order is computed once per snapshot"""
+        key = (sort_by, descending)
+        order = self._orders.get(key)
+        if order is None:
+            order = tuple(sorted(self.bots, key=lambda bot: (getattr(bot, sort_by), bot.id), reverse=descending))
+            self._orders[key] = order
+        return order
+
+    def filter(
+            self,
+            account_id: Optional[str] = None,
+            status: Optional[str] = None,
+            symbol: Optional[str] = None
+    ) -> List[BotSchema]:
+        """Bots matching every given filter, scanning only the smallest index bucket"""
+        buckets = [
+            index.get(value, ())
+            for index, value in ((self.by_account, account_id), (self.by_status, status), (self.by_symbol, symbol))
+            if value is not None
+        ]
+        if not buckets:
+            return list(self.bots)
+        smallest = min(buckets, key=len)
+        return [
+            bot for bot in smallest
+            if (account_id is None or bot.account_id == account_id)
+            and (status is None or bot.status == status)
+            and (symbol is None or bot.symbol == symbol)
+        ]
+
+
+class BotCache:
+    """
+    Read-through cache of the live bots table.
+    A snapshot is valid while the process data version is unchanged and it is
+    younger than ttl (the ttl bounds staleness from writes made by other processes).
+    A new snapshot is built completely and then swapped in with one assignment,
+    so readers see either the old or the new fleet, never a mix.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self.stats = BotCacheStats()
+        self._snapshot: Optional[BotSnapshot] = None
+
+    def _is_fresh(self, snapshot: Optional[BotSnapshot]) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == get_data_version()
+            and time.monotonic() - snapshot.loaded_at < self.ttl
+        )
+
+    def refresh(self, db: Session) -> BotSnapshot:
+        """Load the fleet from the database and swap it in"""
+        started = time.perf_counter()
+        # Read the version first: a change committed during the load leaves the snapshot stale
+        version = get_data_version()
+        bots = [BotSchema.model_validate(bot) for bot in db.execute(select(Bot)).scalars()]
+        snapshot = BotSnapshot(bots, version)
+        self._snapshot = snapshot
+        self.stats.loads += 1
+        self.stats.last_load_ms = round((time.perf_counter() - started) * 1000, 2)
+        logger.debug("Bot cache loaded %d bots in %.2f ms", len(bots), self.stats.last_load_ms)
+        return snapshot
+
+    def snapshot(self, db: Session) -> BotSnapshot:
+        """Current snapshot, reloading it from the database when stale"""
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            self.stats.hits += 1
+            return snapshot
+        self.stats.misses += 1
+        return self.refresh(db)
+
+    def list(
+            self,
+            db: Session,
+            account_id: Optional[str] = None,
+            status: Optional[str] = None,
+            symbol: Optional[str] = None
+    ) -> List[BotSchema]:
+        return self.snapshot(db).filter(account_id, status, symbol)
+
+    def page(
+            self,
+            db: Session,
+            account_id: Optional[str] = None,
+            status: Optional[str] = None,
+            symbol: Optional[str] = None,
+            sort_by: str = "id",
+            descending: bool = False,
+            offset: int = 0,
+            limit: Optional[int] = None
+    ) -> Tuple[List[BotSchema], int]:
+        """
+        One page of the filtered, sorted fleet.
+        Returns:
+            Tuple of the page and the number of matching bots
+        """
+        snapshot = self.snapshot(db)
+        if account_id is None and status is None and symbol is None:
+            matching = snapshot.ordered(sort_by, descending)
+        else:
+            matching = sorted(
+                snapshot.filter(account_id, status, symbol),
+                key=lambda bot: (getattr(bot, sort_by), bot.id),
+                reverse=descending
+            )
+        end = offset + limit if limit is not None else None
+        return list(matching[offset:end]), len(matching)
+
+    def get(self, db: Session, grid_id: str) -> Optional[BotSchema]:
+        return self.snapshot(db).by_grid_id.get(grid_id)
+
+    def get_many(self, db: Session, grid_ids: Iterable[str]) -> List[BotSchema]:
+        """Bots with the given grid_ids, in request order; unknown ids are skipped"""
+        by_grid_id = self.snapshot(db).by_grid_id
+        return [by_grid_id[grid_id] for grid_id in grid_ids if grid_id in by_grid_id]
+
+    def apply_prices(self, prices: Dict[str, Tuple[float, float]]) -> None:
+        """
+        Patch streamed prices (symbol -> (mark_price, current_price)) onto the
+        running bots of the current snapshot, keeping its version and age.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or not prices:
+            return
+        bots = [
+            bot.model_copy(update={"mark_price": prices[bot.symbol][0], "current_price": prices[bot.symbol][1]})
+            if bot.symbol in prices and bot.status == RUNNING_STATUS else bot
+            for bot in snapshot.bots
+        ]
+        patched = BotSnapshot(bots, snapshot.version)
+        patched.loaded_at = snapshot.loaded_at
+        self._snapshot = patched
+
+    def status(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            **asdict(self.stats),
+            "ttl": self.ttl,
+            "size": len(snapshot.bots) if snapshot is not None else 0,
+            "version": snapshot.version if snapshot is not None else None,
+            "data_version": get_data_version()
+        }
+
+
+_bot_cache = BotCache()
+
+
+def get_bot_cache() -> BotCache:
+    return _bot_cache
@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set
+
+from src.backend.models import Bot
+
+# Fields whose changes downstream consumers (rollups, alerts, analytics) react to
+TRACKED_FIELDS = (
+    "account_id",
+    "symbol",
+    "status",
+    "close_detail",
+    "total_investment",
+    "pnl",
+    "pnl_percentage",
+    "total_apr",
+    "leverage",
+    "min_price",
+    "max_price",
+    "cell_num",
+    "liq_price",
+    "mark_price",
+    "current_price",
+)
+
+
+def bot_snapshot(bot: Bot) -> Dict[str, Any]:
+    """Values of the tracked fields of a bot"""
+    return {name: getattr(bot, name) for name in TRACKED_FIELDS}
+
+
+@dataclass
+class BotChange:
+    """
+    Before/after view of one bot touched by a sync.
+    old is None for bots seen for the first time (and new is None for bots
+    that left the table).
+    """
+    grid_id: str
+    old: Optional[Dict[str, Any]]
+    new: Optional[Dict[str, Any]]
+    changed_fields: Set[str] = field(init=False)
+
+    def __post_init__(self):
+        if self.old is None or self.new is None:
+            self.changed_fields = set(TRACKED_FIELDS)
+        else:
+            self.changed_fields = {name for name in TRACKED_FIELDS if self.old[name] != self.new[name]}
+
+    @property
+    def is_new(self) -> bool:
+        return self.old is None
+
+    @property
+    def is_removed(self) -> bool:
+        return self.new is None
+
+    @property
+    def current(self) -> Dict[str, Any]:
+        """Latest known values (the old ones for removed bots)"""
+        return self.new if self.new is not None else self.old
@@ -1,47 +1,98 @@
 import logging
+import uuid
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from src.backend.models import Bot
+from src.backend.config import DEFAULT_ACCOUNT_ID
+from src.backend.models import Bot, BotRawData
+from src.backend.services.alert_service import evaluate_alerts
+from src.backend.services.analytics_service import record_metric_samples
+from src.backend.services.archive_service import archived_grid_ids, reconcile_missing_bots
+from src.backend.services.bot_changes import BotChange, bot_snapshot
+from src.backend.services.data_version import bump_data_version
+from src.backend.services.rollup_service import apply_bot_changes
+from src.utils.logging_config import sync_id_var
 
 logger = logging.getLogger(__name__)
 
+# Columns copied from a freshly transformed bot onto the stored row
+_SYNCED_COLUMNS = frozenset(Bot.__table__.columns.keys()) - {"id", "created_at", "updated_at"}
 
-def extract_bot_data(raw_response: dict) -> list[Bot]:
+
+class BotListingTransformer:
+    """
+    Transforms raw bots into Bot models one at a time, so a listing can be
+    consumed while it is still being read. Bots that fail to transform are
+    logged and skipped.
+    """
+
+    def __init__(self, account_id: str = DEFAULT_ACCOUNT_ID):
+        self.account_id = account_id
+        self.bots: List[Bot] = []
+        self.received = 0  # raw bots seen, including skipped ones
+        # grid_ids of every raw bot, including skipped ones; None once a bot had no readable grid_id
+        self.listed_grid_ids: Optional[List[str]] = []
+
+    def __call__(self, raw_bot_data: dict) -> None:
+        self.received += 1
+        grid_id = listed_grid_id(raw_bot_data)
+        if grid_id is None:
+            self.listed_grid_ids = None
+        elif self.listed_grid_ids is not None:
+            self.listed_grid_ids.append(grid_id)
+        try:
+            self.bots.append(transform_bot_data(raw_bot_data, self.account_id))
+        except Exception as e:
+            logger.error("Failed to transform bot data: %s", e,
+                         extra={"bot_data": raw_bot_data})
+
+
+def listed_grid_id(raw_bot_data: dict) -> Optional[str]:
+    """grid_id of a raw bot, or None if the payload has none"""
+    try:
+        grid_id = raw_bot_data["future_grid"]["grid_id"]
+    except (KeyError, TypeError):
+        return None
+    return None if grid_id is None else str(grid_id)
+
+
+def _transform_listing(raw_response: dict, account_id: str) -> BotListingTransformer:
+    try:
+        bots_data = raw_response["result"]["bots"]
+        transformer = BotListingTransformer(account_id)
+        for bot_data in bots_data:
+            transformer(bot_data)
+        return transformer
+    except KeyError as e:
+        logger.error("Invalid API response structure: %s", e)
+        raise ValueError("Invalid API response structure") from e
+
+
+def extract_bot_data(raw_response: dict, account_id: str = DEFAULT_ACCOUNT_ID) -> list[Bot]:
     """
     Transform raw API response into list of Bot models.
     Args:
         raw_response: Raw API response containing bot data
+        account_id: Account the bots belong to
     Returns:
         List[Bot]: List of transformed bot models
     Raises:
         KeyError: If required fields are missing from the response
         ValueError: If data transformation fails
     """
-    try:
-        bots_data = raw_response["result"]["bots"]
-        transformed_bots = []
-        for bot_data in bots_data:
-            try:
-                transformed_bots.append(transform_bot_data(bot_data))
-            except Exception as e:
-                logger.error(f"Failed to transform bot data: {str(e)}",
-                             extra={"bot_data": bot_data})
-                continue
-        return transformed_bots
-    except KeyError as e:
-        logger.error(f"Invalid API response structure: {str(e)}")
-        raise ValueError("Invalid API response structure") from e
+    return _transform_listing(raw_response, account_id).bots
 
 
-def transform_bot_data(raw_bot_data: dict) -> Bot:
+def transform_bot_data(raw_bot_data: dict, account_id: str = DEFAULT_ACCOUNT_ID) -> Bot:
     """
     Transform raw bot data from API response into Bot model instance.
     Args:
         raw_bot_data (dict): Single bot data from API response
+        account_id (str): Account the bot belongs to
     Returns:
         Bot: SQLAlchemy Bot model instance
     """
@@ -52,6 +103,7 @@ def transform_bot_data(raw_bot_data: dict) -> Bot:
 
     return Bot(
         grid_id=grid_data["grid_id"],
+        account_id=account_id,
         bot_type=bot_type,
         symbol=grid_data["symbol"],
         status=grid_data["status"],
@@ -84,27 +136,124 @@ def transform_bot_data(raw_bot_data: dict) -> Bot:
     )
 
 
-async def sync_bots_with_db(db: Session, api_response: dict) -> List[Bot]:
+def store_raw_payloads(db: Session, payloads: Dict[str, bytes]) -> None:
+    """
+    Upsert compressed raw payloads by grid_id with two bulk statements.
+    Existing payloads are overwritten without being loaded.
+    """
+    if not payloads:
+        return
+    existing = set(db.execute(
+        select(BotRawData.grid_id).where(BotRawData.grid_id.in_(list(payloads)))
+    ).scalars())
+    updates = [{"grid_id": g, "payload": p} for g, p in payloads.items() if g in existing]
+    inserts = [{"grid_id": g, "payload": p} for g, p in payloads.items() if g not in existing]
+    if updates:
+        db.execute(update(BotRawData), updates)
+    if inserts:
+        db.execute(insert(BotRawData), inserts)
+
+
+async def sync_bots_with_db(
+        db: Session,
+        api_response: dict,
+        account_id: str = DEFAULT_ACCOUNT_ID,
+        complete_listing: bool = False,
+        on_changes: Optional[Callable[[List[BotChange]], None]] = None
+) -> List[Bot]:
     """
     Sync bots from API response with database.
     Args:
         db: SQLAlchemy database session
         api_response: Raw API response containing bot data
+        account_id: Account the bots belong to
+        complete_listing: The response holds every live bot of the account, so
+            running bots missing from it are marked as closed
+        on_changes: Called with the changes once they are committed
+    Returns:
+        List[Bot]: List of updated/created bot instances
+    """
+    token = sync_id_var.set(uuid.uuid4().hex)
+    try:
+        logger.info("Starting bot sync process for account %s", account_id)
+        try:
+            transformer = _transform_listing(api_response, account_id)
+        except Exception as e:
+            logger.error("Bot sync process failed: %s", e)
+            raise
+        logger.info("Transformed %d bots from API response", len(transformer.bots))
+        return _sync_bots(
+            db, transformer.bots, account_id, complete_listing, on_changes, transformer.listed_grid_ids
+        )
+    finally:
+        sync_id_var.reset(token)
+
+
+async def sync_transformed_bots(
+        db: Session,
+        new_bots: List[Bot],
+        account_id: str = DEFAULT_ACCOUNT_ID,
+        complete_listing: bool = False,
+        on_changes: Optional[Callable[[List[BotChange]], None]] = None,
+        listed_grid_ids: Optional[List[str]] = None
+) -> List[Bot]:
+    """
+    Sync bots already transformed from a listing (see BotListingTransformer).
+    Args:
+        db: SQLAlchemy database session
+        new_bots: Transformed bots of the listing
+        account_id: Account the bots belong to
+        complete_listing: The listing holds every live bot of the account
+        on_changes: Called with the changes once they are committed
+        listed_grid_ids: grid_ids of every bot of the listing, including those
+            that failed to transform; without them a complete listing is not
+            reconciled, as bots that were skipped would look closed
     Returns:
         List[Bot]: List of updated/created bot instances
     """
+    token = sync_id_var.set(uuid.uuid4().hex)
     try:
-        logger.info("Starting bot sync process")
-        new_bots = extract_bot_data(api_response)
-        logger.info(f"Transformed {len(new_bots)} bots from API response")
+        logger.info("Starting bot sync process for account %s with %d streamed bots", account_id, len(new_bots))
+        return _sync_bots(db, new_bots, account_id, complete_listing, on_changes, listed_grid_ids)
+    finally:
+        sync_id_var.reset(token)
+
+
+def _sync_bots(
+        db: Session,
+        new_bots: List[Bot],
+        account_id: str,
+        complete_listing: bool = False,
+        on_changes: Optional[Callable[[List[BotChange]], None]] = None,
+        listed_grid_ids: Optional[List[str]] = None
+) -> List[Bot]:
+    try:
+        changes: List[BotChange] = []
+        if complete_listing and listed_grid_ids is None:
+            logger.warning("Not reconciling account %s: the listing has bots without a grid_id", account_id)
+        elif complete_listing:
+            # Set-based close of bots that disappeared, committed with the upsert.
+            # Bots that failed to transform are still listed, so they stay open
+            changes.extend(reconcile_missing_bots(db, account_id, listed_grid_ids))
         if not new_bots:
             logger.warning("No bots to sync")
+            if changes:
+                apply_bot_changes(db, changes)
+                db.commit()
+                bump_data_version()
+                evaluate_alerts(changes)
+                if on_changes is not None:
+                    on_changes(changes)
             return None
+        # Archived bots are final; stale listings must not resurrect them
+        archived = archived_grid_ids(db, [bot.grid_id for bot in new_bots])
+        if archived:
+            new_bots = [bot for bot in new_bots if bot.grid_id not in archived]
         new_grid_ids = [bot.grid_id for bot in new_bots]
         try:
             existing_bots = db.query(Bot).filter(Bot.grid_id.in_(new_grid_ids)).all()
         except SQLAlchemyError as e:
-            logger.error(f"Database query failed: {str(e)}")
+            logger.error("Database query failed: %s", e)
             raise
 
         existing_bots_dict: Dict[str, Bot] = dict()
@@ -114,31 +263,48 @@ async def sync_bots_with_db(db: Session, api_response: dict) -> List[Bot]:
         updates = 0
         new_additions = 0
 
+        raw_payloads: Dict[str, bytes] = {}
+
         for bot in new_bots:
             try:
                 grid_id_str = str(bot.grid_id)
+                # Raw payloads are written in bulk below, not through the relationship
+                if bot.raw_record is not None:
+                    raw_payloads[grid_id_str] = bot.raw_record.payload
+                    bot.raw_record = None
                 if grid_id_str in existing_bots_dict:
                     existing_bot = existing_bots_dict[grid_id_str]
+                    old_values = bot_snapshot(existing_bot)
                     for key, value in bot.__dict__.items():
-                        if key != 'id' and not key.startswith('_'):
+                        if key in _SYNCED_COLUMNS:
                             setattr(existing_bot, key, value)
+                    changes.append(BotChange(grid_id_str, old_values, bot_snapshot(existing_bot)))
                     updates += 1
                 else:
                     db.add(bot)
+                    changes.append(BotChange(grid_id_str, None, bot_snapshot(bot)))
                     new_additions += 1
             except Exception as e:
-                logger.error(f"Failed to process bot: {str(e)}",
+                logger.error("Failed to process bot: %s", e,
                              extra={"bot": bot})
                 continue
         try:
+            store_raw_payloads(db, raw_payloads)
+            # Derived tables are updated from the deltas in the same transaction
+            apply_bot_changes(db, changes)
+            record_metric_samples(db, changes)
             db.commit()
-            logger.info(f"Synced {updates} updated and {new_additions} new bots with database")
+            bump_data_version()
+            evaluate_alerts(changes)
+            if on_changes is not None:
+                on_changes(changes)
+            logger.info("Synced %d updated and %d new bots with database", updates, new_additions)
         except SQLAlchemyError as e:
-            logger.error(f"Database commit failed: {str(e)}")
+            logger.error("Database commit failed: %s", e)
             db.rollback()
             raise
         return new_bots
     except Exception as e:
-        logger.error(f"Bot sync process failed: {str(e)}")
+        logger.error("Bot sync process failed: %s", e)
         db.rollback()
         raise
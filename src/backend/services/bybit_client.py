@@ -1,9 +1,11 @@
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Dict
+from typing import Any, AsyncIterator, Callable, Dict, Optional
 
 import httpx
 
 from src.backend.logger import logger
+from src.backend.services.json_stream import ArrayStreamParser
 
 
 @dataclass
@@ -22,8 +24,15 @@ class BybitClientError(Exception):
 
 
 class BybitClient:
-    def __init__(self, config: BybitClientConfig):
+    def __init__(self, config: BybitClientConfig, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            config: Account credentials and endpoint settings
+            http_client: Shared client whose connection pool is reused across calls.
+                When omitted, every call opens (and closes) its own client.
+        """
         self.config = config
+        self._http_client = http_client
         self._headers = {
             "accept": "*/*",
             "accept-language": "en-GB,en-US;q=0.9,en;q=0.8",
@@ -37,11 +46,29 @@ class BybitClient:
             "deviceId": config.device_id,
         }
 
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._http_client is not None:
+            yield self._http_client
+            return
+        async with httpx.AsyncClient() as client:
+            yield client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if any"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    def _timeout(self, timeout: Optional[float]) -> float:
+        """Timeout of one call: the configured one, shortened to what is left of the caller's budget"""
+        return self.config.timeout if timeout is None else min(timeout, self.config.timeout)
+
     async def get_trading_bots(
             self,
             page: int = 0,
             limit: int = 150,
-            status: int = 0
+            status: int = 0,
+            timeout: Optional[float] = None
     ) -> Dict:
         """
         Fetch trading bots from Bybit API.
@@ -50,6 +77,7 @@ class BybitClient:
             page: Page number for pagination
             limit: Number of items per page
             status: Bot status filter
+            timeout: Seconds the caller can still wait; caps the configured timeout
 
         Returns:
             Dict containing the API response
@@ -60,14 +88,14 @@ class BybitClient:
         endpoint = f"{self.config.base_url}/s1/bot/tradingbot/v1/list-all-bots"
         params = {"status": status, "page": page, "limit": limit}
 
-        async with httpx.AsyncClient() as client:
+        async with self._session() as client:
             try:
                 response = await client.post(
                     endpoint,
                     headers=self._headers,
                     cookies=self._cookies,
                     json=params,
-                    timeout=self.config.timeout
+                    timeout=self._timeout(timeout)
                 )
                 response.raise_for_status()
                 return response.json()
@@ -77,16 +105,79 @@ class BybitClient:
             except httpx.RequestError as e:
                 raise BybitClientError(f"Request failed: {str(e)}")
 
+    async def stream_trading_bots(
+            self,
+            on_bot: Callable[[Dict[str, Any]], None],
+            page: int = 0,
+            limit: int = 150,
+            status: int = 0,
+            timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        Fetch trading bots, handing each bot to on_bot as soon as it has been
+        read from the response. The body is parsed incrementally, so the whole
+        page never has to be held in memory.
+
+        Args:
+            on_bot: Called with every raw bot of result.bots, in order
+            page: Page number for pagination
+            limit: Number of items per page
+            status: Bot status filter
+            timeout: Seconds the caller can still wait; caps the configured timeout
+
+        Returns:
+            Dict containing the API response with result.bots emptied
+
+        Raises:
+            BybitClientError: If the API request fails or the response holds no bot list
+        """
+        endpoint = f"{self.config.base_url}/s1/bot/tradingbot/v1/list-all-bots"
+        params = {"status": status, "page": page, "limit": limit}
+
+        async with self._session() as client:
+            try:
+                async with client.stream(
+                        "POST",
+                        endpoint,
+                        headers=self._headers,
+                        cookies=self._cookies,
+                        json=params,
+                        timeout=self._timeout(timeout)
+                ) as response:
+                    if response.is_error:
+                        await response.aread()
+                    response.raise_for_status()
+                    parser = ArrayStreamParser("bots")
+                    async for chunk in response.aiter_text():
+                        for bot in parser.feed(chunk):
+                            on_bot(bot)
+                    envelope = parser.close()
+            except httpx.HTTPStatusError as e:
+                raise BybitClientError(f"API request failed: {e.response.text}")
+            except httpx.RequestError as e:
+                raise BybitClientError(f"Request failed: {str(e)}")
+            except ValueError as e:
+                raise BybitClientError(f"Invalid API response: {str(e)}")
+
+        if not parser.found:
+            # Without a bot list an empty page must not be mistaken for "no bots"
+            raise BybitClientError(
+                f"API response has no bot list: {envelope.get('ret_code')} {envelope.get('ret_msg')}",
+                code=envelope.get("ret_code")
+            )
+        return envelope
+
     async def check_api_status(self) -> Dict:
-        async with httpx.AsyncClient() as session:
+        async with self._session() as session:
             try:
                 response = await session.get(
                     f"{self.config.base_url}/v5/user/query-api",
-                    headers=self._headers
+                    headers=self._headers,
+                    timeout=self.config.timeout
                 )
                 response.raise_for_status()
                 data = response.json()
-                logger.debug(f"API status response: {data}")
+                logger.debug("API status response: %s", data)
                 return data
             except httpx.TimeoutException as e:
                 raise BybitClientError(f"Request timed out: {str(e)}", code=504)
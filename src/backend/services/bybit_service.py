@@ -1,24 +1,101 @@
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from src.backend.config import BybitAccount
 from src.backend.deps import get_settings
 from src.backend.logger import logger
 from src.backend.services.bybit_client import BybitClient, BybitClientConfig
 
+# (status, monotonic time of the check) of the last Bybit health check
+_health_cache: Optional[Tuple[str, float]] = None
+_health_lock = asyncio.Lock()
+
+# account_id -> client with its own pooled HTTP connections
+_account_clients: Dict[str, BybitClient] = {}
+
 
 def get_bybit_client() -> BybitClient:
-    """Create and configure Bybit client instance"""
+    """Create and configure Bybit client instance for the first configured account"""
     settings = get_settings()
+    accounts = settings.bybit_accounts()
+    if not accounts:
+        raise ValueError("No Bybit account configured")
     config = BybitClientConfig(
-        secure_token=settings.BYBIT_SECURE_TOKEN,
-        device_id=settings.BYBIT_DEVICE_ID
+        secure_token=accounts[0].secure_token,
+        device_id=accounts[0].device_id
     )
     return BybitClient(config)
 
 
-async def check_bybit_api_health() -> str:
-    """Check Bybit API health by validating API key status"""
+def get_account_client(account: BybitAccount) -> BybitClient:
+    """
+    Get the long-lived client for an account.
+    Each account keeps its own connection pool, so a slow account cannot
+    exhaust the connections used by the others.
+    """
+    client = _account_clients.get(account.account_id)
+    if client is None:
+        settings = get_settings()
+        limits = httpx.Limits(
+            max_connections=settings.BYBIT_MAX_CONNECTIONS_PER_ACCOUNT,
+            max_keepalive_connections=settings.BYBIT_MAX_CONNECTIONS_PER_ACCOUNT
+        )
+        client = BybitClient(
+            BybitClientConfig(secure_token=account.secure_token, device_id=account.device_id),
+            http_client=httpx.AsyncClient(limits=limits)
+        )
+        _account_clients[account.account_id] = client
+    return client
+
+
+async def close_account_clients() -> None:
+    """Close all pooled account clients (application shutdown)"""
+    clients = list(_account_clients.values())
+    _account_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def _check_bybit_api_status(timeout: Optional[float]) -> str:
     try:
         client = get_bybit_client()
-        response = await client.check_api_status()
+        response = await asyncio.wait_for(client.check_api_status(), timeout)
         return "healthy" if response.get("retCode") == 0 else "unhealthy"
+    except asyncio.TimeoutError:
+        logger.error("Bybit API health check timed out after %ss", timeout)
+        return "timeout"
     except Exception as e:
-        logger.error(f"Bybit API health check failed: {e}")
+        logger.error("Bybit API health check failed: %s", e)
         return "unhealthy"
+
+
+async def check_bybit_api_health(cache_ttl: float = 0.0, timeout: Optional[float] = None) -> str:
+    """
+    Check Bybit API health by validating API key status.
+    Args:
+        cache_ttl: Seconds a previous result (healthy or not) is reused
+        timeout: Seconds to wait for Bybit before reporting a timeout
+    Returns:
+        "healthy", "unhealthy" or "timeout"
+    """
+    global _health_cache
+
+    if _health_cache and time.monotonic() - _health_cache[1] < cache_ttl:
+        return _health_cache[0]
+
+    # Concurrent probes share a single upstream call
+    async with _health_lock:
+        if _health_cache and time.monotonic() - _health_cache[1] < cache_ttl:
+            return _health_cache[0]
+        status = await _check_bybit_api_status(timeout)
+        _health_cache = (status, time.monotonic())
+        return status
+
+
+def reset_bybit_health_cache() -> None:
+    """Forget the cached Bybit health status"""
+    global _health_cache
+    _health_cache = None
@@ -0,0 +1,221 @@
+import asyncio
+import json
+import logging
+from dataclasses import asdict, dataclass
+from typing import Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from src.backend.services.data_version import bump_data_version, set_change_publisher
+from src.backend.services.sync_lock import HOLDER_ID
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = "bot_data_changed"
+
+
+def change_payload(version: int) -> str:
+    """NOTIFY payload announcing a local data version"""
+    return json.dumps({"holder": HOLDER_ID, "version": version})
+
+
+def is_foreign_change(payload: str) -> bool:
+    """Whether a payload announces a change made by another process"""
+    try:
+        return json.loads(payload).get("holder") != HOLDER_ID
+    except (ValueError, AttributeError):
+        # Unknown senders (e.g. a manual NOTIFY) still mean the data changed
+        return True
+
+
+def apply_notifications(payloads: Iterable[str]) -> bool:
+    """
+    Invalidate local caches once for a batch of notifications.
+    Returns:
+        bool: Whether any came from another process
+    """
+    if any(is_foreign_change(payload) for payload in payloads):
+        bump_data_version(publish=False)
+        return True
+    return False
+
+
+class PgNotifyPublisher:
+    """Announces local data versions with pg_notify on a short autocommit transaction"""
+
+    def __init__(self, engine: Engine, channel: str = DEFAULT_CHANNEL):
+        self.engine = engine
+        self.channel = channel
+
+    def __call__(self, version: int) -> None:
+        with self.engine.connect() as connection:
+            connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.channel, "payload": change_payload(version)}
+            )
+            connection.commit()
+
+
+@dataclass
+class DataChangeListenerStats:
+    connected: bool = False
+    notifications: int = 0
+    invalidations: int = 0
+    reconnects: int = 0
+    last_error: Optional[str] = None
+
+
+def _close_quietly(connection) -> None:
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+class DataChangeListener:
+    """
+    LISTENs on the data change channel and bumps the local data version when
+    another process committed bot data, so in-process caches reload on their
+    next read. Runs on the event loop: the LISTEN connection's socket is
+    watched with add_reader, and a periodic ping on a worker thread detects
+    dead connections; a ping unanswered within ping_timeout counts as one.
+    After every (re)connect caches are invalidated once, as notifications
+    sent while disconnected are lost.
+    """
+
+    def __init__(self, engine: Engine, channel: str = DEFAULT_CHANNEL,
+                 reconnect_delay: float = 5.0, heartbeat: float = 30.0, ping_timeout: float = 10.0):
+        self.engine = engine
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.heartbeat = heartbeat
+        self.ping_timeout = ping_timeout
+        self.stats = DataChangeListenerStats()
+        self._task: Optional[asyncio.Task] = None
+
+    def _connect(self):
+        """Dedicated psycopg2 connection, detached from the pool, in autocommit LISTEN mode"""
+        pooled = self.engine.raw_connection()
+        pooled.detach()
+        connection = pooled.driver_connection
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return connection
+
+    def _on_readable(self, connection, lost: asyncio.Future) -> None:
+        try:
+            connection.poll()
+        except Exception as e:
+            if not lost.done():
+                lost.set_exception(e)
+            return
+        payloads = []
+        while connection.notifies:
+            payloads.append(connection.notifies.pop(0).payload)
+        self.stats.notifications += len(payloads)
+        if payloads and apply_notifications(payloads):
+            self.stats.invalidations += 1
+
+    async def _ping(self, connection) -> None:
+        """
+        Raises:
+            ConnectionError: If the server does not answer within ping_timeout
+        """
+        def ping() -> None:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+
+        try:
+            # On a half-open connection the blocking call only returns once the kernel gives up
+            await asyncio.wait_for(asyncio.to_thread(ping), self.ping_timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError(f"Heartbeat unanswered for {self.ping_timeout:g} s") from None
+
+    async def _listen(self, connection) -> None:
+        loop = asyncio.get_running_loop()
+        lost = loop.create_future()
+        fd = connection.fileno()
+        loop.add_reader(fd, self._on_readable, connection, lost)
+        try:
+            while True:
+                done, _ = await asyncio.wait([lost], timeout=self.heartbeat)
+                if done:
+                    lost.result()
+                # The connection must not be polled while the ping thread uses it
+                loop.remove_reader(fd)
+                await self._ping(connection)
+                loop.add_reader(fd, self._on_readable, connection, lost)
+                # Pings can carry notifications in; drain them too
+                self._on_readable(connection, lost)
+        finally:
+            loop.remove_reader(fd)
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncio.to_thread(self._connect)
+                self.stats.connected = True
+                bump_data_version(publish=False)
+                logger.info("Listening for data changes on channel %s", self.channel)
+                await self._listen(connection)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats.last_error = str(e)
+                logger.warning("Data change listener disconnected: %s", e)
+            finally:
+                self.stats.connected = False
+                if connection is not None:
+                    # Closed off the loop: an abandoned ping may still hold the connection
+                    asyncio.get_running_loop().run_in_executor(None, _close_quietly, connection)
+            self.stats.reconnects += 1
+            await asyncio.sleep(self.reconnect_delay)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> dict:
+        return {"channel": self.channel, **asdict(self.stats)}
+
+
+_listener: Optional[DataChangeListener] = None
+
+
+def get_data_change_listener() -> Optional[DataChangeListener]:
+    return _listener
+
+
+def start_data_change_notifications(engine: Engine, channel: str = DEFAULT_CHANNEL) -> Optional[DataChangeListener]:
+    """
+    Publish local data changes and listen for those of other processes.
+    Only Postgres has LISTEN/NOTIFY; elsewhere caches rely on their TTLs.
+    """
+    global _listener
+    if engine.dialect.name != "postgresql":
+        logger.info("Data change notifications need Postgres; relying on cache TTLs")
+        return None
+    set_change_publisher(PgNotifyPublisher(engine, channel))
+    _listener = DataChangeListener(engine, channel)
+    _listener.start()
+    return _listener
+
+
+async def stop_data_change_notifications() -> None:
+    global _listener
+    set_change_publisher(None)
+    listener, _listener = _listener, None
+    if listener is not None:
+        await listener.stop()
@@ -0,0 +1,45 @@
+import logging
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Incremented whenever bot data is committed; in-process caches compare against it
+_version = 0
+_lock = threading.Lock()
+# Tells other processes about local changes (Postgres NOTIFY), when configured
+_publisher: Optional[Callable[[int], None]] = None
+
+
+def get_data_version() -> int:
+    """Current version of the bot data as seen by this process"""
+    return _version
+
+
+def bump_data_version(publish: bool = True) -> int:
+    """
+    Mark bot data as changed. Call after the commit that changed it.
+    Args:
+        publish: Announce the change to other processes; False when applying
+            a change announced by another process
+    Returns:
+        int: The new version
+    """
+    global _version
+    with _lock:
+        _version += 1
+        version = _version
+    if publish and _publisher is not None:
+        try:
+            _publisher(version)
+        except Exception as e:
+            # Other processes still catch up through their cache TTLs
+            logger.error("Publishing data version %d failed: %s", version, e)
+    return version
+
+
+def set_change_publisher(publisher: Optional[Callable[[int], None]]) -> None:
+    """Install (or with None, remove) the hook announcing local changes to other processes"""
+    global _publisher
+    _publisher = publisher
+
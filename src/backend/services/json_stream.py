@@ -0,0 +1,79 @@
+import json
+import re
+from typing import Any, Dict, List
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"\s*")
+
+
+class ArrayStreamParser:
+    """
+    Incremental parser for a JSON document holding one large array under key.
+    Text is fed in chunks as it arrives; elements of the array are returned
+    as soon as they are complete, so only the unparsed tail of the array and
+    the (small) rest of the document are ever held in memory. close() parses
+    the rest of the document with the array left empty.
+    """
+
+    def __init__(self, key: str):
+        # The key must not be preceded by a backslash, i.e. not sit inside a string
+        self._start = re.compile(r'(?<!\\)"%s"\s*:\s*\[' % re.escape(key))
+        self._buffer = ""
+        self._head = ""  # document text up to and including the opening "["
+        self._state = "head"  # head -> items -> tail
+        self.items_parsed = 0
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Add text and return the array elements completed by it"""
+        self._buffer += chunk
+        if self._state == "head":
+            match = self._start.search(self._buffer)
+            if match is None:
+                return []
+            self._head = self._buffer[:match.end()]
+            self._buffer = self._buffer[match.end():]
+            self._state = "items"
+        if self._state == "items":
+            return self._parse_items()
+        return []
+
+    def _parse_items(self) -> List[Any]:
+        items = []
+        buffer, pos = self._buffer, 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer) and buffer[pos] == ",":
+                pos = _WHITESPACE.match(buffer, pos + 1).end()
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._state = "tail"
+                break
+            try:
+                item, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element not complete yet
+                break
+            items.append(item)
+            pos = end
+        self._buffer = buffer[pos:]
+        self.items_parsed += len(items)
+        return items
+
+    @property
+    def found(self) -> bool:
+        """Whether the array was seen in the document"""
+        return self._state != "head"
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Parse the rest of the document once all text has been fed.
+        Returns:
+            The document with the streamed array replaced by an empty list
+            (the whole document when the array was not found)
+        Raises:
+            ValueError: The document is truncated or invalid
+        """
+        if self._state == "items":
+            raise ValueError("Document ended inside the array")
+        return json.loads(self._head + self._buffer)
@@ -0,0 +1,296 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import aiohttp
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from src.backend.models import Bot
+from src.backend.models.bot import RUNNING_STATUS
+from src.backend.services.bot_cache import get_bot_cache
+from src.backend.services.risk_service import get_risk_engine
+
+logger = logging.getLogger(__name__)
+
+TICKER_TOPIC = "tickers."
+SUBSCRIBE_BATCH = 10  # Bybit accepts at most 10 args per subscribe request
+
+
+@dataclass
+class PriceStreamStats:
+    """Counters exposed on /debug/price-stream"""
+    connected: bool = False
+    connects: int = 0
+    messages: int = 0
+    flushes: int = 0
+    flushed_symbols: int = 0
+    flushed_rows: int = 0
+    last_flush_ms: float = 0.0
+    subscribed_symbols: int = 0
+
+
+class PriceTable:
+    """Latest (mark_price, last_price) per symbol, with the symbols changed since the last drain"""
+
+    def __init__(self):
+        self._prices: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        self._dirty: Set[str] = set()
+
+    def update(self, symbol: str, mark_price: Optional[float] = None, last_price: Optional[float] = None) -> None:
+        """Merge a ticker update; deltas carry only the fields that changed"""
+        old_mark, old_last = self._prices.get(symbol, (None, None))
+        new = (
+            mark_price if mark_price is not None else old_mark,
+            last_price if last_price is not None else old_last
+        )
+        if new != (old_mark, old_last):
+            self._prices[symbol] = new
+            self._dirty.add(symbol)
+
+    def get(self, symbol: str) -> Tuple[Optional[float], Optional[float]]:
+        return self._prices.get(symbol, (None, None))
+
+    def drain(self) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """Prices of the symbols changed since the previous drain"""
+        changed = {symbol: self._prices[symbol] for symbol in self._dirty}
+        self._dirty.clear()
+        return changed
+
+    def mark_dirty(self, symbols: Iterable[str]) -> None:
+        self._dirty.update(symbol for symbol in symbols if symbol in self._prices)
+
+    def discard(self, symbols: Iterable[str]) -> None:
+        for symbol in symbols:
+            self._prices.pop(symbol, None)
+            self._dirty.discard(symbol)
+
+
+def running_symbols(db: Session) -> Set[str]:
+    """Distinct symbols of running bots"""
+    return set(db.execute(select(Bot.symbol).where(Bot.status == RUNNING_STATUS).distinct()).scalars())
+
+
+def flush_prices(db: Session, prices: Dict[str, Tuple[Optional[float], Optional[float]]]) -> int:
+    """
+    Write the latest prices onto running bots with a single executemany UPDATE.
+    Args:
+        db: Database session
+        prices: symbol -> (mark_price, last_price)
+    Returns:
+        int: Number of bot rows updated
+    """
+    table = Bot.__table__
+    rows = [
+        {"b_symbol": symbol, "b_mark": mark, "b_last": last}
+        for symbol, (mark, last) in prices.items()
+        if mark is not None and last is not None
+    ]
+    if not rows:
+        return 0
+    stmt = (
+        update(table)
+        .where(table.c.symbol == bindparam("b_symbol"), table.c.status == RUNNING_STATUS)
+        .values(mark_price=bindparam("b_mark"), current_price=bindparam("b_last"))
+    )
+    try:
+        result = db.connection().execute(stmt, rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    if result.rowcount:
+        # Only prices moved: patch them into the in-process caches instead of
+        # bumping the data version, which would reload the whole fleet
+        patched = {row["b_symbol"]: (row["b_mark"], row["b_last"]) for row in rows}
+        get_bot_cache().apply_prices(patched)
+        get_risk_engine().apply_prices(patched)
+    return result.rowcount
+
+
+def parse_ticker(message: dict) -> Optional[Tuple[str, Optional[float], Optional[float]]]:
+    """(symbol, mark_price, last_price) of a ticker snapshot or delta, None for other messages"""
+    topic = message.get("topic") or ""
+    data = message.get("data")
+    if not topic.startswith(TICKER_TOPIC) or not isinstance(data, dict):
+        return None
+    symbol = data.get("symbol") or topic[len(TICKER_TOPIC):]
+
+    def _price(key: str) -> Optional[float]:
+        value = data.get(key)
+        return float(value) if value not in (None, "") else None
+
+    return symbol, _price("markPrice"), _price("lastPrice")
+
+
+class PriceStreamer:
+    """
+    Bybit public ticker consumer keeping mark/current prices of running bots fresh.
+    Subscribes to the symbols of running bots, keeps the latest prices in a
+    PriceTable and flushes changed symbols to the database every flush_interval.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            session_factory: Callable[[], Session],
+            flush_interval: float = 5.0,
+            symbol_refresh_interval: float = 60.0,
+            reconnect_delay: float = 5.0,
+            heartbeat: float = 20.0
+    ):
+        self.url = url
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.symbol_refresh_interval = symbol_refresh_interval
+        self.reconnect_delay = reconnect_delay
+        self.heartbeat = heartbeat
+        self.prices = PriceTable()
+        self.stats = PriceStreamStats()
+        self._subscribed: Set[str] = set()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Run the consumer and the flusher as background tasks"""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._consume_forever(), name="price-stream"),
+            asyncio.create_task(self._flush_forever(), name="price-flush"),
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the background tasks and write out any pending prices"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write changed prices to the database off the event loop"""
+        changed = self.prices.drain()
+        if not changed:
+            return 0
+        started = time.perf_counter()
+        try:
+            rows = await asyncio.to_thread(self._flush_sync, changed)
+        except Exception as e:
+            logger.error("Flushing %d prices failed: %s", len(changed), e)
+            # The table still holds the latest prices; retry them next time
+            self.prices.mark_dirty(changed)
+            return 0
+        self.stats.flushes += 1
+        self.stats.flushed_symbols += len(changed)
+        self.stats.flushed_rows += rows
+        self.stats.last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+        logger.debug("Flushed prices of %d symbols to %d bots", len(changed), rows)
+        return rows
+
+    def _flush_sync(self, changed) -> int:
+        db = self.session_factory()
+        try:
+            return flush_prices(db, changed)
+        finally:
+            db.close()
+
+    def _running_symbols_sync(self) -> Set[str]:
+        db = self.session_factory()
+        try:
+            return running_symbols(db)
+        finally:
+            db.close()
+
+    async def _flush_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def _consume_forever(self) -> None:
+        while True:
+            try:
+                await self._consume()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Price stream disconnected: %s", e)
+            self.stats.connected = False
+            self._subscribed.clear()
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _consume(self) -> None:
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(self.url, heartbeat=self.heartbeat) as ws:
+                self.stats.connected = True
+                self.stats.connects += 1
+                logger.info("Price stream connected to %s", self.url)
+                await self._resubscribe(ws)
+                next_refresh = time.monotonic() + self.symbol_refresh_interval
+                while True:
+                    timeout = max(next_refresh - time.monotonic(), 0)
+                    try:
+                        msg = await ws.receive(timeout=timeout)
+                    except asyncio.TimeoutError:
+                        await self._resubscribe(ws)
+                        next_refresh = time.monotonic() + self.symbol_refresh_interval
+                        continue
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        self._handle(msg.data)
+                    elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.ERROR):
+                        return
+
+    async def _resubscribe(self, ws) -> None:
+        """Follow the set of running bot symbols: subscribe new ones, drop stale ones"""
+        wanted = await asyncio.to_thread(self._running_symbols_sync)
+        added = sorted(wanted - self._subscribed)
+        removed = sorted(self._subscribed - wanted)
+        for op, symbols in (("subscribe", added), ("unsubscribe", removed)):
+            for i in range(0, len(symbols), SUBSCRIBE_BATCH):
+                await ws.send_str(json.dumps({
+                    "op": op,
+                    "args": [TICKER_TOPIC + symbol for symbol in symbols[i:i + SUBSCRIBE_BATCH]]
+                }))
+        self.prices.discard(removed)
+        self._subscribed = wanted
+        self.stats.subscribed_symbols = len(wanted)
+        if added or removed:
+            logger.info("Price stream follows %d symbols (+%d, -%d)", len(wanted), len(added), len(removed))
+
+    def _handle(self, raw: str) -> None:
+        try:
+            ticker = parse_ticker(json.loads(raw))
+        except (ValueError, TypeError) as e:
+            logger.warning("Ignoring malformed price message: %s", e)
+            return
+        if ticker is None:
+            return
+        self.stats.messages += 1
+        self.prices.update(*ticker)
+
+    def status(self) -> dict:
+        return {**asdict(self.stats), "url": self.url}
+
+
+_streamer: Optional[PriceStreamer] = None
+
+
+def get_price_streamer() -> Optional[PriceStreamer]:
+    """The running streamer, if price streaming is enabled"""
+    return _streamer
+
+
+def start_price_stream(streamer: PriceStreamer) -> PriceStreamer:
+    global _streamer
+    _streamer = streamer
+    streamer.start()
+    return streamer
+
+
+async def stop_price_stream() -> None:
+    global _streamer
+    streamer, _streamer = _streamer, None
+    if streamer is not None:
+        await streamer.stop()
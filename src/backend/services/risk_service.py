@@ -0,0 +1,215 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.backend.models import Bot
+from src.backend.models.bot import RUNNING_STATUS
+from src.backend.services.data_version import get_data_version
+
+logger = logging.getLogger(__name__)
+
+RISK_INPUTS = (
+    Bot.grid_id, Bot.symbol, Bot.leverage, Bot.total_investment, Bot.current_price,
+    Bot.liq_price, Bot.min_price, Bot.max_price, Bot.cell_num
+)
+
+
+@dataclass
+class FleetRiskArrays:
+    """Per-bot inputs and risk metrics as aligned NumPy arrays"""
+    grid_id: np.ndarray
+    symbol: np.ndarray
+    leverage: np.ndarray
+    total_investment: np.ndarray
+    current_price: np.ndarray
+    liq_price: np.ndarray
+    liq_distance_pct: np.ndarray  # NaN without a liquidation price
+    grid_position: np.ndarray  # NaN for an empty band
+    grid_cell: np.ndarray  # -1 for an empty band
+    out_of_range: np.ndarray
+    exposure: np.ndarray
+    data_version: int
+    computed_ms: float
+
+    def __len__(self) -> int:
+        return len(self.grid_id)
+
+
+def load_risk_inputs(db: Session) -> Dict[str, np.ndarray]:
+    """Risk input columns of the running bots, one array per column"""
+    rows = db.execute(select(*RISK_INPUTS).where(Bot.status == RUNNING_STATUS)).all()
+    columns = list(zip(*rows)) if rows else [()] * len(RISK_INPUTS)
+    names = [column.key for column in RISK_INPUTS]
+    arrays = {}
+    for name, values in zip(names, columns):
+        dtype = object if name in ("grid_id", "symbol") else float
+        arrays[name] = np.asarray(values, dtype=dtype)
+    return arrays
+
+
+def compute_fleet_risk(inputs: Dict[str, np.ndarray], data_version: int = 0) -> FleetRiskArrays:
+    """
+    Vectorized liquidation distance, grid position and exposure for every bot.
+    Args:
+        inputs: Column arrays as returned by load_risk_inputs
+        data_version: Version of the data the inputs were read at
+    """
+    started = time.perf_counter()
+    price = inputs["current_price"]
+    liq = inputs["liq_price"]
+    low, high = inputs["min_price"], inputs["max_price"]
+    cells = inputs["cell_num"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        has_liq = (liq > 0) & (price > 0)
+        liq_distance = np.where(has_liq, np.abs(price - liq) / price * 100, np.nan)
+
+        band = high - low
+        has_band = band > 0
+        position = np.where(has_band, (price - low) / band, np.nan)
+    out_of_range = has_band & ((price < low) | (price > high))
+    cell = np.where(
+        has_band & (cells > 0),
+        np.clip(np.floor(np.nan_to_num(position) * cells), 0, np.maximum(cells - 1, 0)),
+        -1
+    ).astype(np.int64)
+
+    return FleetRiskArrays(
+        grid_id=inputs["grid_id"],
+        symbol=inputs["symbol"],
+        leverage=inputs["leverage"],
+        total_investment=inputs["total_investment"],
+        current_price=price,
+        liq_price=liq,
+        liq_distance_pct=liq_distance,
+        grid_position=position,
+        grid_cell=cell,
+        out_of_range=out_of_range,
+        exposure=inputs["total_investment"] * inputs["leverage"],
+        data_version=data_version,
+        computed_ms=round((time.perf_counter() - started) * 1000, 3)
+    )
+
+
+def summarize_fleet_risk(risk: FleetRiskArrays, near_liquidation_pct: float = 10.0, top: Optional[int] = 50) -> dict:
+    """
+    Fleet aggregates plus the bots closest to liquidation.
+    Args:
+        risk: Computed risk arrays
+        near_liquidation_pct: Liquidation distance counted as near
+        top: Number of bots to include (None = all)
+    """
+    total_investment = float(risk.total_investment.sum())
+    total_exposure = float(risk.exposure.sum())
+    has_liq = ~np.isnan(risk.liq_distance_pct)
+    liq_exposure = risk.exposure[has_liq]
+    weighted_distance = (
+        float(np.dot(risk.liq_distance_pct[has_liq], liq_exposure) / liq_exposure.sum())
+        if liq_exposure.sum() > 0 else None
+    )
+
+    symbols, symbol_index = np.unique(risk.symbol.astype(str), return_inverse=True)
+    symbol_counts = np.bincount(symbol_index, minlength=len(symbols))
+    symbol_investment = np.bincount(symbol_index, weights=risk.total_investment, minlength=len(symbols))
+    symbol_exposure = np.bincount(symbol_index, weights=risk.exposure, minlength=len(symbols))
+
+    # NaN distances (no liquidation price) sort last
+    order = np.argsort(np.where(has_liq, risk.liq_distance_pct, np.inf), kind="stable")
+    if top is not None:
+        order = order[:top]
+
+    def _optional(value: float) -> Optional[float]:
+        return None if np.isnan(value) else float(value)
+
+    return {
+        "bot_count": len(risk),
+        "total_investment": total_investment,
+        "total_exposure": total_exposure,
+        "effective_leverage": total_exposure / total_investment if total_investment > 0 else 0.0,
+        "weighted_liq_distance_pct": weighted_distance,
+        "min_liq_distance_pct": float(risk.liq_distance_pct[has_liq].min()) if has_liq.any() else None,
+        "near_liquidation_threshold_pct": near_liquidation_pct,
+        "near_liquidation_count": int((risk.liq_distance_pct[has_liq] < near_liquidation_pct).sum()),
+        "out_of_range_count": int(risk.out_of_range.sum()),
+        "data_version": risk.data_version,
+        "computed_ms": risk.computed_ms,
+        "by_symbol": [
+            {
+                "symbol": str(symbol),
+                "bot_count": int(count),
+                "total_investment": float(investment),
+                "exposure": float(exposure),
+            }
+            for symbol, count, investment, exposure in zip(symbols, symbol_counts, symbol_investment, symbol_exposure)
+        ],
+        "bots": [
+            {
+                "grid_id": risk.grid_id[i],
+                "symbol": risk.symbol[i],
+                "leverage": int(risk.leverage[i]),
+                "current_price": float(risk.current_price[i]),
+                "liq_price": float(risk.liq_price[i]),
+                "liq_distance_pct": _optional(risk.liq_distance_pct[i]),
+                "grid_position": _optional(risk.grid_position[i]),
+                "grid_cell": int(risk.grid_cell[i]) if risk.grid_cell[i] >= 0 else None,
+                "out_of_range": bool(risk.out_of_range[i]),
+                "exposure": float(risk.exposure[i]),
+            }
+            for i in order
+        ],
+    }
+
+
+class RiskEngine:
+    """
+    Keeps the last fleet risk computation and redoes it only after the bot
+    data version changes (or after ttl, for writes made by other processes).
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._result: Optional[FleetRiskArrays] = None
+        self._inputs: Optional[Dict[str, np.ndarray]] = None
+        self._computed_at = 0.0
+
+    def get(self, db: Session) -> FleetRiskArrays:
+        result = self._result
+        if (
+            result is not None
+            and result.data_version == get_data_version()
+            and time.monotonic() - self._computed_at < self.ttl
+        ):
+            return result
+        # Read the version first: a change committed during the load leaves the result stale
+        version = get_data_version()
+        inputs = load_risk_inputs(db)
+        result = compute_fleet_risk(inputs, version)
+        self._result, self._inputs, self._computed_at = result, inputs, time.monotonic()
+        logger.debug("Fleet risk computed for %d bots in %.3f ms", len(result), result.computed_ms)
+        return result
+
+    def apply_prices(self, prices: Dict[str, Tuple[float, float]]) -> None:
+        """
+        Recompute the last result in memory with streamed current prices
+        (symbol -> (mark_price, current_price)), keeping its version and age.
+        """
+        result, inputs = self._result, self._inputs
+        if result is None or inputs is None or not prices:
+            return
+        current_price = inputs["current_price"].copy()
+        for symbol, (_, price) in prices.items():
+            current_price[inputs["symbol"] == symbol] = price
+        inputs = {**inputs, "current_price": current_price}
+        self._result, self._inputs = compute_fleet_risk(inputs, result.data_version), inputs
+
+
+_risk_engine = RiskEngine()
+
+
+def get_risk_engine() -> RiskEngine:
+    return _risk_engine
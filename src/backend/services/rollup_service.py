@@ -0,0 +1,116 @@
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.backend.models import Bot, SymbolRollup
+from src.backend.models.bot import RUNNING_STATUS
+from src.backend.services.bot_changes import BotChange
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_FIELDS = ("bot_count", "running_count", "total_investment", "total_pnl", "apr_sum")
+# Bot fields a rollup row depends on
+ROLLUP_INPUTS = {"symbol", "status", "total_investment", "pnl", "total_apr"}
+
+
+def _contribution(values: Dict[str, Any]) -> Dict[str, float]:
+    """What a single bot adds to its symbol's rollup row"""
+    return {
+        "bot_count": 1,
+        "running_count": 1 if values["status"] == RUNNING_STATUS else 0,
+        "total_investment": values["total_investment"] or 0.0,
+        "total_pnl": values["pnl"] or 0.0,
+        "apr_sum": values["total_apr"] or 0.0,
+    }
+
+
+def compute_symbol_deltas(changes: Iterable[BotChange]) -> Dict[str, Dict[str, float]]:
+    """Net change per symbol: remove each bot's old contribution, add its new one"""
+    deltas: Dict[str, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(ROLLUP_FIELDS, 0))
+    for change in changes:
+        if not change.changed_fields & ROLLUP_INPUTS:
+            continue
+        if change.old is not None:
+            for name, value in _contribution(change.old).items():
+                deltas[change.old["symbol"]][name] -= value
+        if change.new is not None:
+            for name, value in _contribution(change.new).items():
+                deltas[change.new["symbol"]][name] += value
+    return {symbol: delta for symbol, delta in deltas.items() if any(delta.values())}
+
+
+def apply_bot_changes(db: Session, changes: Iterable[BotChange]) -> int:
+    """
+    Apply the rollup deltas of a sync to symbol_rollups in the caller's transaction.
+    Deltas are added in the database (INSERT ... ON CONFLICT DO UPDATE SET
+    col = col + delta) rather than read and written back, so replicas syncing
+    different accounts that share a symbol cannot lose each other's updates.
+    Returns:
+        int: Number of symbol rows touched
+    """
+    deltas = compute_symbol_deltas(changes)
+    if not deltas:
+        return 0
+
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    table = SymbolRollup.__table__
+    # Sorted, so concurrent syncs lock shared rows in the same order
+    stmt = dialect.insert(table).values([
+        {"symbol": symbol, **deltas[symbol]} for symbol in sorted(deltas)
+    ])
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[table.c.symbol],
+        set_={
+            **{name: table.c[name] + stmt.excluded[name] for name in ROLLUP_FIELDS},
+            "updated_at": func.now()
+        }
+    ))
+    # Last bot of the symbol is gone
+    db.execute(delete(table).where(table.c.symbol.in_(list(deltas)), table.c.bot_count <= 0))
+    logger.debug("Applied rollup deltas for %d symbols", len(deltas))
+    return len(deltas)
+
+
+def rebuild_symbol_rollups(db: Session) -> int:
+    """
+    Recompute every rollup row from the bots table (full scan).
+    Used after bulk loads and to correct floating point drift.
+    Returns:
+        int: Number of symbols
+    """
+    stmt = select(
+        Bot.symbol,
+        func.count(Bot.id),
+        func.sum(case((Bot.status == RUNNING_STATUS, 1), else_=0)),
+        func.coalesce(func.sum(Bot.total_investment), 0.0),
+        func.coalesce(func.sum(Bot.pnl), 0.0),
+        func.coalesce(func.sum(Bot.total_apr), 0.0),
+    ).group_by(Bot.symbol)
+    aggregates = db.execute(stmt).all()
+
+    db.execute(delete(SymbolRollup))
+    db.add_all(
+        SymbolRollup(
+            symbol=symbol,
+            bot_count=bot_count,
+            running_count=running_count,
+            total_investment=total_investment,
+            total_pnl=total_pnl,
+            apr_sum=apr_sum
+        )
+        for symbol, bot_count, running_count, total_investment, total_pnl, apr_sum in aggregates
+    )
+    db.commit()
+    return len(aggregates)
+
+
+def list_symbol_rollups(db: Session, symbol: Optional[str] = None) -> List[SymbolRollup]:
+    """Rollup rows, one per symbol"""
+    stmt = select(SymbolRollup).order_by(SymbolRollup.symbol)
+    if symbol is not None:
+        stmt = stmt.where(SymbolRollup.symbol == symbol)
+    return list(db.execute(stmt).scalars())
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from typing import Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEADLINE_EXCEEDED = "Deadline exceeded"
+
+
+class SyncAborted(Exception):
+    """The sync was cancelled or ran out of time before a step could finish"""
+
+
+class SyncDeadline:
+    """
+    Time budget of a sync, plus a switch to stop it early (e.g. when the
+    client waiting for it disconnects). Calls to Bybit run through guard(),
+    which abandons them at the deadline or on cancellation; pages fetched
+    before that are still written.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: Seconds from now until the deadline; None for no deadline
+        """
+        self.expires_at: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        self.reason: Optional[str] = None  # set once cancelled
+        self._cancelled = asyncio.Event()
+
+    def extend(self, timeout: Optional[float]) -> None:
+        """Push the deadline out to timeout seconds from now, if that is later"""
+        if timeout is None:
+            self.expires_at = None
+        elif self.expires_at is not None:
+            self.expires_at = max(self.expires_at, time.monotonic() + timeout)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None without a deadline"""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def cancel(self, reason: str = "Cancelled") -> None:
+        if self.reason is None:
+            self.reason = reason
+            self._cancelled.set()
+
+    def check(self) -> None:
+        """
+        Raises:
+            SyncAborted: If the sync was cancelled or its deadline has passed
+        """
+        if self.reason is not None:
+            raise SyncAborted(self.reason)
+        if self.expired:
+            raise SyncAborted(DEADLINE_EXCEEDED)
+
+    async def guard(self, awaitable: Awaitable[T]) -> T:
+        """
+        Await a step, abandoning it at the deadline or on cancellation.
+        Raises:
+            SyncAborted: If the step was abandoned (or could not start)
+        """
+        self.check()
+        task = asyncio.ensure_future(awaitable)
+        watcher = asyncio.ensure_future(self._cancelled.wait())
+        try:
+            await asyncio.wait({task, watcher}, timeout=self.remaining(), return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            task.cancel()
+            raise
+        finally:
+            watcher.cancel()
+        if task.done():
+            return task.result()
+        task.cancel()
+        # Let the step release its connection before moving on
+        await asyncio.wait({task})
+        self.check()
+        raise SyncAborted(DEADLINE_EXCEEDED)
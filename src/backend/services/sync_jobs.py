@@ -0,0 +1,395 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.backend.config import BybitAccount, Settings
+from src.backend.exceptions import SyncQueueFullError
+from src.backend.models import SyncJob
+from src.backend.services.account_sync import AccountSyncResult, sync_accounts
+from src.backend.services.analytics_service import prune_metric_history
+from src.backend.services.archive_service import archive_closed_bots
+from src.backend.services.bot_cache import get_bot_cache
+from src.backend.services.sync_deadline import SyncDeadline
+from src.backend.services.sync_lock import HOLDER_ID
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_CANCELLED = "cancelled"
+FINISHED_STATUSES = ("success", "partial", "failed", "skipped", JOB_CANCELLED)
+_KEPT_OUTCOMES = 100  # outcomes of finished jobs kept for waiters that arrive late
+
+
+@dataclass(frozen=True)
+class SyncRequest:
+    """Parameters of one update; identical queued requests share a job"""
+    page: int = 0
+    limit: int = 150
+    status: int = 0
+    account_id: Optional[str] = None
+    keep_response: bool = False
+
+
+@dataclass
+class SyncOutcome:
+    """Final state of a sync job, as handed to callers waiting on it"""
+    job_id: str
+    status: str
+    results: List[AccountSyncResult] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def synced_bots_count(self) -> int:
+        return sum(r.synced_bots_count for r in self.results)
+
+
+def sync_status(results: List[AccountSyncResult]) -> str:
+    """Overall status of a sync from its per-account results"""
+    if results and all(r.status == "skipped" for r in results):
+        return "skipped"
+    succeeded = sum(r.status == "success" for r in results)
+    if not succeeded:
+        return "failed"
+    return "success" if succeeded == len(results) else "partial"
+
+
+def sync_summary(outcome: SyncOutcome, include_raw: bool = False) -> dict:
+    """Compact response body of a finished sync"""
+    summary = {
+        "job_id": outcome.job_id,
+        "sync_status": outcome.status,
+        "synced_bots_count": outcome.synced_bots_count,
+        "accounts": [
+            {
+                "account_id": r.account_id,
+                "status": r.status,
+                "synced_bots_count": r.synced_bots_count,
+                "error": r.error
+            }
+            for r in outcome.results
+        ]
+    }
+    if include_raw:
+        summary["api_response"] = {r.account_id: r.api_response for r in outcome.results if r.api_response is not None}
+    return summary
+
+
+async def run_sync(
+        db: Session,
+        settings: Settings,
+        accounts: List[BybitAccount],
+        request: SyncRequest,
+        on_result: Optional[Callable[[AccountSyncResult], None]] = None,
+        deadline: Optional[SyncDeadline] = None
+) -> List[AccountSyncResult]:
+    """
+    Sync the accounts, then archive closed bots, prune the metric history and
+    refresh the bot cache when anything was synced.
+    """
+    results = await sync_accounts(
+        db, accounts, page=request.page, limit=request.limit, status=request.status,
+        max_concurrency=settings.SYNC_MAX_CONCURRENCY,
+        lock_wait_timeout=settings.SYNC_LOCK_WAIT_SECONDS,
+        lock_ttl=settings.SYNC_LOCK_TTL_SECONDS,
+        keep_response=request.keep_response,
+        on_result=on_result,
+        deadline=deadline
+    )
+    if not any(r.status == "success" for r in results):
+        return results
+    if settings.ARCHIVE_ENABLED:
+        try:
+            archive_closed_bots(db, settings.ARCHIVE_BATCH_SIZE, settings.ARCHIVE_MIN_AGE_SECONDS)
+        except SQLAlchemyError as e:
+            # The sync itself is committed; archiving is retried on the next update
+            logger.error("Archiving closed bots failed: %s", e)
+    try:
+        prune_metric_history(db, settings.METRIC_HISTORY_RETENTION_DAYS)
+    except SQLAlchemyError as e:
+        logger.error("Pruning metric history failed: %s", e)
+    if settings.BOT_CACHE_ENABLED:
+        # Swap in the synced fleet now rather than on the next read
+        get_bot_cache().refresh(db)
+    return results
+
+
+class SyncJobWorker:
+    """
+    Runs sync jobs one at a time from an in-process queue. Every job is a
+    sync_jobs row that is updated as accounts finish, so its progress can be
+    polled and its history audited. Each job has a deadline; a job only
+    waited for (not submitted detached) is cancelled once nobody waits for it.
+    """
+
+    def __init__(self, session_factory, settings: Settings, max_queued: int = 100):
+        self.session_factory = session_factory
+        self.settings = settings
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queued)
+        self._queued: Dict[SyncRequest, str] = {}  # coalesces identical queued requests
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._deadlines: Dict[str, SyncDeadline] = {}  # of jobs not finished yet
+        self._detached: Set[str] = set()  # jobs that run whether or not anyone waits
+        # A job can finish before its submitter starts waiting (e.g. it fails at once)
+        self._outcomes: "OrderedDict[str, SyncOutcome]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self.current_job: Optional[str] = None
+
+    def submit(
+            self,
+            request: SyncRequest,
+            accounts: List[BybitAccount],
+            timeout: Optional[float] = None,
+            detached: bool = True
+    ) -> Tuple[str, bool]:
+        """
+        Queue a sync job.
+        Args:
+            request: What to sync
+            accounts: Accounts to sync
+            timeout: Seconds from now until the job stops fetching; None for no deadline
+            detached: Run the job even if nobody waits for it. Otherwise the
+                caller waits for it and the job is cancelled if every waiter leaves.
+        Returns:
+            (job id, whether a new job was created rather than joining a queued one)
+        Raises:
+            SyncQueueFullError: Too many jobs are waiting
+        """
+        job_id = self._queued.get(request)
+        if job_id is not None:
+            # Joiners get at least their own deadline
+            self._deadlines[job_id].extend(timeout)
+            if detached:
+                self._detached.add(job_id)
+            return job_id, False
+        if self._queue.full():
+            raise SyncQueueFullError()
+        job_id = uuid.uuid4().hex
+        with self.session_factory() as db:
+            db.add(SyncJob(
+                id=job_id,
+                status=JOB_QUEUED,
+                worker_id=HOLDER_ID,
+                page=request.page,
+                limit=request.limit,
+                status_filter=request.status,
+                account_id=request.account_id,
+                accounts_total=len(accounts),
+                accounts_done=0,
+                pages_fetched=0,
+                bots_synced=0,
+                created_at=datetime.now(timezone.utc)
+            ))
+            db.commit()
+        self._queued[request] = job_id
+        self._deadlines[job_id] = SyncDeadline(timeout)
+        if detached:
+            self._detached.add(job_id)
+        self._queue.put_nowait((job_id, request, accounts))
+        return job_id, True
+
+    async def wait(self, job_id: str) -> SyncOutcome:
+        """
+        Wait until a job submitted to this worker has finished. Cancelling the
+        wait leaves the job, which cancels it if it was its last waiter.
+        """
+        outcome = self._outcomes.get(job_id)
+        if outcome is not None:
+            return outcome
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(job_id, []).append(future)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            self._leave(job_id, future)
+            raise
+
+    def _leave(self, job_id: str, future: asyncio.Future) -> None:
+        waiters = self._waiters.get(job_id, [])
+        if future in waiters:
+            waiters.remove(future)
+        if not waiters and job_id not in self._detached:
+            self._waiters.pop(job_id, None)
+            self.cancel(job_id, "Cancelled: nobody is waiting for the job")
+
+    def cancel(self, job_id: str, reason: str = "Cancelled") -> bool:
+        """
+        Cancel a queued or running job. A running job abandons its fetches in
+        flight; pages it already fetched are still written.
+        Returns:
+            bool: Whether the job was still unfinished
+        """
+        deadline = self._deadlines.get(job_id)
+        if deadline is None:
+            return False
+        deadline.cancel(reason)
+        # Later identical requests must not join a cancelled job
+        for request in [r for r, queued_id in self._queued.items() if queued_id == job_id]:
+            del self._queued[request]
+        logger.info("Sync job %s cancelled: %s", job_id, reason)
+        return True
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished"""
+        await self._queue.join()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for futures in self._waiters.values():
+            for future in futures:
+                future.cancel()
+        self._waiters.clear()
+        # Jobs this process will never run stay visible as failed, not pending forever
+        try:
+            with self.session_factory() as db:
+                db.execute(
+                    update(SyncJob)
+                    .where(SyncJob.worker_id == HOLDER_ID, SyncJob.status.in_((JOB_QUEUED, JOB_RUNNING)))
+                    .values(status="failed", error="Worker stopped before the job finished",
+                            finished_at=datetime.now(timezone.utc))
+                )
+                db.commit()
+        except SQLAlchemyError as e:
+            logger.error("Failed to mark unfinished sync jobs: %s", e)
+
+    async def _run(self) -> None:
+        while True:
+            job_id, request, accounts = await self._queue.get()
+            if self._queued.get(request) == job_id:
+                del self._queued[request]
+            self.current_job = job_id
+            try:
+                outcome = await self._execute(job_id, request, accounts, self._deadlines[job_id])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Sync job %s failed: %s", job_id, e)
+                outcome = SyncOutcome(job_id, "failed", error=str(e))
+            finally:
+                self.current_job = None
+                self._deadlines.pop(job_id, None)
+                self._detached.discard(job_id)
+                self._queue.task_done()
+            self._outcomes[job_id] = outcome
+            while len(self._outcomes) > _KEPT_OUTCOMES:
+                self._outcomes.popitem(last=False)
+            for future in self._waiters.pop(job_id, []):
+                if not future.done():
+                    future.set_result(outcome)
+
+    async def _execute(
+            self,
+            job_id: str,
+            request: SyncRequest,
+            accounts: List[BybitAccount],
+            deadline: SyncDeadline
+    ) -> SyncOutcome:
+        started = time.perf_counter()
+        with self.session_factory() as job_db, self.session_factory() as db:
+            job = job_db.get(SyncJob, job_id)
+            job.status = JOB_RUNNING
+            job.started_at = datetime.now(timezone.utc)
+            job_db.commit()
+
+            def on_result(result: AccountSyncResult) -> None:
+                job.accounts_done += 1
+                job.pages_fetched += result.pages_fetched
+                job.bots_synced += result.synced_bots_count
+                job_db.commit()
+
+            error = None
+            try:
+                results = await run_sync(db, self.settings, accounts, request, on_result, deadline)
+                status = sync_status(results)
+                errors = [f"{r.account_id}: {r.error}" for r in results if r.error]
+                if deadline.cancelled:
+                    status, error = JOB_CANCELLED, deadline.reason
+                elif status != "success" and errors:
+                    error = "; ".join(errors)
+            except Exception as e:
+                logger.error("Sync job %s failed: %s", job_id, e)
+                job_db.rollback()
+                results, status, error = [], "failed", str(e)
+
+            job.status = status
+            job.error = error
+            job.account_results = [
+                {
+                    "account_id": r.account_id,
+                    "status": r.status,
+                    "synced_bots_count": r.synced_bots_count,
+                    "changed_bots_count": r.changed_bots_count,
+                    "pages_fetched": r.pages_fetched,
+                    "error": r.error,
+                }
+                for r in results
+            ]
+            job.finished_at = datetime.now(timezone.utc)
+            job.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            job_db.commit()
+            logger.info("Sync job %s finished: %s, %d bots in %.0f ms",
+                        job_id, status, job.bots_synced, job.duration_ms)
+            try:
+                prune_sync_jobs(job_db, self.settings.SYNC_JOB_RETENTION_DAYS)
+            except SQLAlchemyError as e:
+                logger.error("Pruning sync jobs failed: %s", e)
+        return SyncOutcome(job_id, status, results, error)
+
+    def status(self) -> dict:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "current_job": self.current_job,
+            "queued": self._queue.qsize(),
+        }
+
+
+def prune_sync_jobs(db: Session, retention_days: float) -> int:
+    """Delete finished jobs older than the retention period"""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    result = db.execute(
+        delete(SyncJob)
+        .where(SyncJob.created_at < cutoff, SyncJob.status.in_(FINISHED_STATUSES))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+_worker: Optional[SyncJobWorker] = None
+
+
+def get_sync_worker() -> Optional[SyncJobWorker]:
+    return _worker
+
+
+def start_sync_worker(worker: SyncJobWorker) -> SyncJobWorker:
+    global _worker
+    _worker = worker
+    worker.start()
+    return worker
+
+
+async def stop_sync_worker() -> None:
+    global _worker
+    worker, _worker = _worker, None
+    if worker is not None:
+        await worker.stop()
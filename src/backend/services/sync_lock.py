@@ -0,0 +1,187 @@
+import asyncio
+import hashlib
+import logging
+import os
+import socket
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, Iterator, Optional, Union
+
+from sqlalchemy import delete, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+
+from src.backend.models.sync_lock import SyncLock
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process as a lock holder across replicas
+HOLDER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+POLL_INTERVAL = 0.25  # seconds between attempts while waiting
+
+
+@dataclass
+class LockStats:
+    """Wait/hold instrumentation for one lock key"""
+    acquired: int = 0
+    contended: int = 0  # attempts that gave up without the lock
+    total_wait_ms: float = 0.0
+    total_hold_ms: float = 0.0
+    last_wait_ms: float = 0.0
+    last_hold_ms: float = 0.0
+
+
+_lock_stats: Dict[str, LockStats] = {}
+
+
+def get_lock_stats() -> Dict[str, dict]:
+    """Snapshot of lock instrumentation, keyed by lock key"""
+    return {key: asdict(stats) for key, stats in _lock_stats.items()}
+
+
+def advisory_lock_id(key: str) -> int:
+    """Stable signed 64-bit id for a lock key (pg advisory locks take a bigint)"""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+@contextmanager
+def _transaction(bind: Union[Engine, Connection]) -> Iterator[Connection]:
+    """
+    Short transaction of its own on an engine. A connection handed in belongs
+    to someone else's transaction (e.g. a test's outer transaction), so the
+    work goes into a savepoint on it instead.
+    """
+    if isinstance(bind, Connection):
+        with bind.begin_nested():
+            yield bind
+    else:
+        with bind.begin() as connection:
+            yield connection
+
+
+class _AdvisoryLock:
+    """Session-level Postgres advisory lock held on a dedicated connection"""
+
+    def __init__(self, bind: Union[Engine, Connection], key: str):
+        self.bind = bind
+        self.lock_id = advisory_lock_id(key)
+        self.connection: Optional[Connection] = None
+
+    def try_acquire(self) -> bool:
+        borrowed = isinstance(self.bind, Connection)
+        connection = self.bind if borrowed else self.bind.connect()
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": self.lock_id}
+        ).scalar()
+        if not borrowed:
+            # Session-level locks outlive the transaction; don't sit idle in one
+            connection.commit()
+        if acquired:
+            self.connection = connection
+        elif not borrowed:
+            connection.close()
+        return bool(acquired)
+
+    def release(self) -> None:
+        if self.connection is None:
+            return
+        if self.connection is self.bind:
+            # A borrowed connection's transaction is its owner's to end
+            self.connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": self.lock_id})
+            self.connection = None
+            return
+        try:
+            self.connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": self.lock_id})
+            self.connection.commit()
+        finally:
+            # Closing the connection would release the lock anyway if unlock failed
+            self.connection.close()
+            self.connection = None
+
+
+class _LeaseLock:
+    """Row-based lease in sync_locks, for databases without advisory locks"""
+
+    def __init__(self, bind: Union[Engine, Connection], key: str, ttl: float):
+        self.bind = bind
+        self.key = key
+        self.ttl = ttl
+
+    def try_acquire(self) -> bool:
+        now = datetime.now(timezone.utc)
+        try:
+            with _transaction(self.bind) as connection:
+                connection.execute(
+                    delete(SyncLock).where(SyncLock.key == self.key, SyncLock.expires_at < now)
+                )
+                connection.execute(SyncLock.__table__.insert().values(
+                    key=self.key,
+                    holder=HOLDER_ID,
+                    acquired_at=now,
+                    expires_at=now + timedelta(seconds=self.ttl)
+                ))
+            return True
+        except IntegrityError:
+            return False
+
+    def release(self) -> None:
+        with _transaction(self.bind) as connection:
+            connection.execute(
+                delete(SyncLock).where(SyncLock.key == self.key, SyncLock.holder == HOLDER_ID)
+            )
+
+
+@asynccontextmanager
+async def sync_lock(
+        engine: Union[Engine, Connection],
+        key: str,
+        wait_timeout: float = 0.0,
+        ttl: float = 600.0
+) -> AsyncIterator[bool]:
+    """
+    Hold a cross-process lock for the duration of the block.
+    Uses pg advisory locks on Postgres and a lease row in sync_locks elsewhere.
+    Yields True if the lock was acquired within wait_timeout, False otherwise;
+    callers skip the guarded work when it is False.
+    Args:
+        engine: Engine of the shared database, or a connection to take the lock on
+            inside its current transaction
+        key: Lock name, e.g. "bots-sync:<account_id>"
+        wait_timeout: Seconds to keep retrying before giving up (0 = single attempt)
+        ttl: Lease lifetime for the row-based fallback
+    """
+    if engine.dialect.name == "postgresql":
+        lock = _AdvisoryLock(engine, key)
+    else:
+        lock = _LeaseLock(engine, key, ttl)
+    stats = _lock_stats.setdefault(key, LockStats())
+
+    started = time.perf_counter()
+    deadline = started + wait_timeout
+    acquired = lock.try_acquire()
+    while not acquired and time.perf_counter() < deadline:
+        await asyncio.sleep(min(POLL_INTERVAL, max(deadline - time.perf_counter(), 0)))
+        acquired = lock.try_acquire()
+    wait_ms = (time.perf_counter() - started) * 1000
+    stats.last_wait_ms = wait_ms
+    stats.total_wait_ms += wait_ms
+
+    if not acquired:
+        stats.contended += 1
+        logger.info("Lock %s is held elsewhere, gave up after %.1f ms", key, wait_ms)
+        yield False
+        return
+
+    stats.acquired += 1
+    held_from = time.perf_counter()
+    try:
+        yield True
+    finally:
+        lock.release()
+        hold_ms = (time.perf_counter() - held_from) * 1000
+        stats.last_hold_ms = hold_ms
+        stats.total_hold_ms += hold_ms
+        logger.info("Lock %s released (waited %.1f ms, held %.1f ms)", key, wait_ms, hold_ms)
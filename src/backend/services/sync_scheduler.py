@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.backend.config import BybitAccount, PollTier, Settings
+from src.backend.exceptions import SyncQueueFullError
+from src.backend.services.account_sync import AccountSyncResult
+from src.backend.services.sync_jobs import SyncJobWorker, SyncOutcome, SyncRequest
+
+logger = logging.getLogger(__name__)
+
+
+def update_change_rate(rate: Optional[float], changed: int, fetched: int, smoothing: float) -> float:
+    """
+    Exponentially weighted share of fetched bots that changed per sync.
+    Args:
+        rate: Rate so far; None before the first sync, which is taken as is
+        changed: Bots of the latest sync whose tracked fields changed
+        fetched: Bots of the latest sync
+        smoothing: Weight of the latest sync, between 0 and 1
+    """
+    observed = min(changed / fetched, 1.0) if fetched else 0.0
+    if rate is None:
+        return observed
+    return smoothing * observed + (1 - smoothing) * rate
+
+
+def poll_interval(tier: PollTier, change_rate: float) -> float:
+    """Seconds between syncs of a tier: min_interval while all its bots change, max_interval while none do"""
+    max_interval = max(tier.max_interval, tier.min_interval)
+    return max_interval - (max_interval - tier.min_interval) * min(max(change_rate, 0.0), 1.0)
+
+
+@dataclass
+class TierState:
+    """Schedule and observed change rate of one poll tier"""
+    tier: PollTier
+    interval: float
+    change_rate: Optional[float] = None
+    next_run: float = 0.0  # time.monotonic()
+    runs: int = 0
+    failures: int = 0
+    last_job_id: Optional[str] = None
+    last_status: Optional[str] = None
+    last_pages: int = 0  # pages walked by the latest poll
+    truncated: bool = False  # the latest poll stopped at SYNC_POLL_MAX_PAGES with pages still full
+
+    @property
+    def finished(self) -> bool:
+        return self.tier.once and self.runs > 0
+
+
+class SyncScheduler:
+    """
+    Queues a sync job per poll tier on the sync worker, each tier filtered
+    by its Bybit status. Accounts whose page comes back full get their next
+    page synced too, up to SYNC_POLL_MAX_PAGES pages. A tier starts at its shortest interval; every sync
+    moves its change rate and with it the interval, so bots that stopped
+    changing cost fewer Bybit calls and DB writes. Failed syncs are retried
+    after the current interval without touching the change rate.
+    """
+
+    def __init__(self, worker: SyncJobWorker, settings: Settings, tiers: Optional[List[PollTier]] = None):
+        self.worker = worker
+        self.settings = settings
+        self.tiers = [
+            TierState(tier, interval=tier.min_interval)
+            for tier in (settings.SYNC_POLL_TIERS if tiers is None else tiers)
+        ]
+        self._task: Optional[asyncio.Task] = None
+
+    async def _sync_page(
+            self, state: TierState, request: SyncRequest, accounts: List[BybitAccount]
+    ) -> Optional[SyncOutcome]:
+        try:
+            job_id, _ = self.worker.submit(request, accounts, timeout=self.settings.SYNC_REQUEST_TIMEOUT_SECONDS)
+            state.last_job_id = job_id
+            return await self.worker.wait(job_id)
+        except (SyncQueueFullError, SQLAlchemyError) as e:
+            logger.error("Queueing page %d of the %s poll failed: %s", request.page, state.tier.name, e)
+            return None
+
+    async def poll(self, state: TierState) -> None:
+        """Sync one tier now, page by page while pages come back full, and schedule its next sync"""
+        tier = state.tier
+        accounts = self.settings.bybit_accounts()
+        outcome = None
+        results: List[AccountSyncResult] = []
+        if not accounts:
+            logger.warning("No Bybit account configured; skipping the %s poll", tier.name)
+        else:
+            outcome = await self._sync_page(state, SyncRequest(status=tier.status), accounts)
+            results = list(outcome.results) if outcome is not None else []
+            full = {r.account_id for r in results if r.status == "success" and r.page_full}
+            page = 1
+            while full and page < self.settings.SYNC_POLL_MAX_PAGES:
+                page_results = []
+                for account in accounts:
+                    if account.account_id not in full:
+                        continue
+                    request = SyncRequest(page=page, status=tier.status, account_id=account.account_id)
+                    page_outcome = await self._sync_page(state, request, [account])
+                    page_results.extend(
+                        page_outcome.results if page_outcome is not None
+                        else [AccountSyncResult(account.account_id, "failed")]
+                    )
+                results.extend(page_results)
+                full = {r.account_id for r in page_results if r.status == "success" and r.page_full}
+                page += 1
+            state.last_pages = page if outcome is not None else 0
+            state.truncated = bool(full)
+            if full:
+                logger.warning("The %s poll stopped after %d pages; account(s) %s have more bots",
+                               tier.name, page, ", ".join(sorted(full)))
+        status = outcome.status if outcome is not None else None
+        if status == "success" and any(r.status == "failed" for r in results):
+            status = "partial"
+        state.last_status = status
+
+        if status in ("success", "partial"):
+            synced = [r for r in results if r.status == "success"]
+            state.change_rate = update_change_rate(
+                state.change_rate,
+                changed=sum(r.changed_bots_count for r in synced),
+                fetched=sum(r.synced_bots_count for r in synced),
+                smoothing=self.settings.SYNC_POLL_SMOOTHING
+            )
+            state.interval = poll_interval(tier, state.change_rate)
+            state.runs += 1
+        else:
+            state.failures += 1
+        state.next_run = time.monotonic() + state.interval
+        logger.info("Polled %s bots (%s): change rate %.2f, next poll in %.0f s",
+                    tier.name, status, state.change_rate or 0.0, state.interval)
+
+    async def _run(self) -> None:
+        while True:
+            for state in self.tiers:
+                if not state.finished and state.next_run <= time.monotonic():
+                    await self.poll(state)
+            pending = [state.next_run for state in self.tiers if not state.finished]
+            if not pending:
+                logger.info("All poll tiers are done")
+                return
+            await asyncio.sleep(max(min(pending) - time.monotonic(), 0))
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> dict:
+        now = time.monotonic()
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "tiers": [
+                {
+                    "name": state.tier.name,
+                    "status_filter": state.tier.status,
+                    "interval": round(state.interval, 1),
+                    "change_rate": state.change_rate,
+                    "next_run_in": None if state.finished else round(max(state.next_run - now, 0), 1),
+                    "runs": state.runs,
+                    "failures": state.failures,
+                    "last_job_id": state.last_job_id,
+                    "last_status": state.last_status,
+                    "last_pages": state.last_pages,
+                    "truncated": state.truncated,
+                }
+                for state in self.tiers
+            ],
+        }
+
+
+_scheduler: Optional[SyncScheduler] = None
+
+
+def get_sync_scheduler() -> Optional[SyncScheduler]:
+    return _scheduler
+
+
+def start_sync_scheduler(scheduler: SyncScheduler) -> SyncScheduler:
+    global _scheduler
+    _scheduler = scheduler
+    scheduler.start()
+    return scheduler
+
+
+async def stop_sync_scheduler() -> None:
+    global _scheduler
+    scheduler, _scheduler = _scheduler, None
+    if scheduler is not None:
+        await scheduler.stop()
@@ -1,30 +1,62 @@
-import base64
-import hashlib
 import time
 from datetime import datetime
 
 import httpx
-import pandas as pd
 import streamlit as st
 
+# streamlit puts this script's directory on sys.path
+from utils.bots_dataframe import create_bots_dataframe
+
 API_BASE_URL = "http://backend:8000"
 REFRESH_INTERVAL = 60  # seconds
+PAGE_SIZES = [25, 50, 100, 200]
+SYNC_POLL_INTERVAL = 0.5  # seconds between sync job status checks
+SYNC_POLL_TIMEOUT = 120  # seconds before giving up on a sync job
+# Table sort options -> API sort_by field
+SORT_FIELDS = {
+    "PnL": "pnl",
+    "PnL %": "pnl_percentage",
+    "Investment": "total_investment",
+    "APR": "total_apr",
+    "Symbol": "symbol",
+    "Run Time": "running_duration",
+    "Leverage": "leverage",
+    "Created": "created_at",
+}
+
+
+def fetch_bots_page(offset: int, limit: int, sort_by: str, order: str):
+    """Fetch one sorted page of bots from the backend API with the total number of bots"""
+    with httpx.Client() as client:
+        response = client.get(
+            f"{API_BASE_URL}/bots/",
+            params={"offset": offset, "limit": limit, "sort_by": sort_by, "order": order}
+        )
+        response.raise_for_status()
+        return response.json(), int(response.headers.get("X-Total-Count", 0))
 
 
-def shorten_grid_id(grid_id: str, length: int = 6) -> str:
-    """Convert a long grid_id into a shorter human-readable string."""
-    hash_object = hashlib.sha256(str(grid_id).encode())
-    b64_hash = base64.b64encode(hash_object.digest()).decode('utf-8')
-    short_id = ''.join(c for c in b64_hash if c.isalnum())[:length]
-    return short_id
+def fetch_fleet_summary():
+    """Fleet totals from the per-symbol rollups, independent of the page shown"""
+    with httpx.Client() as client:
+        response = client.get(f"{API_BASE_URL}/bots/symbols")
+        response.raise_for_status()
+        rollups = response.json()
+    return {
+        "total_investment": sum(row["total_investment"] for row in rollups),
+        "total_pnl": sum(row["total_pnl"] for row in rollups),
+        "active_bots": sum(row["running_count"] for row in rollups),
+    }
 
 
-def fetch_bots():
-    """Fetch bots data from the backend API"""
+def fetch_bots_by_ids(grid_ids):
+    """Fetch only the given bots from the backend API, keyed by grid_id"""
+    if not grid_ids:
+        return {}
     with httpx.Client() as client:
-        response = client.get(f"{API_BASE_URL}/bots/")
+        response = client.get(f"{API_BASE_URL}/bots/batch", params={"ids": ",".join(grid_ids)})
         response.raise_for_status()
-        return response.json()
+        return {bot['grid_id']: bot for bot in response.json()}
 
 
 def format_datetime(dt_str):
@@ -35,25 +67,6 @@ def format_datetime(dt_str):
     return ''
 
 
-def format_duration(seconds: str) -> str:
-    """Convert duration from seconds to 'XD Yh Zm' format"""
-    try:
-        seconds = int(float(seconds))
-        days = seconds // (24 * 3600)
-        seconds %= (24 * 3600)
-        hours = seconds // 3600
-        seconds %= 3600
-        minutes = seconds // 60
-
-        if days > 0:
-            return f"{days}D {hours}h {minutes}m"
-        elif hours > 0:
-            return f"{hours}h {minutes}m"
-        else:
-            return f"{minutes}m"
-    except (ValueError, TypeError):
-        return "0m"
-
 def get_compact_column_config():
     """Define compact column configuration with custom widths and multi-line headers"""
     return {
@@ -106,70 +119,29 @@ def get_compact_column_config():
         )
     }
 
+
+
 def update_bots():
-    """Trigger bot data update from Bybit"""
+    """Trigger bot data update from Bybit and wait for the sync job to finish"""
     try:
         response = httpx.post(f"{API_BASE_URL}/bots/update")
         response.raise_for_status()
-        st.success("Bots data successfully updated!")
-        time.sleep(1)  # Give the backend time to process
-        return True
+        status_url = f"{API_BASE_URL}{response.json()['status_url']}"
+        deadline = time.monotonic() + SYNC_POLL_TIMEOUT
+        while time.monotonic() < deadline:
+            job = httpx.get(status_url).raise_for_status().json()
+            if job["status"] in ("success", "partial"):
+                st.success(f"Bots data successfully updated ({job['bots_synced']} bots)!")
+                return True
+            if job["status"] in ("failed", "skipped", "cancelled"):
+                st.error(f"Failed to update bots data: {job['error'] or job['status']}")
+                return False
+            time.sleep(SYNC_POLL_INTERVAL)
+        st.warning("Update is still running; refresh later to see the results")
     except httpx.HTTPStatusError as e:
         st.error(f"Failed to update bots data: {e}")
 
 
-def create_bots_dataframe(bots_data):
-    """Create a pandas DataFrame from bots data with selected columns"""
-    if not bots_data:
-        return pd.DataFrame(), {}, {}
-
-    # Add short_id to each bot
-    for bot in bots_data:
-        bot['short_id'] = shorten_grid_id(bot['grid_id'])
-
-    # Store full bot data in a dictionary using grid_id as key
-    bots_lookup = {bot['grid_id']: bot for bot in bots_data}
-
-    # Also create a lookup using short_id
-    short_id_lookup = {bot['short_id']: bot['grid_id'] for bot in bots_data}
-
-    # Select and rename columns for display
-    columns_mapping = {
-        'short_id': 'Bot ID',
-        'grid_id': 'Original Grid ID',  # Keep for reference but will hide later
-        'symbol': 'Symbol',
-        'status': 'Status',
-        'leverage': 'Leverage',
-        'total_investment': 'Investment',
-        'pnl': 'PnL',
-        'pnl_percentage': 'PnL %',
-        'current_price': 'Current Price',
-        'running_duration': 'Duration (h)',
-        'arbitrage_num': 'Arbitrage Count',
-    }
-    df = pd.DataFrame(bots_data)
-    df = df[
-        ['short_id', 'grid_id'] + [col for col in columns_mapping.keys() if col not in ['short_id', 'grid_id']]].rename(
-        columns=columns_mapping)
-
-    # Format numeric columns
-    df['Investment'] = df['Investment'].round(2)
-    df['Leverage'] = df['Leverage'].astype(int)
-
-    # Store numeric PnL values before formatting
-    df['PnL_numeric'] = df['PnL'].round(2)
-    df['PnL %_numeric'] = df['PnL %'].round(2)
-
-    # Format PnL values for display
-    df['PnL'] = df['PnL_numeric'].apply(lambda x: f"{'🔴' if x < 0 else '🟢'} {x:.2f}")
-    df['PnL %'] = df['PnL %_numeric'].apply(lambda x: f"{'🔴' if x < 0 else '🟢'} {x:.2f}%")
-
-    df['Current Price'] = df['Current Price'].round(4)
-    df['Duration (h)'] = df['Duration (h)'].apply(format_duration)
-    df['Arbitrage Count'] = df['Arbitrage Count'].astype(int)
-    return df, bots_lookup, short_id_lookup
-
-
 def display_bot_details(bot_data):
     """Display detailed information for a single bot"""
     col1, col2 = st.columns(2)
@@ -205,72 +177,59 @@ def main():
                 if success:
                     st.rerun()
 
+    # Fleet-wide metrics come from the rollups, the table only loads the visible page
+    summary = fetch_fleet_summary()
+    total_investment = summary["total_investment"]
+    total_pnl = summary["total_pnl"]
+    total_pnl_percentage = (total_pnl / total_investment * 100) if total_investment > 0 else 0
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Investment", f"${total_investment:,.2f}")
+    col2.metric("Total PnL", f"${total_pnl:,.2f}")
+    col3.metric("Total PnL %", f"{total_pnl_percentage:.2f}%")
+    col4.metric("Active Bots", summary["active_bots"])
+
+    sort_col, order_col, size_col, page_col = st.columns(4)
+    sort_label = sort_col.selectbox("Sort by", list(SORT_FIELDS))
+    descending = order_col.radio("Order", ["Descending", "Ascending"], horizontal=True) == "Descending"
+    page_size = size_col.selectbox("Rows per page", PAGE_SIZES, index=1)
+    page = page_col.number_input("Page", min_value=1, value=1, step=1)
+
     with st.spinner("Loading bots data..."):
-        bots_data = fetch_bots()
-        df, bots_lookup, short_id_lookup = create_bots_dataframe(bots_data)
+        bots_data, total = fetch_bots_page(
+            offset=(page - 1) * page_size,
+            limit=page_size,
+            sort_by=SORT_FIELDS[sort_label],
+            order="desc" if descending else "asc"
+        )
+        df = create_bots_dataframe(bots_data)
 
+    page_count = max((total + page_size - 1) // page_size, 1)
     if df.empty:
-        st.warning("No bots data available")
+        st.warning("No bots data available" if total == 0 else f"Page {page} is past the last page ({page_count})")
     else:
-        # Calculate summary metrics
-        total_investment = df['Investment'].sum()
-        # Use numeric PnL value for calculations
-        total_pnl = df['PnL_numeric'].sum()
-        total_pnl_percentage = (total_pnl / total_investment * 100) if total_investment > 0 else 0
-        active_bots = len(df[df['Status'] == 'RUNNING'])
-
-        # Display metrics
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Investment", f"${total_investment:,.2f}")
-        col2.metric("Total PnL", f"${total_pnl:,.2f}")
-        col3.metric("Total PnL %", f"{total_pnl_percentage:.2f}%")
-        col4.metric("Active Bots", active_bots)
-
+        st.caption(f"Page {page} of {page_count} ({total} bots)")
         df['Details'] = False  # Add a column for toggles
 
-        # Instead of using excluded_columns, drop the column before display
-        display_df = df.copy()
-        display_df = display_df.drop(columns=["Original Grid ID"])
-        display_df = display_df.drop(columns=["Status"])
-        # Drop the numeric columns used for calculations
-        display_df = display_df.drop(columns=["PnL_numeric", "PnL %_numeric"])
-
-        column_config = {
-            "Bot ID": st.column_config.TextColumn(
-                "Bot ID",
-                help="Shortened bot identifier",
-                disabled=True
-            ),
-            "PnL": st.column_config.TextColumn("PnL"),  # Changed from NumberColumn to TextColumn
-            "PnL %": st.column_config.TextColumn("PnL %"),  # Changed from NumberColumn to TextColumn
-            "Duration (h)": st.column_config.TextColumn(
-                "Duration",
-                help="Running duration in days, hours, and minutes"
-            ),
-            "Details": st.column_config.CheckboxColumn(
-                "Show Details",
-                help="Click to show detailed information"
-            )
-        }
-        column_config = get_compact_column_config()
+        # Drop the columns used for lookups and calculations before display
+        display_df = df.drop(columns=["Original Grid ID", "Status", "PnL_numeric", "PnL %_numeric"])
 
         edited_df = st.data_editor(
             display_df,
             use_container_width=True,
             hide_index=True,
-            column_config=column_config
+            column_config=get_compact_column_config()
         )
 
-        # Display detailed information for selected bots
-        for index, row in edited_df.iterrows():
-            if row['Details']:
-                # Get the original grid_id using the short_id
-                original_grid_id = df.at[index, 'Original Grid ID']
-
-                with st.expander(f"Details for {row['Symbol']} (Bot ID: {row['Bot ID']})", expanded=True):
-                    bot_data = bots_lookup.get(original_grid_id)
-                    if bot_data:
-                        display_bot_details(bot_data)
+        # Display detailed information for selected bots, fetched in one request
+        selected = edited_df[edited_df['Details']]
+        details = fetch_bots_by_ids([df.at[index, 'Original Grid ID'] for index in selected.index])
+        for index, row in selected.iterrows():
+            original_grid_id = df.at[index, 'Original Grid ID']
+            with st.expander(f"Details for {row['Symbol']} (Bot ID: {row['Bot ID']})", expanded=True):
+                bot_data = details.get(original_grid_id)
+                if bot_data:
+                    display_bot_details(bot_data)
 
 
 if __name__ == "__main__":
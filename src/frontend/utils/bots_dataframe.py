@@ -0,0 +1,77 @@
+import base64
+import hashlib
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .time_formatter import format_durations
+
+# API field -> display column
+COLUMNS_MAPPING = {
+    'short_id': 'Bot ID',
+    'grid_id': 'Original Grid ID',  # Keep for reference but will hide later
+    'symbol': 'Symbol',
+    'status': 'Status',
+    'leverage': 'Leverage',
+    'total_investment': 'Investment',
+    'pnl': 'PnL',
+    'pnl_percentage': 'PnL %',
+    'current_price': 'Current Price',
+    'running_duration': 'Duration (h)',
+    'arbitrage_num': 'Arbitrage Count',
+}
+
+_FRACTIONS = np.array([f".{cents:02d}" for cents in range(100)])
+
+
+@lru_cache(maxsize=65536)
+def shorten_grid_id(grid_id: str, length: int = 6) -> str:
+    """Convert a long grid_id into a shorter human-readable string."""
+    hash_object = hashlib.sha256(str(grid_id).encode())
+    b64_hash = base64.b64encode(hash_object.digest()).decode('utf-8')
+    short_id = ''.join(c for c in b64_hash if c.isalnum())[:length]
+    return short_id
+
+
+def format_signed_amounts(values: pd.Series, suffix: str = "") -> pd.Series:
+    """
+    Vectorized f"{'🔴' if x < 0 else '🟢'} {x:.2f}{suffix}" using integer cents.
+    Values are expected to be rounded to two decimals already.
+    """
+    amounts = values.to_numpy(dtype=float)
+    cents = np.rint(np.abs(amounts) * 100).astype(np.int64)
+    whole = (cents // 100).astype(str)
+    prefix = np.where(amounts < 0, "🔴 -", np.where(np.signbit(amounts), "🟢 -", "🟢 "))
+    text = np.char.add(np.char.add(prefix, whole), _FRACTIONS[cents % 100])
+    if suffix:
+        text = np.char.add(text, suffix)
+    return pd.Series(text, index=values.index, dtype=object)
+
+
+def create_bots_dataframe(bots_data) -> pd.DataFrame:
+    """Create a pandas DataFrame from bots data with selected columns"""
+    if not bots_data:
+        return pd.DataFrame()
+
+    api_columns = [column for column in COLUMNS_MAPPING if column != 'short_id']
+    df = pd.DataFrame.from_records(bots_data, columns=api_columns)
+    df.insert(0, 'short_id', [shorten_grid_id(grid_id) for grid_id in df['grid_id']])
+    df = df.rename(columns=COLUMNS_MAPPING)
+
+    # Format numeric columns
+    df['Investment'] = df['Investment'].round(2)
+    df['Leverage'] = df['Leverage'].astype(int)
+
+    # Store numeric PnL values before formatting
+    df['PnL_numeric'] = df['PnL'].round(2)
+    df['PnL %_numeric'] = df['PnL %'].round(2)
+
+    # Format PnL values for display
+    df['PnL'] = format_signed_amounts(df['PnL_numeric'])
+    df['PnL %'] = format_signed_amounts(df['PnL %_numeric'], suffix="%")
+
+    df['Current Price'] = df['Current Price'].round(4)
+    df['Duration (h)'] = format_durations(df['Duration (h)'])
+    df['Arbitrage Count'] = df['Arbitrage Count'].astype(int)
+    return df
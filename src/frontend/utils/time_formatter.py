@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+SECONDS_PER_DAY = 24 * 3600
+SECONDS_PER_HOUR = 3600
+
+# Lookup tables: indexing with arrays is much cheaper than formatting each number
+_MINUTES = np.array([f"{m}m" for m in range(60)])
+_HOURS_MINUTES = np.array([f"{h}h {m}m" for h in range(24) for m in range(60)])
+
+
+def format_duration(seconds: str) -> str:
+    """Convert duration from seconds to 'XD Yh Zm' format"""
+    return format_durations(pd.Series([seconds])).iloc[0]
+
+
+def format_durations(seconds: pd.Series) -> pd.Series:
+    """
+    Vectorized format_duration: 'XD Yh Zm', 'Yh Zm' or 'Zm' per element.
+    Values that are not numbers become '0m'.
+    """
+    numeric = pd.to_numeric(seconds, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    valid = np.isfinite(numeric)
+    total = np.trunc(np.where(valid, numeric, 0)).astype(np.int64)
+
+    days = total // SECONDS_PER_DAY
+    rest = total % SECONDS_PER_DAY
+    hours = rest // SECONDS_PER_HOUR
+    minutes = (rest % SECONDS_PER_HOUR) // 60
+
+    minutes_part = _MINUTES[minutes]
+    hours_part = _HOURS_MINUTES[hours * 60 + minutes]
+    days_part = np.char.add(np.char.add(days.astype(str), "D "), hours_part)
+
+    formatted = np.where(days > 0, days_part, np.where(hours > 0, hours_part, minutes_part))
+    formatted = np.where(valid, formatted, "0m")
+    return pd.Series(formatted, index=seconds.index, dtype=object)
@@ -1,9 +1,22 @@
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import queue
+import random
 import sys
-from dataclasses import dataclass
-from logging.handlers import RotatingFileHandler
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+# Correlation IDs attached to every record emitted while they are set
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+sync_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("sync_id", default=None)
+
+_active_listener: Optional[QueueListener] = None
 
 
 @dataclass
@@ -14,6 +27,78 @@ class LogConfig:
     backup_count: int = 5
     logs_directory: str = "logs"
     format_pattern: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    use_queue: bool = True
+    json_format: bool = False
+    # Logger name (or prefix) -> fraction of DEBUG records to keep
+    sampling: Dict[str, float] = field(default_factory=dict)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the current request and sync IDs onto the record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        record.sync_id = sync_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of DEBUG records for the configured loggers."""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        # Longest prefix first so 'a.b' wins over 'a'
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def _rate_for(self, name: str) -> Optional[float]:
+        for prefix, rate in self.rates:
+            if name == prefix or name.startswith(prefix + "."):
+                return rate
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        rate = self._rate_for(record.name)
+        return rate is None or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Render records as single-line JSON documents."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("request_id", "sync_id"):
+            value = getattr(record, key, None)
+            if value is not None:
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that only resolves the message in the calling thread.
+    Formatting and I/O are left to the listener's handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 
 class LoggingSetup:
@@ -21,12 +106,17 @@ class LoggingSetup:
         self.config = config
         self.root_logger = logging.getLogger()
         self.log_path = self._prepare_log_directory() if config.filename else None
+        self.listener: Optional[QueueListener] = None
 
     def configure(self) -> None:
+        stop_listener()
         self._set_root_logger_level()
         self._clear_existing_handlers()
-        self._add_console_handler()
-        self._add_file_handler()
+        handlers = [self._create_console_handler()]
+        file_handler = self._create_file_handler()
+        if file_handler:
+            handlers.append(file_handler)
+        self._attach_handlers(handlers)
         self._configure_third_party_loggers()
         self._log_completion()
 
@@ -42,16 +132,25 @@ class LoggingSetup:
         self.root_logger.handlers.clear()
 
     def _create_formatter(self) -> logging.Formatter:
+        if self.config.json_format:
+            return JsonFormatter()
         return logging.Formatter(self.config.format_pattern)
 
-    def _add_console_handler(self) -> None:
+    def _create_filters(self) -> List[logging.Filter]:
+        filters: List[logging.Filter] = []
+        if self.config.sampling:
+            filters.append(SamplingFilter(self.config.sampling))
+        filters.append(ContextFilter())
+        return filters
+
+    def _create_console_handler(self) -> logging.Handler:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(self._create_formatter())
-        self.root_logger.addHandler(console_handler)
+        return console_handler
 
-    def _add_file_handler(self) -> None:
+    def _create_file_handler(self) -> Optional[logging.Handler]:
         if not self.log_path:
-            return
+            return None
 
         file_handler = RotatingFileHandler(
             self.log_path,
@@ -59,7 +158,29 @@ class LoggingSetup:
             backupCount=self.config.backup_count
         )
         file_handler.setFormatter(self._create_formatter())
-        self.root_logger.addHandler(file_handler)
+        return file_handler
+
+    def _attach_handlers(self, handlers: List[logging.Handler]) -> None:
+        global _active_listener
+
+        # Filters run in the calling thread: sampling drops records before they are
+        # queued and context IDs must be read where the contextvars are set.
+        if not self.config.use_queue:
+            filters = self._create_filters()
+            for handler in handlers:
+                for log_filter in filters:
+                    handler.addFilter(log_filter)
+                self.root_logger.addHandler(handler)
+            return
+
+        queue_handler = NonBlockingQueueHandler(queue.SimpleQueue())
+        for log_filter in self._create_filters():
+            queue_handler.addFilter(log_filter)
+        self.root_logger.addHandler(queue_handler)
+
+        self.listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        _active_listener = self.listener
 
     def _configure_third_party_loggers(self) -> None:
         third_party_loggers = ['urllib3', 'sqlalchemy']
@@ -70,19 +191,38 @@ class LoggingSetup:
         self.root_logger.info("Logging configuration completed")
 
 
+def stop_listener() -> None:
+    """Flush queued records and stop the background listener, if any."""
+    global _active_listener
+    if _active_listener is not None:
+        _active_listener.stop()
+        _active_listener = None
+
+
+atexit.register(stop_listener)
+
+
 def setup_logging(
         level: str = "INFO",
         filename: Optional[str] = "bot_manager.log",
         max_file_size: int = 10 * 1024 * 1024,
-        backup_count: int = 5
+        backup_count: int = 5,
+        use_queue: bool = True,
+        json_format: bool = False,
+        sampling: Optional[Dict[str, float]] = None
 ) -> None:
     """
     Configure application logging with console and optional file output.
+    By default records are handed to a queue and written by a background listener,
+    so log calls never block on I/O.
     """
     config = LogConfig(
         level=level,
         filename=filename,
         max_file_size=max_file_size,
-        backup_count=backup_count
+        backup_count=backup_count,
+        use_queue=use_queue,
+        json_format=json_format,
+        sampling=sampling or {}
     )
     LoggingSetup(config).configure()
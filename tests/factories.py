@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Iterable, List
+from unittest.mock import AsyncMock
+
+from src.backend.models.bot import Bot
+from src.backend.services.bybit_client import BybitClientError
+
+
+def bybit_bot_payload(grid_id: str, symbol: str = "BTCUSDT", status: str = "RUNNING", **overrides) -> dict:
+    """Raw futures grid bot as returned by the Bybit list-all-bots endpoint"""
+    grid = {
+        "grid_id": grid_id,
+        "symbol": symbol,
+        "status": status,
+        "grid_mode": "FUTURE_GRID_MODE_NEUTRAL",
+        "price_token": "USDT",
+        "grid_type": "FUTURE_GRID_TYPE_ARITHMETIC",
+        "mark_price": "50000",
+        "total_investment": "1000",
+        "pnl": "10",
+        "pnl_per": "0.01",
+        "leverage": "5",
+        "min_price": "45000",
+        "max_price": "55000",
+        "cell_num": "20",
+        "liq_price": "40000",
+        "arbitrage_num": "3",
+        "total_apr": "12.5",
+        "entry_price": "49000",
+        "current_price": "50000",
+        "running_duration": "7200",
+        "close_detail": None,
+    }
+    grid.update(overrides)
+    return {"type": "GRID_FUTURES", "future_grid": grid}
+
+
+def bybit_response(*bots: dict) -> dict:
+    """Bybit list-all-bots response envelope"""
+    return {"ret_code": 0, "ret_msg": "", "result": {"bots": list(bots)}}
+
+
+def streaming_client(response: dict) -> AsyncMock:
+    """Mocked BybitClient whose stream_trading_bots feeds the bots of response to on_bot"""
+    async def stream_trading_bots(on_bot, page=0, limit=150, status=0, timeout=None):
+        for bot in response["result"]["bots"]:
+            on_bot(bot)
+        return {**response, "result": {**response["result"], "bots": []}}
+
+    client = AsyncMock()
+    client.stream_trading_bots.side_effect = stream_trading_bots
+    client.get_trading_bots.return_value = response
+    return client
+
+
+def paged_client(*pages: List[dict], fail_pages: Iterable[int] = ()) -> AsyncMock:
+    """
+    Mocked BybitClient listing the given pages of raw bots by page number.
+    Pages in fail_pages raise BybitClientError the first time they are requested.
+    """
+    failing = set(fail_pages)
+
+    async def stream_trading_bots(on_bot, page=0, limit=150, status=0, timeout=None):
+        if page in failing:
+            failing.discard(page)
+            raise BybitClientError("Bybit unavailable", code=503)
+        for bot in pages[page] if page < len(pages) else []:
+            on_bot(bot)
+        return bybit_response()
+
+    client = AsyncMock()
+    client.stream_trading_bots.side_effect = stream_trading_bots
+    return client
+
+
+def hanging_client() -> AsyncMock:
+    """Mocked BybitClient whose page stalls after its first bot and never finishes"""
+    async def stream_trading_bots(on_bot, **kwargs):
+        on_bot(bybit_bot_payload("half-read"))
+        await asyncio.sleep(3600)
+
+    client = AsyncMock()
+    client.stream_trading_bots.side_effect = stream_trading_bots
+    return client
+
+
+def make_bot(grid_id: str, symbol: str = "BTCUSDT", status: str = "RUNNING", **overrides) -> Bot:
+    """Bot model instance with sensible defaults"""
+    fields = dict(
+        grid_id=grid_id,
+        bot_type="GRID_FUTURES",
+        symbol=symbol,
+        status=status,
+        grid_mode="neutral",
+        price_token="USDT",
+        grid_type="arithmetic",
+        mark_price=50000.0,
+        total_investment=1000.0,
+        pnl=10.0,
+        pnl_percentage=1.0,
+        leverage=5,
+        min_price=45000.0,
+        max_price=55000.0,
+        cell_num=20,
+        liq_price=40000.0,
+        arbitrage_num=3,
+        total_apr=12.5,
+        entry_price=49000.0,
+        current_price=50000.0,
+        running_duration=7200,
+        last_synced_at=datetime.now(timezone.utc),
+        raw_data={"test": "data"},
+    )
+    fields.update(overrides)
+    return Bot(**fields)
@@ -1,16 +1,7 @@
 from datetime import datetime, timezone
 
-import pytest
-
 from src.backend.models.bot import Bot
-
-
-@pytest.fixture(autouse=True)
-def cleanup_database(test_db_session):
-    """Clean up the database after each test"""
-    yield
-    test_db_session.query(Bot).delete()
-    test_db_session.commit()
+from tests.factories import make_bot
 
 
 def test_root_endpoint(client):
@@ -65,7 +56,7 @@ def test_list_bots_with_data(client, test_db_session):
 
 
 def test_get_single_bot(client, test_db_session):
-    """Test getting a single bot by ID"""
+    """Test getting a single bot by grid_id"""
     bot = Bot(
         grid_id="single_test_grid",  # Unique grid_id
         bot_type="futures",
@@ -94,12 +85,38 @@ def test_get_single_bot(client, test_db_session):
     test_db_session.add(bot)
     test_db_session.commit()
 
-    response = client.get(f"/bots/{bot.id}")
+    response = client.get(f"/bots/{bot.grid_id}")
     assert response.status_code == 200
     data = response.json()
     assert data["grid_id"] == "single_test_grid"
 
 
+def test_get_single_bot_not_found(client):
+    """Test getting a bot that does not exist"""
+    response = client.get("/bots/missing_grid")
+    assert response.status_code == 404
+
+
+def test_get_bots_batch(client, test_db_session):
+    """Test fetching several bots by grid_id in request order"""
+    test_db_session.add_all([make_bot("batch_a"), make_bot("batch_b"), make_bot("batch_c")])
+    test_db_session.commit()
+
+    response = client.get("/bots/batch", params={"ids": "batch_c,missing,batch_a"})
+    assert response.status_code == 200
+    assert [bot["grid_id"] for bot in response.json()] == ["batch_c", "batch_a"]
+
+    response = client.get("/bots/batch?ids=batch_b&ids=batch_a")
+    assert [bot["grid_id"] for bot in response.json()] == ["batch_b", "batch_a"]
+
+
+def test_get_bots_batch_limit(client):
+    """Test that oversized batches are rejected"""
+    ids = ",".join(f"grid_{i}" for i in range(201))
+    response = client.get("/bots/batch", params={"ids": ids})
+    assert response.status_code == 400
+
+
 def test_create_bot(client):
     """Test creating a new bot"""
     bot_data = {
@@ -131,3 +148,26 @@ def test_create_bot(client):
     assert response.status_code == 201
     data = response.json()
     assert data["grid_id"] == "create_test_grid"
+
+
+def test_list_bots_paginated_and_sorted(client, test_db_session):
+    """Test server-side sorting and pagination of the bots list"""
+    test_db_session.add_all([make_bot(f"page_{i}", pnl=float(i % 3), symbol="ETHUSDT" if i % 2 else "BTCUSDT")
+                             for i in range(5)])
+    test_db_session.commit()
+
+    response = client.get("/bots/", params={"sort_by": "pnl", "order": "desc", "offset": 1, "limit": 2})
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "5"
+    # pnl: page_0=0, page_1=1, page_2=2, page_3=0, page_4=1; ties newest id first
+    assert [bot["grid_id"] for bot in response.json()] == ["page_4", "page_1"]
+
+    response = client.get("/bots/", params={"symbol": "ETHUSDT", "limit": 1})
+    assert response.headers["X-Total-Count"] == "2"
+    assert [bot["grid_id"] for bot in response.json()] == ["page_1"]
+
+
+def test_list_bots_rejects_unknown_sort_field(client):
+    """Test that only whitelisted fields can be sorted on"""
+    response = client.get("/bots/", params={"sort_by": "raw_data"})
+    assert response.status_code == 422
@@ -0,0 +1,31 @@
+import asyncio
+
+from src.backend.models import BotRawData
+from src.backend.services.bot_service import sync_bots_with_db
+from tests.factories import bybit_bot_payload, bybit_response
+
+
+def test_raw_data_is_served_separately(client, test_db_session):
+    payload = bybit_bot_payload("raw-1")
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(payload)))
+
+    listed = client.get("/bots/").json()
+    assert "raw_data" not in listed[0]
+
+    response = client.get("/bots/raw-1/raw")
+    assert response.status_code == 200
+    assert response.json() == {"grid_id": "raw-1", "raw_data": payload}
+
+
+def test_resync_overwrites_raw_payload(client, test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("raw-2", pnl="1"))))
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("raw-2", pnl="2"))))
+
+    assert test_db_session.query(BotRawData).count() == 1
+    raw = client.get("/bots/raw-2/raw").json()["raw_data"]
+    assert raw["future_grid"]["pnl"] == "2"
+
+
+def test_raw_data_missing_bot(client):
+    response = client.get("/bots/unknown/raw")
+    assert response.status_code == 404
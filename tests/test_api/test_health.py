@@ -0,0 +1,69 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.backend.routers.health import check_database_health
+from src.backend.services import bybit_service
+from src.backend.services.bybit_service import check_bybit_api_health, reset_bybit_health_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_health_cache():
+    reset_bybit_health_cache()
+    yield
+    reset_bybit_health_cache()
+
+
+def test_liveness(client):
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+
+
+def test_readiness(client):
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+def test_health_check_reports_dependencies(client):
+    with patch("src.backend.routers.health.check_bybit_api_health", AsyncMock(return_value="healthy")):
+        response = client.get("/health/")
+    assert response.status_code == 200
+    assert response.json()["dependencies"] == {"database": "healthy", "bybit_api": "healthy"}
+    assert response.json()["status"] == "healthy"
+
+
+def test_bybit_health_is_cached_within_ttl():
+    fake_client = AsyncMock()
+    fake_client.check_api_status.return_value = {"retCode": 0}
+    with patch.object(bybit_service, "get_bybit_client", return_value=fake_client):
+        assert asyncio.run(check_bybit_api_health(cache_ttl=60)) == "healthy"
+        assert asyncio.run(check_bybit_api_health(cache_ttl=60)) == "healthy"
+        assert fake_client.check_api_status.await_count == 1
+
+        asyncio.run(check_bybit_api_health(cache_ttl=0))
+        assert fake_client.check_api_status.await_count == 2
+
+
+def test_bybit_health_times_out():
+    async def slow_status():
+        await asyncio.sleep(1)
+        return {"retCode": 0}
+
+    fake_client = AsyncMock()
+    fake_client.check_api_status.side_effect = slow_status
+    with patch.object(bybit_service, "get_bybit_client", return_value=fake_client):
+        assert asyncio.run(check_bybit_api_health(timeout=0.01)) == "timeout"
+
+
+def test_database_health_times_out(test_db_engine):
+    def slow_ping(engine, timeout):
+        time.sleep(0.2)
+        return True
+
+    with patch("src.backend.routers.health._ping_database", side_effect=slow_ping):
+        assert asyncio.run(check_database_health(test_db_engine, timeout=0.01)) == "timeout"
+    assert asyncio.run(check_database_health(test_db_engine, timeout=1)) == "healthy"
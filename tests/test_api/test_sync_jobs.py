@@ -0,0 +1,141 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.backend.config import BybitAccount
+from src.backend.database import get_session_maker
+from src.backend.deps import get_settings
+from src.backend.main import app
+from src.backend.models import Bot, SyncJob
+from src.backend.services import account_sync, sync_jobs
+from src.backend.services.bybit_client import BybitClientError
+from src.backend.services.sync_jobs import SyncJobWorker, SyncRequest, get_sync_worker
+from tests.conftest import TestSettings
+from tests.factories import bybit_bot_payload, bybit_response, hanging_client, streaming_client
+
+
+@pytest.fixture
+def accounts(client):
+    app.dependency_overrides[get_settings] = lambda: TestSettings(
+        BYBIT_SECURE_TOKEN=None,
+        BYBIT_ACCOUNTS=[
+            BybitAccount(account_id="main", secure_token="token", device_id="device"),
+            BybitAccount(account_id="sub-1", secure_token="token", device_id="device"),
+        ]
+    )
+    clients = {
+        "main": streaming_client(bybit_response(bybit_bot_payload("g-1"), bybit_bot_payload("g-2"))),
+        "sub-1": streaming_client(bybit_response(bybit_bot_payload("g-3"))),
+    }
+    with patch.object(account_sync, "get_account_client", side_effect=lambda a: clients[a.account_id]):
+        yield clients
+
+
+def _wait_for_job(client, job_id):
+    # The worker shares the test's connection; let it finish before reading through the API
+    client.portal.call(get_sync_worker().join)
+    job = client.get(f"/sync-jobs/{job_id}").json()
+    assert job["status"] not in ("queued", "running")
+    return job
+
+
+def test_update_returns_202_and_job_reports_progress(client, accounts):
+    response = client.post("/bots/update")
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    assert response.headers["Location"] == f"/sync-jobs/{job_id}"
+
+    job = _wait_for_job(client, job_id)
+    assert job["status"] == "success"
+    assert (job["accounts_total"], job["accounts_done"]) == (2, 2)
+    assert job["pages_fetched"] == 2
+    assert job["bots_synced"] == 3
+    assert job["duration_ms"] > 0
+    assert {r["account_id"]: r["synced_bots_count"] for r in job["account_results"]} == {"main": 2, "sub-1": 1}
+
+    history = client.get("/sync-jobs/").json()
+    assert [j["id"] for j in history] == [job_id]
+
+
+def test_update_wait_returns_summary(client, accounts):
+    response = client.post("/bots/update", params={"wait": True})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sync_status"] == "success"
+    assert data["synced_bots_count"] == 3
+    assert "api_response" not in data
+
+
+def test_update_include_raw_echoes_responses(client, accounts):
+    response = client.post("/bots/update", params={"include_raw": True, "account": "sub-1"})
+    assert response.status_code == 200
+    assert list(response.json()["api_response"]) == ["sub-1"]
+
+
+def test_failed_job_records_errors(client, accounts):
+    accounts["sub-1"] = AsyncMock()
+    accounts["sub-1"].stream_trading_bots.side_effect = BybitClientError("unauthorized", code=401)
+
+    job_id = client.post("/bots/update").json()["job_id"]
+    job = _wait_for_job(client, job_id)
+    assert job["status"] == "partial"
+    assert "sub-1: unauthorized" in job["error"]
+
+    response = client.post("/bots/update", params={"wait": True, "account": "sub-1"})
+    assert response.status_code == 500
+
+
+def test_wait_past_deadline_returns_504(client, accounts):
+    accounts["sub-1"] = hanging_client()
+    response = client.post("/bots/update", params={"wait": True, "account": "sub-1", "timeout": 0.2})
+    assert response.status_code == 504
+
+
+def test_job_failing_without_results_returns_500(client, accounts):
+    with patch.object(sync_jobs, "run_sync", side_effect=RuntimeError("database gone")):
+        response = client.post("/bots/update", params={"wait": True})
+    assert response.status_code == 500
+
+
+def test_unknown_sync_job(client):
+    assert client.get("/sync-jobs/missing").status_code == 404
+
+
+def _run_until_waiter_leaves(detached_joiner: bool):
+    accounts = [BybitAccount(account_id=name, secure_token="token", device_id="device") for name in ("main", "slow")]
+    clients = {"main": streaming_client(bybit_response(bybit_bot_payload("g-1"))), "slow": hanging_client()}
+    worker = SyncJobWorker(get_session_maker(), TestSettings())
+
+    async def scenario():
+        worker.start()
+        try:
+            job_id, _ = worker.submit(SyncRequest(), accounts, timeout=0.5 if detached_joiner else 60, detached=False)
+            if detached_joiner:
+                worker.submit(SyncRequest(), accounts, timeout=0.5)
+            waiting = asyncio.ensure_future(worker.wait(job_id))
+            await asyncio.sleep(0.1)
+            # What the update endpoint does when its client disconnects
+            waiting.cancel()
+            await worker.join()
+            return job_id
+        finally:
+            await worker.stop()
+
+    with patch.object(account_sync, "get_account_client", side_effect=lambda a: clients[a.account_id]):
+        return asyncio.run(scenario())
+
+
+def test_job_is_cancelled_when_its_last_waiter_leaves(test_db_session):
+    job = test_db_session.get(SyncJob, _run_until_waiter_leaves(detached_joiner=False))
+    assert job.status == "cancelled"
+    assert job.duration_ms < 5000
+    # The page fetched before the cancellation is kept
+    assert [bot.grid_id for bot in test_db_session.query(Bot)] == ["g-1"]
+
+
+def test_detached_job_outlives_its_waiters(test_db_session):
+    job = test_db_session.get(SyncJob, _run_until_waiter_leaves(detached_joiner=True))
+    # Runs on until its deadline instead
+    assert job.status == "partial"
+    assert "slow: Deadline exceeded" in job.error
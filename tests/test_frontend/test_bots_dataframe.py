@@ -0,0 +1,55 @@
+import pandas as pd
+
+from src.frontend.utils.bots_dataframe import create_bots_dataframe, format_signed_amounts, shorten_grid_id
+from src.frontend.utils.time_formatter import format_duration, format_durations
+
+
+def _bot(grid_id: str, **overrides) -> dict:
+    bot = {
+        "id": 1,
+        "grid_id": grid_id,
+        "symbol": "BTCUSDT",
+        "status": "RUNNING",
+        "leverage": 5,
+        "total_investment": 1000.456,
+        "pnl": -12.346,
+        "pnl_percentage": 1.5,
+        "current_price": 50000.123456,
+        "running_duration": 93784,
+        "arbitrage_num": 3,
+    }
+    bot.update(overrides)
+    return bot
+
+
+def test_format_durations_matches_scalar_rules():
+    seconds = pd.Series([0, 59, 60, 3599, 3600, 86399, 86400, 93784, "7200.9", "", None, "abc"])
+    assert list(format_durations(seconds)) == [
+        "0m", "0m", "1m", "59m", "1h 0m", "23h 59m", "1D 0h 0m", "1D 2h 3m", "2h 0m", "0m", "0m", "0m",
+    ]
+    assert format_duration("90000") == "1D 1h 0m"
+
+
+def test_format_signed_amounts():
+    values = pd.Series([12.34, -12.34, 0.0, -0.0, 1234567.5, -0.05])
+    assert list(format_signed_amounts(values)) == [
+        f"{'🔴' if x < 0 else '🟢'} {x:.2f}" for x in values
+    ]
+    assert list(format_signed_amounts(pd.Series([1.5]), suffix="%")) == ["🟢 1.50%"]
+
+
+def test_create_bots_dataframe():
+    df = create_bots_dataframe([_bot("grid-1"), _bot("grid-2", pnl=3.0, running_duration=120)])
+
+    assert list(df["Bot ID"]) == [shorten_grid_id("grid-1"), shorten_grid_id("grid-2")]
+    assert list(df["Original Grid ID"]) == ["grid-1", "grid-2"]
+    assert list(df["Investment"]) == [1000.46, 1000.46]
+    assert list(df["PnL"]) == ["🔴 -12.35", "🟢 3.00"]
+    assert list(df["PnL_numeric"]) == [-12.35, 3.0]
+    assert list(df["PnL %"]) == ["🟢 1.50%", "🟢 1.50%"]
+    assert list(df["Duration (h)"]) == ["1D 2h 3m", "2m"]
+    assert list(df["Current Price"]) == [50000.1235, 50000.1235]
+
+
+def test_create_bots_dataframe_empty():
+    assert create_bots_dataframe([]).empty
@@ -0,0 +1,18 @@
+from src.backend.database import PoolConfig, build_engine_options
+
+
+def test_postgres_engine_options_use_pool_config():
+    pool = PoolConfig(pool_size=20, max_overflow=5, pool_recycle=600, pool_timeout=3, statement_timeout_ms=1500)
+    options = build_engine_options("postgresql://user:pw@db/app", pool)
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 5
+    assert options["pool_recycle"] == 600
+    assert options["pool_timeout"] == 3
+    assert options["connect_args"] == {"options": "-c statement_timeout=1500"}
+    assert options["echo"] is False
+
+
+def test_sqlite_engine_options_skip_pool_sizing():
+    options = build_engine_options("sqlite:///./test.db", PoolConfig(statement_timeout_ms=1500))
+    assert "pool_size" not in options
+    assert "connect_args" not in options
@@ -0,0 +1,19 @@
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+
+from src.backend.database import get_schema_revisions
+from src.backend.models import Base
+
+
+def test_schema_is_at_head(test_db_engine):
+    """The test database is built by the migrations and ends at head"""
+    current, head = get_schema_revisions(test_db_engine)
+    assert current == head
+
+
+def test_migrations_match_models(test_db_engine):
+    """Models and migrations must not drift apart"""
+    with test_db_engine.connect() as connection:
+        context = MigrationContext.configure(connection)
+        diff = compare_metadata(context, Base.metadata)
+    assert diff == []
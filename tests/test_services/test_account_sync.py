@@ -0,0 +1,101 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+from src.backend.config import BybitAccount
+from src.backend.models import Bot
+from src.backend.services import account_sync
+from src.backend.services.account_sync import sync_accounts
+from src.backend.services.bybit_client import BybitClientError
+from src.backend.services.sync_deadline import DEADLINE_EXCEEDED, SyncDeadline
+from tests.factories import bybit_bot_payload, bybit_response, hanging_client, streaming_client
+
+
+def _account(account_id: str) -> BybitAccount:
+    return BybitAccount(account_id=account_id, secure_token="token", device_id="device")
+
+
+def test_sync_accounts_tags_bots_and_isolates_failures(test_db_session):
+    clients = {
+        "main": streaming_client(bybit_response(bybit_bot_payload("g-1"))),
+        "sub-1": streaming_client(bybit_response(
+            bybit_bot_payload("g-2", symbol="ETHUSDT"), bybit_bot_payload("g-3")
+        )),
+        "sub-2": AsyncMock(),
+    }
+    clients["sub-2"].stream_trading_bots.side_effect = BybitClientError("unauthorized", code=401)
+
+    with patch.object(account_sync, "get_account_client", side_effect=lambda a: clients[a.account_id]):
+        results = asyncio.run(sync_accounts(
+            test_db_session, [_account(name) for name in clients], max_concurrency=2
+        ))
+
+    by_account = {r.account_id: r for r in results}
+    assert by_account["main"].synced_bots_count == 1
+    assert by_account["sub-1"].synced_bots_count == 2
+    assert by_account["sub-2"].status == "failed"
+
+    accounts = dict(test_db_session.query(Bot.grid_id, Bot.account_id).all())
+    assert accounts == {"g-1": "main", "g-2": "sub-1", "g-3": "sub-1"}
+
+
+def test_list_bots_filters_by_account(client, test_db_session):
+    clients = {
+        "main": streaming_client(bybit_response(bybit_bot_payload("g-1"))),
+        "sub-1": streaming_client(bybit_response(bybit_bot_payload("g-2"))),
+    }
+    with patch.object(account_sync, "get_account_client", side_effect=lambda a: clients[a.account_id]):
+        asyncio.run(sync_accounts(test_db_session, [_account(name) for name in clients]))
+
+    response = client.get("/bots/", params={"account": "sub-1"})
+    assert response.status_code == 200
+    assert [bot["grid_id"] for bot in response.json()] == ["g-2"]
+
+
+def test_sync_accounts_keeps_raw_response_only_on_request(test_db_session):
+    response = bybit_response(bybit_bot_payload("g-1"))
+    clients = {"main": streaming_client(response)}
+    with patch.object(account_sync, "get_account_client", side_effect=lambda a: clients[a.account_id]):
+        lean = asyncio.run(sync_accounts(test_db_session, [_account("main")]))
+        raw = asyncio.run(sync_accounts(test_db_session, [_account("main")], keep_response=True))
+
+    assert lean[0].api_response is None
+    assert clients["main"].get_trading_bots.await_count == 1
+    assert raw[0].api_response == response
+    assert raw[0].synced_bots_count == 1
+
+
+def test_deadline_keeps_fetched_pages_and_abandons_the_rest(test_db_session):
+    clients = {
+        "main": streaming_client(bybit_response(bybit_bot_payload("g-1"))),
+        "slow": hanging_client(),
+    }
+
+    async def scenario():
+        return await sync_accounts(
+            test_db_session, [_account(name) for name in clients], deadline=SyncDeadline(0.2)
+        )
+
+    started = time.monotonic()
+    with patch.object(account_sync, "get_account_client", side_effect=lambda a: clients[a.account_id]):
+        results = asyncio.run(scenario())
+
+    assert time.monotonic() - started < 2
+    by_account = {r.account_id: r for r in results}
+    assert by_account["main"].status == "success"
+    assert (by_account["slow"].status, by_account["slow"].error) == ("failed", DEADLINE_EXCEEDED)
+    # The partly read page of the slow account is not written
+    assert [bot.grid_id for bot in test_db_session.query(Bot)] == ["g-1"]
+
+
+def test_expired_deadline_fetches_nothing(test_db_session):
+    client = streaming_client(bybit_response(bybit_bot_payload("g-1")))
+
+    async def scenario():
+        return await sync_accounts(test_db_session, [_account("main")], deadline=SyncDeadline(0))
+
+    with patch.object(account_sync, "get_account_client", return_value=client):
+        results = asyncio.run(scenario())
+
+    assert results[0].error == DEADLINE_EXCEEDED
+    client.stream_trading_bots.assert_not_called()
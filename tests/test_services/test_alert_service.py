@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from src.backend.config import AlertRule
+from src.backend.services.alert_service import AlertEngine, AlertSink, RuleIndex, WebhookSink, get_alert_engine
+from src.backend.services.bot_changes import BotChange, bot_snapshot
+from src.backend.services.bot_service import sync_bots_with_db
+from tests.factories import bybit_bot_payload, bybit_response, make_bot
+
+
+class ListSink(AlertSink):
+    def __init__(self):
+        self.batches = []
+
+    def deliver(self, alerts):
+        self.batches.append(alerts)
+
+
+def _change(grid_id="g-1", old=None, **new_values):
+    new = bot_snapshot(make_bot(grid_id, **new_values))
+    return BotChange(grid_id, old, new)
+
+
+NEAR_LIQ = AlertRule(name="near-liq", kind="near_liquidation", threshold=5)
+
+
+def test_rule_index_matches_symbol_and_changed_fields():
+    index = RuleIndex([
+        NEAR_LIQ,
+        AlertRule(name="eth-pnl", kind="pnl_below", threshold=-5, symbols=["ETHUSDT"]),
+        AlertRule(name="stopped", kind="stopped"),
+    ])
+
+    assert [r.name for r in index.candidates("BTCUSDT", {"current_price", "liq_price"})] == ["near-liq"]
+    assert [r.name for r in index.candidates("BTCUSDT", {"pnl_percentage"})] == []
+    assert [r.name for r in index.candidates("ETHUSDT", {"pnl_percentage"})] == ["eth-pnl"]
+    assert [r.name for r in index.candidates("ETHUSDT", {"status"})] == ["stopped"]
+
+
+def test_rule_needing_threshold_is_rejected():
+    with pytest.raises(ValueError):
+        RuleIndex([AlertRule(name="pnl", kind="pnl_below")])
+
+
+def test_firing_is_deduplicated_and_debounced():
+    sink = ListSink()
+    engine = AlertEngine([NEAR_LIQ], [sink], debounce_seconds=60)
+    near = dict(current_price=100.0, liq_price=97.0)
+    far = dict(current_price=100.0, liq_price=80.0)
+
+    assert len(engine.evaluate([_change(**near)], now=0)) == 1
+    # Still holding: no new alert
+    assert engine.evaluate([_change(current_price=100.0, liq_price=98.0)], now=10) == []
+    # Clears and re-triggers inside the debounce window
+    engine.evaluate([_change(**far)], now=20)
+    assert engine.evaluate([_change(**near)], now=30) == []
+    assert engine.suppressed == 1
+    # Clears and re-triggers after it
+    engine.evaluate([_change(**far)], now=100)
+    assert len(engine.evaluate([_change(**near)], now=110)) == 1
+    engine.flush()
+    assert len(sink.batches) == 2
+
+
+def test_suppressed_condition_still_holding_fires_after_window():
+    engine = AlertEngine([NEAR_LIQ], debounce_seconds=60)
+
+    assert len(engine.evaluate([_change(current_price=100.0, liq_price=97.0)], now=0)) == 1
+    engine.evaluate([_change(current_price=100.0, liq_price=80.0)], now=20)
+    assert engine.evaluate([_change(current_price=100.0, liq_price=97.0)], now=30) == []
+    # Never cleared since the suppressed re-trigger
+    assert len(engine.evaluate([_change(current_price=100.0, liq_price=98.0)], now=70)) == 1
+
+
+def test_unchanged_inputs_are_not_evaluated():
+    engine = AlertEngine([NEAR_LIQ])
+    snapshot = bot_snapshot(make_bot("g-1", current_price=100.0, liq_price=97.0))
+    engine.evaluate([BotChange("g-1", dict(snapshot, pnl=1.0), snapshot)])
+    assert engine.evaluated == 0
+
+
+def test_stopped_fires_only_on_transition():
+    engine = AlertEngine([AlertRule(name="stopped", kind="stopped")])
+    running = bot_snapshot(make_bot("g-1"))
+
+    assert engine.evaluate([_change(status="COMPLETED")]) == []
+    alerts = engine.evaluate([_change(old=running, status="COMPLETED", close_detail="take profit")])
+    assert [alert.message for alert in alerts] == ["Bot stopped: COMPLETED (take profit)"]
+
+
+def test_failing_sink_does_not_block_others():
+    class BrokenSink(AlertSink):
+        def deliver(self, alerts):
+            raise RuntimeError("down")
+
+    sink = ListSink()
+    engine = AlertEngine([NEAR_LIQ], [BrokenSink(), sink])
+    engine.evaluate([_change(current_price=100.0, liq_price=97.0)])
+    engine.flush()
+    assert engine.delivery_errors == 1
+    assert len(sink.batches) == 1
+
+
+def test_webhook_sink_posts_alerts():
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    sink = WebhookSink("https://hooks.example.com/bots", client=httpx.Client(transport=httpx.MockTransport(handler)))
+    engine = AlertEngine([NEAR_LIQ], [sink])
+    engine.evaluate([_change(current_price=100.0, liq_price=97.0)])
+    engine.flush()
+
+    assert [alert["rule"] for alert in requests[0]["alerts"]] == ["near-liq"]
+
+
+def test_slow_sink_does_not_block_evaluation():
+    released = threading.Event()
+
+    class SlowSink(AlertSink):
+        def deliver(self, alerts):
+            released.wait(5)
+
+    sink = ListSink()
+    engine = AlertEngine([NEAR_LIQ], [SlowSink(), sink])
+    alerts = engine.evaluate([_change(current_price=100.0, liq_price=97.0)])
+
+    assert len(alerts) == 1
+    assert sink.batches == []
+    released.set()
+    engine.stop()
+    assert len(sink.batches) == 1
+
+
+def test_sync_evaluates_rules_on_changed_bots(test_db_session):
+    sink = ListSink()
+    engine = get_alert_engine()
+    engine.configure([AlertRule(name="loss", kind="pnl_below", threshold=0)], [sink], debounce_seconds=0)
+    try:
+        asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("g-1"))))
+        asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("g-1", pnl_per="-0.02"))))
+        asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("g-1", pnl_per="-0.03"))))
+        engine.flush()
+    finally:
+        engine.configure([], [], debounce_seconds=900)
+
+    assert [[alert.grid_id for alert in batch] for batch in sink.batches] == [["g-1"]]
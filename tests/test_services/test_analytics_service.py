@@ -0,0 +1,156 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from src.backend.models import BotMetricHistory
+from src.backend.services.analytics_service import (
+    AnalyticsCache, compute_bot_analytics, prune_metric_history, summarize_by_symbol
+)
+from src.backend.services.bot_service import sync_bots_with_db
+from tests.factories import bybit_bot_payload, bybit_response
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _history(samples):
+    """samples: (grid_id, symbol, hours after START, pnl, total_investment)"""
+    return pd.DataFrame(
+        [(grid_id, symbol, START + timedelta(hours=hours), pnl, investment)
+         for grid_id, symbol, hours, pnl, investment in samples],
+        columns=["grid_id", "symbol", "recorded_at", "pnl", "total_investment"]
+    )
+
+
+def test_compute_bot_analytics_metrics():
+    metrics = compute_bot_analytics(_history([
+        ("g-1", "BTCUSDT", 0, 10.0, 1000.0),
+        ("g-1", "BTCUSDT", 1, 30.0, 1000.0),
+        ("g-1", "BTCUSDT", 2, 20.0, 1000.0),
+        ("g-1", "BTCUSDT", 3, 40.0, 1000.0),
+        ("g-2", "ETHUSDT", 5, 7.0, 500.0),
+    ]), window_hours=24)
+
+    bot = metrics.loc["g-1"]
+    assert bot["samples"] == 4
+    assert bot["pnl_change"] == 30.0
+    assert bot["max_drawdown"] == 10.0
+    assert bot["max_drawdown_pct"] == pytest.approx(1.0)
+    assert bot["pnl_velocity"] == pytest.approx(8.0)
+    assert bot["rolling_apr"] == pytest.approx(30.0 / 1000 * 365 * 24 / 3 * 100)
+    # A single sample has no rate
+    single = metrics.loc["g-2"]
+    assert single["samples"] == 1
+    assert pd.isna(single["rolling_apr"]) and pd.isna(single["pnl_velocity"])
+
+
+def test_compute_bot_analytics_window_ends_at_latest_sample():
+    metrics = compute_bot_analytics(_history([
+        ("g-1", "BTCUSDT", 0, 100.0, 1000.0),
+        ("g-1", "BTCUSDT", 10, 0.0, 1000.0),
+        ("g-1", "BTCUSDT", 11, 5.0, 1000.0),
+    ]), window_hours=2)
+
+    assert metrics.loc["g-1", "samples"] == 2
+    assert metrics.loc["g-1", "pnl_change"] == 5.0
+    assert metrics.loc["g-1", "max_drawdown"] == 0.0
+
+
+def test_summarize_by_symbol():
+    metrics = compute_bot_analytics(_history([
+        ("g-1", "BTCUSDT", 0, 0.0, 1000.0),
+        ("g-1", "BTCUSDT", 1, 10.0, 1000.0),
+        ("g-2", "BTCUSDT", 0, 0.0, 1000.0),
+        ("g-2", "BTCUSDT", 1, -5.0, 1000.0),
+    ]), window_hours=24)
+
+    summary = summarize_by_symbol(metrics).loc["BTCUSDT"]
+    assert summary["bot_count"] == 2
+    assert summary["pnl_change"] == 5.0
+    assert summary["pnl_velocity"] == pytest.approx(5.0)
+    assert summary["max_drawdown_pct"] == pytest.approx(0.5)
+
+
+def test_sync_records_samples_only_for_changed_bots(test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2"),
+    )))
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1", pnl="12"),
+        bybit_bot_payload("g-2"),
+    )))
+
+    samples = test_db_session.query(BotMetricHistory).order_by(BotMetricHistory.id).all()
+    assert [(s.grid_id, s.pnl) for s in samples] == [("g-1", 10.0), ("g-2", 10.0), ("g-1", 12.0)]
+
+
+def test_analytics_cache_recomputes_only_bots_with_new_samples(test_db_session):
+    cache = AnalyticsCache()
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2"),
+        bybit_bot_payload("g-3"),
+    )))
+
+    assert len(cache.bot_analytics(test_db_session, 24)) == 3
+    assert cache.recomputed_bots == 3
+    cache.bot_analytics(test_db_session, 24)
+    assert cache.recomputed_bots == 3
+
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2", pnl="25"),
+        bybit_bot_payload("g-3"),
+    )))
+    metrics = cache.bot_analytics(test_db_session, 24)
+    assert cache.recomputed_bots == 4
+    assert metrics.loc["g-2", "samples"] == 2
+    assert metrics.loc["g-2", "pnl_change"] == 15.0
+
+
+def test_prune_metric_history(test_db_session):
+    test_db_session.add_all([
+        BotMetricHistory(grid_id="g-1", symbol="BTCUSDT", recorded_at=datetime.now(timezone.utc) - timedelta(days=40),
+                         pnl=1.0, pnl_percentage=0.1, total_investment=100.0, total_apr=1.0, current_price=1.0),
+        BotMetricHistory(grid_id="g-1", symbol="BTCUSDT", recorded_at=datetime.now(timezone.utc),
+                         pnl=2.0, pnl_percentage=0.2, total_investment=100.0, total_apr=1.0, current_price=1.0),
+    ])
+    test_db_session.commit()
+
+    assert prune_metric_history(test_db_session, retention_days=30) == 1
+    assert test_db_session.query(BotMetricHistory).count() == 1
+
+
+def test_analytics_endpoint(client, test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2", symbol="ETHUSDT"),
+    )))
+
+    response = client.get("/bots/analytics", params={"window_hours": 24, "symbol": "ETHUSDT"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["window_hours"] == 24
+    assert [bot["grid_id"] for bot in data["bots"]] == ["g-2"]
+    assert data["bots"][0]["rolling_apr"] is None
+    assert data["symbols"] == [{
+        "symbol": "ETHUSDT", "bot_count": 1, "pnl_change": 0.0,
+        "pnl_velocity": None, "rolling_apr": None, "max_drawdown_pct": 0.0,
+    }]
+
+
+def test_analytics_cache_keeps_recent_windows_only(test_db_session):
+    cache = AnalyticsCache(max_windows=2)
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("g-1"))))
+
+    for window_hours in (1.0, 1.0001, 24.0):
+        cache.bot_analytics(test_db_session, window_hours)
+    cache.bot_analytics(test_db_session, 1.0001)
+
+    assert cache.recomputed_bots == 3
+    # The oldest window was evicted and is computed again
+    cache.bot_analytics(test_db_session, 1.0)
+    assert cache.recomputed_bots == 4
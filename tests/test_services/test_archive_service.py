@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from src.backend.models import ArchivedBot, Bot, BotRawData, SymbolRollup
+from src.backend.models.bot import CLOSED_STATUS
+from src.backend.services.account_sync import is_complete_listing
+from src.backend.services.archive_service import archive_closed_bots, count_bots_in_scope, list_bots_in_scope
+from src.backend.services.bot_service import sync_bots_with_db
+from tests.factories import bybit_bot_payload, bybit_response, make_bot
+
+
+def _statuses(session):
+    session.expire_all()
+    return {bot.grid_id: (bot.status, bot.close_detail) for bot in session.query(Bot)}
+
+
+def test_complete_listing_closes_missing_running_bots(test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2"),
+    )))
+    asyncio.run(sync_bots_with_db(
+        test_db_session, bybit_response(bybit_bot_payload("g-1")), complete_listing=True
+    ))
+
+    statuses = _statuses(test_db_session)
+    assert statuses["g-1"] == ("RUNNING", None)
+    assert statuses["g-2"][0] == CLOSED_STATUS
+    assert statuses["g-2"][1] is not None
+    rollup = test_db_session.get(SymbolRollup, "BTCUSDT")
+    assert (rollup.bot_count, rollup.running_count) == (2, 1)
+
+
+def test_partial_listing_does_not_close_bots(test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2"),
+    )))
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("g-1"))))
+
+    assert _statuses(test_db_session)["g-2"] == ("RUNNING", None)
+
+
+def test_bots_failing_to_transform_are_not_closed(test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2"),
+    )))
+    # g-2 is still listed, it just has a malformed field this time
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2", pnl=""),
+    ), complete_listing=True))
+
+    assert _statuses(test_db_session) == {"g-1": ("RUNNING", None), "g-2": ("RUNNING", None)}
+
+
+def test_listing_with_unidentified_bots_is_not_reconciled(test_db_session):
+    test_db_session.add(make_bot("g-1"))
+    test_db_session.commit()
+
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response({"type": "GRID_FUTURES"}), complete_listing=True))
+
+    assert _statuses(test_db_session)["g-1"] == ("RUNNING", None)
+
+
+def test_empty_complete_listing_closes_all_bots_of_account(test_db_session):
+    test_db_session.add_all([make_bot("g-1"), make_bot("g-2", account_id="other")])
+    test_db_session.commit()
+
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(), complete_listing=True))
+
+    statuses = _statuses(test_db_session)
+    assert statuses["g-1"][0] == CLOSED_STATUS
+    assert statuses["g-2"][0] == "RUNNING"
+
+
+def test_archive_moves_closed_bots_in_batches(test_db_session):
+    old = datetime.now(timezone.utc) - timedelta(days=2)
+    test_db_session.add_all([
+        make_bot("live", last_synced_at=old),
+        make_bot("closed-1", status=CLOSED_STATUS, last_synced_at=old),
+        make_bot("closed-2", status="COMPLETED", close_detail="take profit", last_synced_at=old),
+        make_bot("closed-3", status="COMPLETED", last_synced_at=old),
+        make_bot("recent", status=CLOSED_STATUS),
+    ])
+    test_db_session.commit()
+
+    assert archive_closed_bots(test_db_session, batch_size=2, min_age_seconds=86400) == 3
+
+    live = {bot.grid_id for bot in list_bots_in_scope(test_db_session, "live")}
+    archived = {bot.grid_id for bot in list_bots_in_scope(test_db_session, "archived")}
+    assert live == {"live", "recent"}
+    assert archived == {"closed-1", "closed-2", "closed-3"}
+    assert len(list_bots_in_scope(test_db_session, "all")) == 5
+    # Archived row keeps its data; raw payloads stay addressable by grid_id
+    assert test_db_session.query(ArchivedBot).filter_by(grid_id="closed-2").one().close_detail == "take profit"
+    assert test_db_session.get(BotRawData, "closed-2") is not None
+
+
+def test_scope_all_pages_across_live_and_archive(test_db_session):
+    old = datetime.now(timezone.utc) - timedelta(days=2)
+    test_db_session.add_all([
+        make_bot(f"g-{i}", pnl=float(i), status=CLOSED_STATUS if i % 2 else "RUNNING", last_synced_at=old)
+        for i in range(6)
+    ])
+    test_db_session.commit()
+    archive_closed_bots(test_db_session)
+
+    page = list_bots_in_scope(test_db_session, "all", sort_by="pnl", descending=True, offset=1, limit=3)
+    assert [bot.grid_id for bot in page] == ["g-4", "g-3", "g-2"]
+    assert count_bots_in_scope(test_db_session, "all") == 6
+    assert count_bots_in_scope(test_db_session, "archived") == 3
+
+
+def test_archived_bots_are_not_resurrected_by_sync(test_db_session):
+    test_db_session.add(make_bot(
+        "g-1", status=CLOSED_STATUS, last_synced_at=datetime.now(timezone.utc) - timedelta(days=2)
+    ))
+    test_db_session.commit()
+    archive_closed_bots(test_db_session, min_age_seconds=3600)
+
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("g-1"))))
+
+    assert test_db_session.query(Bot).count() == 0
+    assert test_db_session.query(ArchivedBot).count() == 1
+
+
+def test_is_complete_listing():
+    response = bybit_response(bybit_bot_payload("g-1"))
+    assert is_complete_listing(response, page=0, limit=150, status=0)
+    assert not is_complete_listing(response, page=1, limit=150, status=0)
+    assert not is_complete_listing(response, page=0, limit=1, status=0)
+    assert not is_complete_listing(response, page=0, limit=150, status=1)
+    assert not is_complete_listing({"result": None}, page=0, limit=150, status=0)
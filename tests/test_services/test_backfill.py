@@ -0,0 +1,90 @@
+import asyncio
+from unittest.mock import patch
+
+from src.backend.config import BybitAccount
+from src.backend.models import ArchivedBot, BackfillCheckpoint, Bot, SymbolRollup
+from src.backend.services import backfill
+from src.backend.services.archive_service import archive_closed_bots
+from src.backend.services.backfill import backfill_account, backfill_accounts
+from tests.factories import bybit_bot_payload, make_bot, paged_client
+
+ACCOUNT = BybitAccount(account_id="main", secure_token="token", device_id="device")
+
+
+def _pages():
+    return (
+        [bybit_bot_payload("g-0"), bybit_bot_payload("g-1")],
+        [bybit_bot_payload("g-2", symbol="ETHUSDT", status="COMPLETED"), bybit_bot_payload("g-3")],
+        [bybit_bot_payload("g-4")],
+    )
+
+
+def _requested_pages(client):
+    return [call.kwargs["page"] for call in client.stream_trading_bots.call_args_list]
+
+
+def test_backfill_resumes_from_checkpoint(test_db_session):
+    client = paged_client(*_pages(), fail_pages=[1])
+    with patch.object(backfill, "get_account_client", return_value=client):
+        failed = asyncio.run(backfill_accounts(test_db_session, [ACCOUNT], statuses=[0], limit=2, batch_size=1))
+        checkpoint = test_db_session.get(BackfillCheckpoint, ("main", 0))
+        assert (checkpoint.next_page, checkpoint.rows_loaded, checkpoint.finished_at) == (1, 2, None)
+
+        resumed = asyncio.run(backfill_accounts(test_db_session, [ACCOUNT], statuses=[0], limit=2, batch_size=1))
+        again = asyncio.run(backfill_accounts(test_db_session, [ACCOUNT], statuses=[0], limit=2))
+
+    assert (failed[0].status, failed[0].rows_loaded) == ("failed", 2)
+    assert "Bybit unavailable" in failed[0].error
+    assert (resumed[0].status, resumed[0].resumed_from_page, resumed[0].rows_loaded) == ("finished", 1, 3)
+    assert resumed[0].rows_per_second > 0
+    assert again[0].status == "already_finished"
+    # The failed page is the only one requested twice
+    assert _requested_pages(client) == [0, 1, 1, 2]
+
+    test_db_session.expire_all()
+    checkpoint = test_db_session.get(BackfillCheckpoint, ("main", 0))
+    assert (checkpoint.next_page, checkpoint.pages_loaded, checkpoint.rows_loaded) == (3, 3, 5)
+    assert checkpoint.finished_at is not None
+    assert sorted(grid_id for grid_id, in test_db_session.query(Bot.grid_id)) == ["g-0", "g-1", "g-2", "g-3", "g-4"]
+    rollups = {row.symbol: (row.bot_count, row.running_count) for row in test_db_session.query(SymbolRollup)}
+    assert rollups == {"BTCUSDT": (4, 4), "ETHUSDT": (1, 0)}
+
+
+def test_backfill_upserts_existing_bots(test_db_session):
+    test_db_session.add(make_bot("g-1", pnl=1.0))
+    test_db_session.commit()
+    client = paged_client([
+        bybit_bot_payload("g-1", pnl="42"),
+        bybit_bot_payload("g-1", pnl="43"),  # listed twice: the last one wins
+        bybit_bot_payload("g-2"),
+    ])
+    with patch.object(backfill, "get_account_client", return_value=client):
+        report = asyncio.run(backfill_account(test_db_session, ACCOUNT, limit=10))
+
+    assert (report.status, report.pages_loaded, report.rows_loaded) == ("finished", 1, 2)
+    test_db_session.expire_all()
+    bot = test_db_session.query(Bot).filter_by(grid_id="g-1").one()
+    assert (bot.pnl, bot.account_id) == (43.0, "main")
+    assert bot.updated_at is not None
+    assert bot.raw_data["future_grid"]["pnl"] == "43"
+
+
+def test_restart_walks_from_the_first_page(test_db_session):
+    client = paged_client([bybit_bot_payload("g-1")])
+    with patch.object(backfill, "get_account_client", return_value=client):
+        asyncio.run(backfill_account(test_db_session, ACCOUNT, limit=10))
+        report = asyncio.run(backfill_account(test_db_session, ACCOUNT, limit=10, restart=True))
+
+    assert (report.status, report.resumed_from_page, report.rows_loaded) == ("finished", 0, 1)
+    assert _requested_pages(client) == [0, 0]
+
+
+def test_closed_bots_are_left_for_the_archive_pass(test_db_session):
+    client = paged_client([bybit_bot_payload("g-1"), bybit_bot_payload("g-2", status="COMPLETED")])
+    with patch.object(backfill, "get_account_client", return_value=client):
+        asyncio.run(backfill_account(test_db_session, ACCOUNT, status=2, limit=10))
+
+    # Closed long enough for any minimum age; the running bot stays live
+    assert archive_closed_bots(test_db_session, min_age_seconds=86400) == 1
+    assert [grid_id for grid_id, in test_db_session.query(Bot.grid_id)] == ["g-1"]
+    assert [grid_id for grid_id, in test_db_session.query(ArchivedBot.grid_id)] == ["g-2"]
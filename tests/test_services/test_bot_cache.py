@@ -0,0 +1,71 @@
+import asyncio
+
+from src.backend.deps import get_settings
+from src.backend.main import app
+from src.backend.services.bot_cache import BotCache
+from src.backend.services.bot_service import sync_bots_with_db
+from tests.conftest import TestSettings
+from tests.factories import bybit_bot_payload, bybit_response, make_bot
+
+
+def test_cache_serves_indexed_reads_until_a_sync_commits(test_db_session):
+    cache = BotCache()
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2", symbol="ETHUSDT", status="COMPLETED"),
+    )))
+
+    assert [bot.grid_id for bot in cache.list(test_db_session)] == ["g-1", "g-2"]
+    assert [bot.grid_id for bot in cache.list(test_db_session, symbol="ETHUSDT")] == ["g-2"]
+    assert [bot.grid_id for bot in cache.list(test_db_session, status="RUNNING", symbol="ETHUSDT")] == []
+    assert cache.get(test_db_session, "g-1").symbol == "BTCUSDT"
+    assert cache.get(test_db_session, "missing") is None
+    assert (cache.stats.misses, cache.stats.hits) == (1, 4)
+
+    # Writes that bypass the sync are not seen until the snapshot expires
+    test_db_session.add(make_bot("g-3"))
+    test_db_session.commit()
+    assert cache.get(test_db_session, "g-3") is None
+
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("g-4"))))
+    assert {bot.grid_id for bot in cache.list(test_db_session)} == {"g-1", "g-2", "g-3", "g-4"}
+    assert cache.stats.misses == 2
+
+
+def test_cache_pages_sorted_fleet(test_db_session):
+    cache = BotCache()
+    test_db_session.add_all([make_bot(f"g-{i}", total_apr=float(10 - i), status="RUNNING" if i % 2 else "COMPLETED")
+                             for i in range(6)])
+    test_db_session.commit()
+
+    page, total = cache.page(test_db_session, sort_by="total_apr", offset=1, limit=2)
+    assert total == 6
+    assert [bot.grid_id for bot in page] == ["g-4", "g-3"]
+
+    page, total = cache.page(test_db_session, status="RUNNING", sort_by="total_apr", descending=True)
+    assert total == 3
+    assert [bot.grid_id for bot in page] == ["g-1", "g-3", "g-5"]
+
+
+def test_snapshot_expires_after_ttl(test_db_session):
+    cache = BotCache(ttl=0.0)
+    test_db_session.add(make_bot("g-1"))
+    test_db_session.commit()
+    cache.list(test_db_session)
+    cache.list(test_db_session)
+    assert (cache.stats.misses, cache.stats.hits) == (2, 0)
+
+
+def test_list_endpoint_reads_from_cache(client, test_db_session):
+    app.dependency_overrides[get_settings] = lambda: TestSettings(BOT_CACHE_ENABLED=True)
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2", symbol="ETHUSDT"),
+    )))
+
+    response = client.get("/bots/", params={"symbol": "ETHUSDT"})
+    assert response.status_code == 200
+    assert [bot["grid_id"] for bot in response.json()] == ["g-2"]
+    stats = client.get("/debug/bot-cache").json()
+    assert stats["size"] == 2
+    assert stats["version"] == stats["data_version"]
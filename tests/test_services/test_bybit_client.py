@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.backend.services.bybit_client import BybitClient, BybitClientConfig, BybitClientError
+from src.backend.services.json_stream import ArrayStreamParser
+from tests.factories import bybit_bot_payload, bybit_response
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, body: bytes, size: int):
+        self.chunks = [body[i:i + size] for i in range(0, len(body), size)]
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def _client(handler) -> BybitClient:
+    return BybitClient(
+        BybitClientConfig(secure_token="token", device_id="device"),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+def _document():
+    response = bybit_response(*(bybit_bot_payload(f"g-{i}", close_detail='say "hi" ]}') for i in range(5)))
+    response["result"]["total"] = 5
+    response["ext_info"] = {"bots": "not the list"}
+    return response
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 10_000])
+def test_array_stream_parser_yields_items_across_chunks(chunk_size):
+    document = _document()
+    text = json.dumps(document, indent=1)
+    parser = ArrayStreamParser("bots")
+
+    items = []
+    for i in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[i:i + chunk_size]))
+    envelope = parser.close()
+
+    assert items == document["result"]["bots"]
+    assert envelope["result"] == {"bots": [], "total": 5}
+    assert envelope["ext_info"] == {"bots": "not the list"}
+
+
+def test_array_stream_parser_rejects_truncated_document():
+    text = json.dumps(_document())
+    parser = ArrayStreamParser("bots")
+    parser.feed(text[:len(text) // 2])
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_stream_trading_bots_feeds_bots_while_reading():
+    body = json.dumps(_document()).encode()
+    client = _client(lambda request: httpx.Response(200, stream=ChunkedStream(body, 64)))
+    received = []
+
+    envelope = asyncio.run(client.stream_trading_bots(received.append, limit=5))
+
+    assert [bot["future_grid"]["grid_id"] for bot in received] == [f"g-{i}" for i in range(5)]
+    assert envelope["ret_code"] == 0
+    assert envelope["result"]["bots"] == []
+
+
+def test_stream_trading_bots_without_bot_list_raises():
+    client = _client(lambda request: httpx.Response(200, json={"ret_code": 10007, "ret_msg": "not logged in"}))
+    with pytest.raises(BybitClientError, match="not logged in"):
+        asyncio.run(client.stream_trading_bots(lambda bot: None))
+
+
+def test_stream_trading_bots_http_error():
+    client = _client(lambda request: httpx.Response(403, text="forbidden"))
+    with pytest.raises(BybitClientError, match="forbidden"):
+        asyncio.run(client.stream_trading_bots(lambda bot: None))
+
+
+def test_callers_budget_caps_the_request_timeout():
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json=_document())
+
+    client = _client(handler)
+    asyncio.run(client.stream_trading_bots(lambda bot: None, timeout=2.5))
+    asyncio.run(client.get_trading_bots(timeout=120))
+    assert timeouts == [2.5, client.config.timeout]
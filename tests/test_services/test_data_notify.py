@@ -0,0 +1,121 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from src.backend.services.data_notify import (
+    DataChangeListener, PgNotifyPublisher, apply_notifications, change_payload, start_data_change_notifications
+)
+from src.backend.services.data_version import bump_data_version, get_data_version, set_change_publisher
+
+
+@pytest.fixture
+def published():
+    versions = []
+    set_change_publisher(versions.append)
+    yield versions
+    set_change_publisher(None)
+
+
+def test_local_changes_are_published(published):
+    version = bump_data_version()
+    assert published == [version]
+
+
+def test_remote_changes_are_not_republished(published):
+    bump_data_version(publish=False)
+    assert published == []
+
+
+def test_failing_publisher_does_not_fail_the_change():
+    def publisher(version):
+        raise ConnectionError("database gone")
+
+    set_change_publisher(publisher)
+    try:
+        before = get_data_version()
+        assert bump_data_version() == before + 1
+    finally:
+        set_change_publisher(None)
+
+
+def test_only_foreign_notifications_invalidate():
+    before = get_data_version()
+    assert not apply_notifications([change_payload(7), change_payload(8)])
+    assert get_data_version() == before
+
+    foreign = json.dumps({"holder": "other-host:1:abc", "version": 3})
+    assert apply_notifications([foreign, foreign, "not json"])
+    # One bump per batch, however many notifications it held
+    assert get_data_version() == before + 1
+
+
+def test_notifications_need_postgres(test_db_engine):
+    if test_db_engine.dialect.name == "postgresql":
+        pytest.skip("SQLite specific test")
+    assert start_data_change_notifications(test_db_engine) is None
+
+
+def test_unanswered_heartbeat_is_a_lost_connection():
+    released = threading.Event()
+
+    class HalfOpenCursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, query):
+            # A blocking psycopg2 call on a connection whose peer is gone
+            released.wait(5)
+
+    class HalfOpenConnection:
+        def cursor(self):
+            return HalfOpenCursor()
+
+    async def scenario():
+        try:
+            await DataChangeListener(None, ping_timeout=0.05)._ping(HalfOpenConnection())
+        finally:
+            released.set()
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(scenario())
+
+
+@pytest.mark.skipif(
+    not os.getenv("USE_POSTGRES_TEST_DB"),
+    reason="PostgreSQL specific test"
+)
+@pytest.mark.integration
+def test_listener_invalidates_on_notify_from_another_process(test_db_engine):
+    async def scenario():
+        listener = DataChangeListener(test_db_engine, "test_bot_data_changed", heartbeat=0.1)
+        listener.start()
+        try:
+            while not listener.stats.connected:
+                await asyncio.sleep(0.01)
+            before = get_data_version()
+            # Own announcements are ignored...
+            PgNotifyPublisher(test_db_engine, "test_bot_data_changed")(before)
+            # ...those of other processes invalidate
+            with test_db_engine.connect() as connection:
+                connection.execute(text("SELECT pg_notify('test_bot_data_changed', :payload)"),
+                                   {"payload": json.dumps({"holder": "other", "version": 1})})
+                connection.commit()
+            for _ in range(100):
+                if listener.stats.invalidations:
+                    break
+                await asyncio.sleep(0.02)
+            return before, listener.stats
+        finally:
+            await listener.stop()
+
+    before, stats = asyncio.run(scenario())
+    assert stats.notifications == 2
+    assert stats.invalidations == 1
+    assert get_data_version() == before + 1
@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+from aiohttp import web
+
+from src.backend.database import get_session_maker
+from src.backend.models import Bot
+from src.backend.services.bot_cache import get_bot_cache
+from src.backend.services.data_version import get_data_version
+from src.backend.services.price_stream import PriceStreamer, PriceTable, flush_prices, parse_ticker
+from src.backend.services.risk_service import get_risk_engine
+from tests.factories import make_bot
+
+
+def _prices(session):
+    session.expire_all()
+    return {bot.grid_id: (bot.mark_price, bot.current_price) for bot in session.query(Bot)}
+
+
+def test_price_table_merges_deltas_and_drains_changes():
+    table = PriceTable()
+    table.update("BTCUSDT", 100.0, 101.0)
+    table.update("BTCUSDT", last_price=102.0)
+    assert table.drain() == {"BTCUSDT": (100.0, 102.0)}
+    table.update("BTCUSDT", 100.0, 102.0)
+    assert table.drain() == {}
+
+
+def test_parse_ticker_ignores_non_ticker_messages():
+    assert parse_ticker({"op": "subscribe", "success": True}) is None
+    assert parse_ticker({
+        "topic": "tickers.ETHUSDT", "type": "delta", "data": {"symbol": "ETHUSDT", "markPrice": "3000.5"}
+    }) == ("ETHUSDT", 3000.5, None)
+
+
+def test_flush_updates_running_bots_only(test_db_session):
+    test_db_session.add_all([
+        make_bot("g-1"),
+        make_bot("g-2", symbol="ETHUSDT"),
+        make_bot("g-3", status="COMPLETED"),
+    ])
+    test_db_session.commit()
+
+    assert flush_prices(test_db_session, {"BTCUSDT": (51000.0, 51010.0), "SOLUSDT": (1.0, 1.0)}) == 1
+
+    prices = _prices(test_db_session)
+    assert prices["g-1"] == (51000.0, 51010.0)
+    assert prices["g-2"] == (50000.0, 50000.0)
+    assert prices["g-3"] == (50000.0, 50000.0)
+
+
+def test_flush_patches_caches_without_reloading(test_db_session):
+    test_db_session.add_all([make_bot("g-1"), make_bot("g-2", symbol="ETHUSDT"), make_bot("g-3", status="COMPLETED")])
+    test_db_session.commit()
+    cache, risk = get_bot_cache(), get_risk_engine()
+    cache.refresh(test_db_session)
+    risk.get(test_db_session)
+    loads, version = cache.stats.loads, get_data_version()
+
+    flush_prices(test_db_session, {"BTCUSDT": (51000.0, 51010.0)})
+
+    assert get_data_version() == version
+    bots = {bot.grid_id: (bot.mark_price, bot.current_price) for bot in cache.list(test_db_session)}
+    assert bots == {"g-1": (51000.0, 51010.0), "g-2": (50000.0, 50000.0), "g-3": (50000.0, 50000.0)}
+    assert cache.stats.loads == loads
+    prices = dict(zip(risk.get(test_db_session).grid_id, risk.get(test_db_session).current_price))
+    assert prices == {"g-1": 51010.0, "g-2": 50000.0}
+
+
+async def _run_against_local_stream(session_factory):
+    """Serve a Bybit-like ticker stream locally and let the streamer consume it"""
+    subscriptions = []
+
+    async def ticker_ws(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            request_body = json.loads(msg.data)
+            subscriptions.append(request_body)
+            for topic in request_body["args"]:
+                symbol = topic.split(".", 1)[1]
+                await ws.send_json({"topic": topic, "type": "snapshot",
+                                    "data": {"symbol": symbol, "markPrice": "60000", "lastPrice": "60001"}})
+                await ws.send_json({"topic": topic, "type": "delta",
+                                    "data": {"symbol": symbol, "lastPrice": "60002"}})
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/v5/public/linear", ticker_ws)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+
+    streamer = PriceStreamer(f"ws://{host}:{port}/v5/public/linear", session_factory, flush_interval=0.05)
+    streamer.start()
+    try:
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            if streamer.stats.flushed_rows:
+                break
+    finally:
+        await streamer.stop()
+        await runner.cleanup()
+    return streamer, subscriptions
+
+
+def test_streamer_flushes_prices_from_local_websocket(test_db_session):
+    test_db_session.add_all([make_bot("g-1"), make_bot("g-2"), make_bot("g-3", status="COMPLETED", symbol="ETHUSDT")])
+    test_db_session.commit()
+
+    streamer, subscriptions = asyncio.run(_run_against_local_stream(get_session_maker()))
+
+    assert subscriptions == [{"op": "subscribe", "args": ["tickers.BTCUSDT"]}]
+    assert streamer.stats.messages == 2
+    prices = _prices(test_db_session)
+    assert prices["g-1"] == (60000.0, 60002.0)
+    assert prices["g-2"] == (60000.0, 60002.0)
+    assert prices["g-3"] == (50000.0, 50000.0)
@@ -0,0 +1,113 @@
+import asyncio
+import math
+
+import numpy as np
+import pytest
+
+from src.backend.services.bot_service import sync_bots_with_db
+from src.backend.services.risk_service import RiskEngine, compute_fleet_risk, summarize_fleet_risk
+from tests.factories import bybit_bot_payload, bybit_response
+
+
+def _inputs(**columns):
+    size = len(next(iter(columns.values())))
+    defaults = {
+        "grid_id": np.array([f"g-{i}" for i in range(size)], dtype=object),
+        "symbol": np.array(["BTCUSDT"] * size, dtype=object),
+        "leverage": np.full(size, 5.0),
+        "total_investment": np.full(size, 100.0),
+        "current_price": np.full(size, 100.0),
+        "liq_price": np.full(size, 80.0),
+        "min_price": np.full(size, 90.0),
+        "max_price": np.full(size, 110.0),
+        "cell_num": np.full(size, 10.0),
+    }
+    defaults.update({name: np.asarray(values, dtype=defaults[name].dtype) for name, values in columns.items()})
+    return defaults
+
+
+def test_compute_fleet_risk_per_bot_metrics():
+    risk = compute_fleet_risk(_inputs(
+        current_price=[100.0, 95.0, 120.0, 100.0],
+        liq_price=[80.0, 104.5, 60.0, 0.0],
+        min_price=[90.0, 90.0, 90.0, 100.0],
+        max_price=[110.0, 110.0, 110.0, 100.0],
+    ))
+
+    assert np.allclose(risk.liq_distance_pct[:3], [20.0, 10.0, 50.0])
+    assert math.isnan(risk.liq_distance_pct[3])
+    assert np.allclose(risk.grid_position[:3], [0.5, 0.25, 1.5])
+    assert math.isnan(risk.grid_position[3])
+    assert list(risk.grid_cell) == [5, 2, 9, -1]
+    assert list(risk.out_of_range) == [False, False, True, False]
+    assert np.allclose(risk.exposure, 500.0)
+
+
+def test_summarize_fleet_risk_aggregates():
+    risk = compute_fleet_risk(_inputs(
+        symbol=["BTCUSDT", "ETHUSDT", "BTCUSDT"],
+        leverage=[2.0, 10.0, 1.0],
+        total_investment=[100.0, 50.0, 100.0],
+        liq_price=[50.0, 95.0, 0.0],
+    ))
+
+    summary = summarize_fleet_risk(risk, near_liquidation_pct=10.0, top=2)
+
+    assert summary["bot_count"] == 3
+    assert summary["total_exposure"] == 800.0
+    assert summary["effective_leverage"] == 3.2
+    # (50% * 200 + 5% * 500) / 700
+    assert summary["weighted_liq_distance_pct"] == pytest.approx(125 / 7)
+    assert summary["min_liq_distance_pct"] == pytest.approx(5.0)
+    assert summary["near_liquidation_count"] == 1
+    assert [bot["grid_id"] for bot in summary["bots"]] == ["g-1", "g-0"]
+    assert summary["by_symbol"] == [
+        {"symbol": "BTCUSDT", "bot_count": 2, "total_investment": 200.0, "exposure": 300.0},
+        {"symbol": "ETHUSDT", "bot_count": 1, "total_investment": 50.0, "exposure": 500.0},
+    ]
+
+
+def test_compute_fleet_risk_handles_10k_bots():
+    rng = np.random.default_rng(7)
+    size = 10_000
+    price = rng.uniform(1, 100, size)
+    risk = compute_fleet_risk(_inputs(
+        grid_id=[str(i) for i in range(size)],
+        current_price=price,
+        liq_price=price * rng.uniform(0.5, 1.5, size),
+        min_price=price * 0.9,
+        max_price=price * 1.1,
+    ))
+    summary = summarize_fleet_risk(risk, top=10)
+    assert summary["bot_count"] == size
+    assert len(summary["bots"]) == 10
+
+
+def test_risk_engine_recomputes_only_after_sync(test_db_session):
+    engine = RiskEngine()
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1"),
+        bybit_bot_payload("g-2", status="COMPLETED"),
+    )))
+
+    first = engine.get(test_db_session)
+    assert list(first.grid_id) == ["g-1"]
+    assert engine.get(test_db_session) is first
+
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("g-3"))))
+    assert sorted(engine.get(test_db_session).grid_id) == ["g-1", "g-3"]
+
+
+def test_risk_endpoint(client, test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1", current_price="50000", liq_price="45000"),
+        bybit_bot_payload("g-2", current_price="50000", liq_price="49000"),
+    )))
+
+    response = client.get("/bots/risk", params={"near_liquidation_pct": 5})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["bot_count"] == 2
+    assert data["near_liquidation_count"] == 1
+    assert [bot["grid_id"] for bot in data["bots"]] == ["g-2", "g-1"]
+    assert data["bots"][0]["liq_distance_pct"] == pytest.approx(2.0)
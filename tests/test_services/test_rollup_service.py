@@ -0,0 +1,80 @@
+import asyncio
+
+from sqlalchemy import text
+
+from src.backend.models import SymbolRollup
+from src.backend.services.bot_changes import BotChange
+from src.backend.services.bot_service import sync_bots_with_db
+from src.backend.services.rollup_service import apply_bot_changes, rebuild_symbol_rollups
+from tests.factories import bybit_bot_payload, bybit_response
+
+
+def _rollups(session):
+    session.expire_all()
+    return {
+        row.symbol: (row.bot_count, row.running_count, row.total_investment, row.total_pnl, row.apr_sum)
+        for row in session.query(SymbolRollup)
+    }
+
+
+def test_sync_maintains_rollups_incrementally(test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1", total_investment="100", pnl="5", total_apr="10"),
+        bybit_bot_payload("g-2", total_investment="300", pnl="-1", total_apr="20"),
+        bybit_bot_payload("g-3", symbol="ETHUSDT", status="COMPLETED", total_investment="50"),
+    )))
+    assert _rollups(test_db_session) == {
+        "BTCUSDT": (2, 2, 400.0, 4.0, 30.0),
+        "ETHUSDT": (1, 0, 50.0, 10.0, 12.5),
+    }
+
+    # g-1 changes PnL, g-2 moves symbol and stops; ETH is untouched
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1", total_investment="100", pnl="7", total_apr="10"),
+        bybit_bot_payload("g-2", symbol="SOLUSDT", status="COMPLETED", total_investment="300", pnl="-1",
+                          total_apr="20"),
+    )))
+    assert _rollups(test_db_session) == {
+        "BTCUSDT": (1, 1, 100.0, 7.0, 10.0),
+        "ETHUSDT": (1, 0, 50.0, 10.0, 12.5),
+        "SOLUSDT": (1, 0, 300.0, -1.0, 20.0),
+    }
+
+
+def test_deltas_are_added_to_the_stored_row(test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(bybit_bot_payload("g-1"))))
+    assert test_db_session.get(SymbolRollup, "BTCUSDT").bot_count == 1
+    # Another replica adds a bot meanwhile; the row held by this session is stale
+    test_db_session.execute(text("UPDATE symbol_rollups SET bot_count = 5 WHERE symbol = 'BTCUSDT'"))
+
+    new = {"symbol": "BTCUSDT", "status": "RUNNING", "total_investment": 1.0, "pnl": 0.0, "total_apr": 0.0}
+    apply_bot_changes(test_db_session, [BotChange("g-2", None, new)])
+
+    assert _rollups(test_db_session)["BTCUSDT"][0] == 6
+
+
+def test_rebuild_matches_incremental_rollups(test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1", pnl="3"),
+        bybit_bot_payload("g-2", symbol="ETHUSDT"),
+    )))
+    incremental = _rollups(test_db_session)
+    rebuild_symbol_rollups(test_db_session)
+    assert _rollups(test_db_session) == incremental
+
+
+def test_symbols_endpoint(client, test_db_session):
+    asyncio.run(sync_bots_with_db(test_db_session, bybit_response(
+        bybit_bot_payload("g-1", total_apr="10"),
+        bybit_bot_payload("g-2", total_apr="20"),
+    )))
+    response = client.get("/bots/symbols")
+    assert response.status_code == 200
+    assert response.json() == [{
+        "symbol": "BTCUSDT",
+        "bot_count": 2,
+        "running_count": 2,
+        "total_investment": 2000.0,
+        "total_pnl": 20.0,
+        "average_apr": 15.0,
+    }]
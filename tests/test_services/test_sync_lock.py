@@ -0,0 +1,62 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from src.backend.models.sync_lock import SyncLock
+from src.backend.services.sync_lock import advisory_lock_id, get_lock_stats, sync_lock
+
+
+def test_second_holder_is_refused_until_release(test_db_engine):
+    async def scenario():
+        async with sync_lock(test_db_engine, "test:refused") as first:
+            assert first
+            async with sync_lock(test_db_engine, "test:refused") as second:
+                assert not second
+        async with sync_lock(test_db_engine, "test:refused") as third:
+            assert third
+
+    asyncio.run(scenario())
+    stats = get_lock_stats()["test:refused"]
+    assert stats["acquired"] == 2
+    assert stats["contended"] == 1
+
+
+def test_waiter_acquires_after_holder_releases(test_db_engine):
+    async def holder():
+        async with sync_lock(test_db_engine, "test:wait") as acquired:
+            assert acquired
+            await asyncio.sleep(0.3)
+
+    async def waiter():
+        await asyncio.sleep(0.05)
+        async with sync_lock(test_db_engine, "test:wait", wait_timeout=2) as acquired:
+            return acquired
+
+    async def scenario():
+        return await asyncio.gather(holder(), waiter())
+
+    _, acquired = asyncio.run(scenario())
+    assert acquired
+    assert get_lock_stats()["test:wait"]["last_wait_ms"] >= 200
+
+
+def test_expired_lease_is_taken_over(db_connection, test_db_session):
+    now = datetime.now(timezone.utc)
+    test_db_session.add(SyncLock(
+        key="test:expired", holder="crashed-replica",
+        acquired_at=now - timedelta(hours=1), expires_at=now - timedelta(minutes=1)
+    ))
+    test_db_session.commit()
+
+    async def scenario():
+        # The lease is only visible inside the test's transaction
+        async with sync_lock(db_connection, "test:expired") as acquired:
+            return acquired
+
+    assert asyncio.run(scenario())
+    assert test_db_session.query(SyncLock).filter_by(key="test:expired").count() == 0
+
+
+def test_advisory_lock_id_is_stable_bigint():
+    lock_id = advisory_lock_id("bots-sync:default")
+    assert lock_id == advisory_lock_id("bots-sync:default")
+    assert -2 ** 63 <= lock_id < 2 ** 63
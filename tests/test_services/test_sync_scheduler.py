@@ -0,0 +1,93 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.backend.config import BybitAccount, PollTier
+from src.backend.database import get_session_maker
+from src.backend.services import account_sync
+from src.backend.services.sync_jobs import SyncJobWorker
+from src.backend.services.sync_scheduler import SyncScheduler, poll_interval, update_change_rate
+from tests.conftest import TestSettings
+from tests.factories import bybit_bot_payload, bybit_response, paged_client, streaming_client
+
+RUNNING = PollTier(name="running", status=1, min_interval=10, max_interval=100)
+
+
+def test_interval_follows_change_rate():
+    assert poll_interval(RUNNING, 1.0) == 10
+    assert poll_interval(RUNNING, 0.0) == 100
+    assert poll_interval(RUNNING, 0.5) == 55
+
+
+def test_change_rate_is_smoothed():
+    rate = update_change_rate(None, changed=4, fetched=4, smoothing=0.25)
+    assert rate == 1.0
+    rate = update_change_rate(rate, changed=0, fetched=4, smoothing=0.25)
+    assert rate == pytest.approx(0.75)
+    # An empty tier counts as unchanged
+    assert update_change_rate(rate, changed=0, fetched=0, smoothing=0.25) == pytest.approx(0.5625)
+
+
+def test_unchanged_bots_are_polled_less_often(test_db_session):
+    settings = TestSettings(
+        BYBIT_SECURE_TOKEN=None,
+        BYBIT_ACCOUNTS=[BybitAccount(account_id="main", secure_token="token", device_id="device")],
+        SYNC_POLL_SMOOTHING=0.5
+    )
+    client = streaming_client(bybit_response(bybit_bot_payload("g-1"), bybit_bot_payload("g-2")))
+    closed = PollTier(name="closed", status=2, min_interval=10, max_interval=100, once=True)
+    worker = SyncJobWorker(get_session_maker(), settings)
+    scheduler = SyncScheduler(worker, settings, tiers=[RUNNING, closed])
+
+    async def scenario():
+        worker.start()
+        try:
+            running, closed_state = scheduler.tiers
+            await scheduler.poll(running)
+            first = running.interval
+            # Same listing again: nothing but the sync time changed
+            await scheduler.poll(running)
+            await scheduler.poll(closed_state)
+            return first, running, closed_state
+        finally:
+            await worker.stop()
+
+    with patch.object(account_sync, "get_account_client", return_value=client):
+        first, running, closed_state = asyncio.run(scenario())
+
+    assert first == RUNNING.min_interval
+    assert running.change_rate == 0.5
+    assert running.interval == 55
+    assert [call.kwargs["status"] for call in client.stream_trading_bots.call_args_list] == [1, 1, 2]
+    assert closed_state.finished
+    assert scheduler.status()["tiers"][1]["next_run_in"] is None
+
+
+@pytest.mark.parametrize("max_pages, pages_fetched, truncated", [(5, [0, 1], False), (1, [0], True)])
+def test_full_pages_are_followed(test_db_session, max_pages, pages_fetched, truncated):
+    settings = TestSettings(
+        BYBIT_SECURE_TOKEN=None,
+        BYBIT_ACCOUNTS=[BybitAccount(account_id="main", secure_token="token", device_id="device")],
+        SYNC_POLL_MAX_PAGES=max_pages
+    )
+    full_page = [bybit_bot_payload(f"g-{i}") for i in range(150)]
+    client = paged_client(full_page, [bybit_bot_payload("g-last")])
+    worker = SyncJobWorker(get_session_maker(), settings)
+    scheduler = SyncScheduler(worker, settings, tiers=[RUNNING])
+
+    async def scenario():
+        worker.start()
+        try:
+            await scheduler.poll(scheduler.tiers[0])
+        finally:
+            await worker.stop()
+
+    with patch.object(account_sync, "get_account_client", return_value=client):
+        asyncio.run(scenario())
+
+    assert [call.kwargs["page"] for call in client.stream_trading_bots.call_args_list] == pages_fetched
+    tier = scheduler.status()["tiers"][0]
+    assert tier["last_status"] == "success"
+    assert tier["last_pages"] == len(pages_fetched)
+    assert tier["truncated"] is truncated
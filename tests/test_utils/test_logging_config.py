@@ -0,0 +1,91 @@
+import io
+import json
+import logging
+import sys
+
+import pytest
+
+from src.utils.logging_config import (
+    JsonFormatter,
+    LogConfig,
+    LoggingSetup,
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    request_id_var,
+    stop_listener,
+    sync_id_var,
+)
+
+
+@pytest.fixture
+def logging_setup():
+    """Configure the queue-based pipeline and restore the root logger afterwards"""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    setup = LoggingSetup(LogConfig(filename=None, json_format=True, sampling={"noisy": 0.0}))
+    setup.configure()
+    stream = io.StringIO()
+    setup.listener.handlers[0].setStream(stream)
+    yield setup, stream
+    stop_listener()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+def test_root_logger_uses_queue_handler(logging_setup):
+    setup, _ = logging_setup
+    handlers = logging.getLogger().handlers
+    assert any(isinstance(handler, NonBlockingQueueHandler) for handler in handlers)
+    assert not any(isinstance(handler, logging.StreamHandler) for handler in handlers
+                   if handler.__class__.__module__ == "logging")
+    assert setup.listener is not None
+
+
+def test_json_records_carry_request_and_sync_ids(logging_setup):
+    setup, stream = logging_setup
+    request_token = request_id_var.set("req-1")
+    sync_token = sync_id_var.set("sync-1")
+    try:
+        logging.getLogger("app").info("Synced %d bots", 3)
+    finally:
+        sync_id_var.reset(sync_token)
+        request_id_var.reset(request_token)
+    stop_listener()
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    record = next(r for r in records if r["logger"] == "app")
+    assert record["message"] == "Synced 3 bots"
+    assert record["request_id"] == "req-1"
+    assert record["sync_id"] == "sync-1"
+
+
+def test_sampling_drops_debug_records_only(logging_setup):
+    setup, stream = logging_setup
+    logging.getLogger().setLevel(logging.DEBUG)
+    noisy = logging.getLogger("noisy.path")
+    noisy.debug("dropped")
+    noisy.warning("kept")
+    stop_listener()
+
+    messages = [json.loads(line)["message"] for line in stream.getvalue().splitlines()]
+    assert "kept" in messages
+    assert "dropped" not in messages
+
+
+def test_sampling_filter_prefers_longest_prefix():
+    sampling = SamplingFilter({"a": 0.0, "a.b": 1.0})
+    record = logging.LogRecord("a.b.c", logging.DEBUG, __file__, 1, "msg", None, None)
+    assert sampling.filter(record)
+    record.name = "a.x"
+    assert not sampling.filter(record)
+
+
+def test_json_formatter_includes_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("app", logging.ERROR, __file__, 1, "failed", None, None)
+        record.exc_info = sys.exc_info()
+    payload = json.loads(JsonFormatter().format(record))
+    assert payload["message"] == "failed"
+    assert "ValueError: boom" in payload["exception"]